@@ -0,0 +1,276 @@
+# ------------------------------------------------------------------------------------------------------------
+#                            Copyright (C) 2024-2030 Ken-ji de la ROSA, IRAP Toulouse.
+# ------------------------------------------------------------------------------------------------------------
+#                            This file is part of the ATHENA X-IFU DRE Telemetry and Telecommand Firmware.
+#
+#                            dcdc-hk-fw is free software: you can redistribute it and/or modify
+#                            it under the terms of the GNU General Public License as published by
+#                            the Free Software Foundation, either version 3 of the License, or
+#                            (at your option) any later version.
+#
+#                            This program is distributed in the hope that it will be useful,
+#                            but WITHOUT ANY WARRANTY; without even the implied warranty of
+#                            MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#                            GNU General Public License for more details.
+#
+#                            You should have received a copy of the GNU General Public License
+#                            along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------------------------------------
+#    email                   kenji.delarosa@alten.com
+#    @file                   bench_dcdc.py
+# -------------------------------------------------------------------------------------------------------------
+#    Automatic Generation    No
+#    Code Rules Reference    N/A
+# -------------------------------------------------------------------------------------------------------------
+#   @details
+#
+#   Benchmark: measure the register access rate of the Driver/DCDC classes.
+#     . for each backend (simulated board and/or real board) and each verbosity level,
+#       run the benchmarks and measure the total time and the time spent in the device (USB) calls.
+#     . the results are written in JSON.
+#
+# ------------------------------------------------------------------------------------------------------------
+
+# Standard library
+import sys
+from pathlib import Path
+import time
+import argparse
+import os
+import io
+import json
+import platform
+import contextlib
+
+# get the script base path
+script_base_path = str(Path(__file__).parents[0])
+script_name      = str(Path(__file__).stem)
+
+# custom library
+from driver import DCDC
+from test_dcdc_check_tmtc_link import test_wire
+
+# device functions doing a USB transaction (or reading the local wire_out buffer)
+_c_DEV_FUNCTION_LIST = ['SetWireInValue', 'UpdateWireIns', 'UpdateWireOuts', 'GetWireOutValue', 'ActivateTriggerIn']
+# device functions doing a USB transaction
+_c_DEV_TRANSACTION_LIST = ['UpdateWireIns', 'UpdateWireOuts', 'ActivateTriggerIn']
+
+class TimedDevice:
+    """
+       Wrap a device in order to count the device calls and measure the time spent in the device
+    """
+
+    def __init__(self,dev_p):
+        """init the variable
+
+        Args:
+            dev_p (device): device to wrap
+        """
+        self._dev = dev_p
+        self.reset()
+        for name in _c_DEV_FUNCTION_LIST:
+            setattr(self, name, self._wrap(name, getattr(dev_p, name)))
+
+    def __getattr__(self,name_p):
+        return getattr(self._dev, name_p)
+
+    def reset(self):
+        """Reset the counters
+        """
+        self.dev_time = 0.0
+        self.nb_transactions = 0
+
+    def _wrap(self,name_p,func_p):
+        """Build the timed version of a device function
+
+        Args:
+            name_p (str): function name
+            func_p (function): device function
+
+        Returns:
+            function: timed function
+        """
+        is_transaction = name_p in _c_DEV_TRANSACTION_LIST
+        def timed_func(*args):
+            t0 = time.perf_counter()
+            result = func_p(*args)
+            self.dev_time += time.perf_counter() - t0
+            if is_transaction:
+                self.nb_transactions += 1
+            return result
+        return timed_func
+
+
+def bench_set_wire_in(device_p,nb_iterations_p):
+    addr = device_p._addr_wire_in['ERROR_SEL']
+    for i in range(nb_iterations_p):
+        device_p.set_wire_in(addr, i)
+
+def bench_get_wire_out(device_p,nb_iterations_p):
+    addr = device_p._addr_wire_out['FIRMWARE_ID']
+    for i in range(nb_iterations_p):
+        device_p.get_wire_out(addr)
+
+def bench_get_debug_wireout_by_name(device_p,nb_iterations_p):
+    name_list = list(device_p._addr_wire_out.keys())
+    nb_names = len(name_list)
+    for i in range(nb_iterations_p):
+        device_p.get_debug_wireout_by_name(name_list[i % nb_names])
+
+def bench_test_wire(device_p,nb_iterations_p):
+    for i in range(nb_iterations_p):
+        test_wire(device_p)
+
+def bench_adc_acquisition(device_p,nb_iterations_p):
+    for i in range(nb_iterations_p):
+        device_p.set_adc_wait()
+        device_p.get_adc0()
+        device_p.get_adc1()
+        device_p.get_adc2()
+        device_p.get_adc3()
+        device_p.get_adc4()
+        device_p.get_adc5()
+        device_p.get_adc6()
+        device_p.get_adc7()
+
+def bench_adc_acquisition_vectorized(device_p,nb_iterations_p):
+    for i in range(nb_iterations_p):
+        device_p.set_adc_wait()
+        device_p.get_adcs()
+
+# benchmark name -> (function, number of iterations)
+_bench_dict = {}
+_bench_dict['set_wire_in'] = (bench_set_wire_in, 2000)
+_bench_dict['get_wire_out'] = (bench_get_wire_out, 2000)
+_bench_dict['get_debug_wireout_by_name'] = (bench_get_debug_wireout_by_name, 2000)
+_bench_dict['test_wire'] = (bench_test_wire, 100)
+_bench_dict['adc_acquisition'] = (bench_adc_acquisition, 50)
+_bench_dict['adc_acquisition_vectorized'] = (bench_adc_acquisition_vectorized, 50)
+
+
+def run_bench(device_p,bench_name_p,verbosity_p,scale_p,console_p):
+    """Run a benchmark
+
+    Args:
+        device_p (DCDC): opened device. Its dev attribute must be a TimedDevice
+        bench_name_p (str): benchmark name
+        verbosity_p (int): level of verbosity
+        scale_p (float): scale factor applied to the number of iterations
+        console_p (bool): True: keep the console output, False: discard it
+
+    Returns:
+        dict: benchmark result
+    """
+    bench_func, nb_iterations = _bench_dict[bench_name_p]
+    nb_iterations = max(1, int(nb_iterations * scale_p))
+
+    device_p.set_verbosity(verbosity_p)
+    timed_dev = device_p.dev
+    timed_dev.reset()
+
+    if console_p:
+        stdout = contextlib.nullcontext()
+    else:
+        stdout = contextlib.redirect_stdout(io.StringIO())
+
+    with stdout:
+        t0 = time.perf_counter()
+        bench_func(device_p, nb_iterations)
+        total_time = time.perf_counter() - t0
+
+    result = {}
+    result['bench'] = bench_name_p
+    result['verbosity'] = verbosity_p
+    result['nb_iterations'] = nb_iterations
+    result['total_time_s'] = total_time
+    result['iterations_per_s'] = nb_iterations / total_time
+    result['time_per_iteration_us'] = total_time / nb_iterations * 1e6
+    result['dev_time_s'] = timed_dev.dev_time
+    result['python_time_s'] = total_time - timed_dev.dev_time
+    result['nb_transactions'] = timed_dev.nb_transactions
+    result['transactions_per_iteration'] = timed_dev.nb_transactions / nb_iterations
+    return result
+
+
+if __name__ == '__main__':
+
+    ###########################################
+    # parse command line
+    ###########################################
+    # user-defined: default firmware filepath (relative to this script path)
+    default_firmware_filpath = "..\\..\\dcdc-fw_002.bit"
+
+    parser = argparse.ArgumentParser(description='Define command line arguments')
+    # add an optional argument with limited choices
+    parser.add_argument('--firmware_filepath', '-f', default=default_firmware_filpath,
+                        help='The firmware filepath can be absolute or relative to this script path.')
+    parser.add_argument('--backend', '-b', nargs='+', default=['sim'], choices=['ok', 'sim'],
+                        help='Backends to benchmark. ok: Opal Kelly board, sim: simulated board.')
+    parser.add_argument('--sim_latency', type=float, default=0.0,
+                        help='Simulated duration of a USB transaction (expressed in s).')
+    parser.add_argument('--verbosity', '-v', nargs='+', type=int, default=[-1, 0, 1, 2],
+                        help='Levels of verbosity to benchmark.')
+    parser.add_argument('--bench', nargs='+', default=list(_bench_dict.keys()), choices=list(_bench_dict.keys()),
+                        help='Benchmarks to run.')
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help='Scale factor applied to the default number of iterations.')
+    parser.add_argument('--console', action='store_true',
+                        help='Keep the console output of the benchmarks (discarded by default).')
+    parser.add_argument('--output', '-o', default=None,
+                        help='JSON output filepath (default: stdout).')
+
+    args_known = parser. parse_known_args()
+    # get arguments defined in this file.
+    args = args_known[0]
+    # get arguments not defined in this file in order to pass them to the called script.
+    args_unknown = args_known[1]
+
+    ###########################################
+    # User-defined parameters
+    ###########################################
+    # path to the firmware
+    firmware_filepath = args.firmware_filepath
+
+    if os.path.isabs(firmware_filepath):
+        # absolute path
+        firmware_filepath = firmware_filepath
+    else:
+        # compute the absolute path relative to this script path
+        firmware_filepath = str(Path(script_base_path,firmware_filepath).resolve())
+
+    ###########################################
+    # Start script
+    ###########################################
+    report = {}
+    report['script'] = script_name
+    report['date'] = time.strftime("%Y-%m-%dT%H:%M:%S")
+    report['python'] = platform.python_version()
+    report['platform'] = platform.platform()
+    report['results'] = []
+
+    for backend_name in args.backend:
+        if backend_name == 'sim':
+            from driver import SimBackend
+            backend = SimBackend(latency_p=args.sim_latency)
+        else:
+            backend = backend_name
+
+        # Program the FPGA
+        board = DCDC()
+        board.set_verbosity(-1)
+        with contextlib.redirect_stdout(io.StringIO()):
+            board.open(firmware_filepath_p=firmware_filepath, backend_p=backend)
+        board.dev = TimedDevice(board.dev)
+
+        for bench_name in args.bench:
+            for verbosity in args.verbosity:
+                result = run_bench(board, bench_name, verbosity, args.scale, args.console)
+                result['backend'] = backend_name
+                report['results'].append(result)
+
+    str_report = json.dumps(report, indent=2)
+    if args.output is None:
+        print(str_report)
+    else:
+        with open(args.output, 'w') as file:
+            file.write(str_report)
@@ -0,0 +1,106 @@
+# ------------------------------------------------------------------------------------------------------------
+#                            Copyright (C) 2024-2030 Ken-ji de la ROSA, IRAP Toulouse.
+# ------------------------------------------------------------------------------------------------------------
+#                            This file is part of the ATHENA X-IFU DRE Telemetry and Telecommand Firmware.
+#
+#                            dcdc-hk-fw is free software: you can redistribute it and/or modify
+#                            it under the terms of the GNU General Public License as published by
+#                            the Free Software Foundation, either version 3 of the License, or
+#                            (at your option) any later version.
+#
+#                            This program is distributed in the hope that it will be useful,
+#                            but WITHOUT ANY WARRANTY; without even the implied warranty of
+#                            MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#                            GNU General Public License for more details.
+#
+#                            You should have received a copy of the GNU General Public License
+#                            along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------------------------------------
+#    email                   kenji.delarosa@alten.com
+#    @file                   dcdc_register_server.py
+# -------------------------------------------------------------------------------------------------------------
+#    Automatic Generation    No
+#    Code Rules Reference    N/A
+# -------------------------------------------------------------------------------------------------------------
+#   @details
+#
+#   Share one DCDC board between several processes (clients: --backend remote)
+#
+# ------------------------------------------------------------------------------------------------------------
+
+# Standard library
+import sys
+from pathlib import Path
+import time
+import argparse
+import os
+
+# get the script base path
+script_base_path = str(Path(__file__).parents[0])
+script_name      = str(Path(__file__).stem)
+
+# custom library
+from driver import DCDC,RegisterServer
+from driver.register_server import c_DEFAULT_PORT
+
+
+if __name__ == '__main__':
+
+    ###########################################
+    # parse command line
+    ###########################################
+    # user-defined: default firmware filepath (relative to this script path)
+    default_firmware_filpath = "..\\..\\dcdc-fw_002.bit"
+
+    parser = argparse.ArgumentParser(description='Define command line arguments')
+    # add an optional argument with limited choices
+    parser.add_argument('--firmware_filepath', '-f', default=default_firmware_filpath,
+                        help='The firmware filepath can be absolute or relative to this script path.')
+    parser.add_argument('--backend', '-b', default='ok', choices=['ok', 'sim'],
+                        help='ok: Opal Kelly board, sim: simulated board (no hardware needed).')
+    parser.add_argument('--force-configure', action='store_true',
+                        help='Always load the firmware (by default, skipped if the board already runs it).')
+    parser.add_argument('--port', type=int, default=c_DEFAULT_PORT,
+                        help='TCP port (localhost only).')
+    parser.add_argument('--unix_path', default=None,
+                        help='Listen on this Unix socket instead of the TCP port.')
+
+    args_known = parser. parse_known_args()
+    # get arguments defined in this file.
+    args = args_known[0]
+    # get arguments not defined in this file in order to pass them to the called script.
+    args_unknown = args_known[1]
+
+    ###########################################
+    # User-defined parameters
+    ###########################################
+    # path to the firmware
+    firmware_filepath = args.firmware_filepath
+
+    if os.path.isabs(firmware_filepath):
+        # absolute path
+        firmware_filepath = firmware_filepath
+    else:
+        # compute the absolute path relative to this script path
+        firmware_filepath = str(Path(script_base_path,firmware_filepath).resolve())
+
+    ###########################################
+    # Start script
+    ###########################################
+
+    # Program the FPGA
+    board = DCDC()
+    board.open(firmware_filepath_p=firmware_filepath, backend_p=args.backend, force_configure_p=args.force_configure)
+
+    # no print by register access
+    board.set_verbosity(-1)
+
+    msg = "Register server: " + script_name
+    board.display_title(msg)
+    board.flush()
+
+    server = RegisterServer(board, port_p=args.port, unix_path_p=args.unix_path)
+    server.serve_forever()
+
+    msg = "served requests: " + str(server.nb_requests) + ", UpdateWireOuts: " + str(server.nb_wire_out_updates)
+    board.display(msg)
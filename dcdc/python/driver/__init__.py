@@ -35,6 +35,61 @@
 
 # deprecated to keep older scripts who import this from breaking
 from .utils_tools import *
-from .driver import Driver
-from .dcdc import DCDC
 
+# the other modules are imported on first use (see __getattr__):
+#   . the vendor FrontPanel library (ok) is only loaded when a board is opened
+#   . the numpy based modules are not loaded by the tools which only need utils_tools
+_lazy_attr_dict = {
+    'Driver':            '.driver',
+    'WireOutSnapshot':   '.snapshot',
+    'SimBackend':        '.sim',
+    'SimDevice':         '.sim',
+    'RegisterMap':       '.regmap',
+    'load_register_map': '.regmap',
+    'parse_mem_file':    '.mem_file',
+    'load_mem_file':     '.mem_file',
+    'DCDC':              '.dcdc',
+    'DeviceManager':     '.device_manager',
+    'AsyncDCDC':         '.async_dcdc',
+    'HK_DTYPE':          '.hk_recorder',
+    'HkRecorder':        '.hk_recorder',
+    'load_hk_file':      '.hk_recorder',
+    'PowerRails':        '.power_rails',
+    'load_power_rails':  '.power_rails',
+    'run_power_sweep':   '.power_rails',
+    'PowerSequencer':    '.power_sequencer',
+    'load_session_log':  '.session_log',
+    'replay_session':    '.session_log',
+    'RegisterServer':    '.register_server',
+    'RemoteBackend':     '.register_server',
+    'add_backend_arguments': '.script_tools',
+    'make_backend':          '.script_tools',
+    'open_board':            '.script_tools',
+    'close_board':           '.script_tools',
+    'extract_field_array':           '.array_tools',
+    'extract_fields_array':          '.array_tools',
+    'convert_uint_to_int_array':     '.array_tools',
+    'convert_int_to_uint_array':     '.array_tools',
+    'convert_uint_to_str_hex_array': '.array_tools',
+    'convert_uint_to_ascii_array':   '.array_tools',
+    'RunningStats':                  '.array_tools',
+}
+
+# exported names of "from driver import *": the utils_tools names and the lazily loaded names
+# (a star import loads all the lazy modules)
+import types as _types
+__all__ = [name for name, value in globals().items() if not (name.startswith('_') or isinstance(value, _types.ModuleType))]
+__all__ += list(_lazy_attr_dict.keys())
+
+def __getattr__(name):
+    module_name = _lazy_attr_dict.get(name)
+    if module_name is None:
+        raise AttributeError("module " + repr(__name__) + " has no attribute " + repr(name))
+    import importlib
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # next accesses: no __getattr__ call
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(list(globals().keys()) + list(_lazy_attr_dict.keys()))
@@ -0,0 +1,230 @@
+# ------------------------------------------------------------------------------------------------------------
+#                            Copyright (C) 2024-2030 Ken-ji de la ROSA, IRAP Toulouse.
+# ------------------------------------------------------------------------------------------------------------
+#                            This file is part of the ATHENA X-IFU DRE Telemetry and Telecommand Firmware.
+#
+#                            dcdc-hk-fw is free software: you can redistribute it and/or modify
+#                            it under the terms of the GNU General Public License as published by
+#                            the Free Software Foundation, either version 3 of the License, or
+#                            (at your option) any later version.
+#
+#                            This program is distributed in the hope that it will be useful,
+#                            but WITHOUT ANY WARRANTY; without even the implied warranty of
+#                            MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#                            GNU General Public License for more details.
+#
+#                            You should have received a copy of the GNU General Public License
+#                            along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------------------------------------
+#    email                   kenji.delarosa@alten.com
+#    @file                   array_tools.py
+# -------------------------------------------------------------------------------------------------------------
+#    Automatic Generation    No
+#    Code Rules Reference    N/A
+# -------------------------------------------------------------------------------------------------------------
+#   @details
+#
+#   NumPy (vectorized) versions of the utils_tools conversion functions.
+#   They process whole arrays of register words (ex: recorded housekeeping, captured ADC samples).
+#   For each value, the result is the one of the scalar function. A value which doesn't fit in the
+#   given width raises a ValueError (the scalar functions would return a longer/unmasked result).
+#   Streaming statistics (RunningStats) of the oversampled acquisitions.
+#   This module is kept apart from utils_tools: the tools which only need Display don't load numpy.
+#
+# ------------------------------------------------------------------------------------------------------------
+
+# numpy
+import numpy as np
+
+# hexadecimal character of each nibble value
+_c_HEX_LUT = np.frombuffer(b'0123456789abcdef', dtype=np.uint8)
+
+def extract_field_array(data_p,pos_p,width_p):
+    """Extract a bit field from register words
+
+    Args:
+        data_p (array_like of uint): register words
+        pos_p (uint): index low of the position of the bit field (start from @0)
+        width_p (uint): bit field width (expressed in bits: start@1)
+
+    Returns:
+        np.ndarray of uint64: bit field values (same shape as data_p)
+    """
+    data = np.asarray(data_p).astype(np.uint64, copy=False)
+    mask = np.uint64((1 << width_p) - 1)
+    return (data >> np.uint64(pos_p)) & mask
+
+def extract_fields_array(data_p,field_list_p):
+    """Extract several bit fields from register words (ex: Register.field_list of the register map)
+
+    Args:
+        data_p (array_like of uint): register words
+        field_list_p (list): bit fields (objects with the name, pos and width attributes)
+
+    Returns:
+        dict: field name -> np.ndarray of uint64 (same shape as data_p)
+    """
+    data = np.asarray(data_p).astype(np.uint64, copy=False)
+    return {field.name: extract_field_array(data, field.pos, field.width) for field in field_list_p}
+
+def _convert_to_uint64(data_p,width_p,signed_p,func_name_p):
+    """Convert integer values into their two's complement representation on width_p bits
+
+    Args:
+        data_p (array_like of int): integer values
+        width_p (uint): value width (expressed in bits: start@1). Maximum: 64
+        signed_p (bool): True: the values can be signed ([-2**(width_p-1), 2**width_p[), False: [0, 2**width_p[
+        func_name_p (str): caller name (for the error message)
+
+    Returns:
+        np.ndarray of uint64: values masked to width_p bits (same shape as data_p)
+
+    Raises:
+        ValueError: invalid width, non-integer values or values which don't fit in width_p bits
+    """
+    prefix = "[array_tools." + func_name_p + "]: "
+    if (width_p < 1) or (width_p > 64):
+        raise ValueError(prefix + "the width (" + str(width_p) + " bits) must be in [1, 64]")
+    data = np.asarray(data_p)
+    if data.dtype.kind not in 'biu':
+        raise ValueError(prefix + "the values must be integers (dtype: " + str(data.dtype) + ")")
+    if data.size > 0:
+        value_min = int(data.min())
+        value_max = int(data.max())
+        if signed_p:
+            low = -(1 << (width_p - 1))
+        else:
+            low = 0
+        if (value_min < low) or (value_max >= (1 << width_p)):
+            raise ValueError(prefix + "the values must be in [" + str(low) + ", 2**" + str(width_p) + "[ (min: " + str(value_min) + ", max: " + str(value_max) + ")")
+    return data.astype(np.uint64) & np.uint64((1 << width_p) - 1)
+
+def convert_uint_to_int_array(data_p,width_p):
+    """Convert unsigned integer values into signed integer values (two's complement sign extension)
+
+    Args:
+        data_p (array_like of uint): unsigned integer values to convert (in [0, 2**width_p[)
+        width_p (uint): value width (expressed in bits: start@1). Maximum: 64
+
+    Returns:
+        np.ndarray of int64: converted values (same shape as data_p)
+
+    Raises:
+        ValueError: invalid width or values out of range
+    """
+    data = _convert_to_uint64(data_p, width_p, False, "convert_uint_to_int_array")
+    if width_p == 64:
+        return data.view(np.int64)
+    sign = np.int64(1 << (width_p - 1))
+    return (data.astype(np.int64) ^ sign) - sign
+
+def convert_int_to_uint_array(data_p,width_p):
+    """Convert signed integer values into unsigned integer values (two's complement masking)
+
+    Args:
+        data_p (array_like of int): signed integer values to convert (in [-2**(width_p-1), 2**width_p[)
+        width_p (uint): value width (expressed in bits: start@1). Maximum: 64
+
+    Returns:
+        np.ndarray of uint64: converted values (same shape as data_p)
+
+    Raises:
+        ValueError: invalid width or values out of range
+    """
+    return _convert_to_uint64(data_p, width_p, True, "convert_int_to_uint_array")
+
+def convert_uint_to_str_hex_array(data_p,width_p):
+    """Convert unsigned integer values into hexadecimal strings
+
+    Args:
+        data_p (array_like of uint): unsigned integer values to convert (in [0, 2**width_p[)
+        width_p (uint): value width (expressed in bits: start@1). Maximum: 64
+
+    Returns:
+        np.ndarray of str: hexadecimal strings (same shape as data_p)
+
+    Raises:
+        ValueError: invalid width or values out of range
+    """
+    data = _convert_to_uint64(data_p, width_p, False, "convert_uint_to_str_hex_array")
+    nb_hex_char = (width_p + 3) // 4
+    shifts = np.arange(4*(nb_hex_char - 1), -1, -4, dtype=np.uint64)
+    nibbles = (data[..., np.newaxis] >> shifts) & np.uint64(0xF)
+    chars = np.ascontiguousarray(_c_HEX_LUT[nibbles])
+    return chars.view('S' + str(nb_hex_char)).reshape(data.shape).astype('U' + str(nb_hex_char))
+
+def convert_uint_to_ascii_array(data_p,width_p):
+    """Convert unsigned integer values into ASCII strings (the most significant byte first)
+    Note:
+      . as the scalar function, each string has one character by byte (the NUL characters are kept).
+        The NumPy str dtype would remove the trailing NUL characters: the strings are python str objects
+
+    Args:
+        data_p (array_like of uint): unsigned integer values to convert (in [0, 2**(8*nb_bytes)[)
+        width_p (uint): value width (expressed in bits: start@1). Maximum: 64
+
+    Returns:
+        np.ndarray of object (str): ASCII strings (same shape as data_p)
+
+    Raises:
+        ValueError: invalid width or values out of range
+    """
+    nb_bytes = (width_p + 7) // 8
+    data = _convert_to_uint64(data_p, 8*nb_bytes, False, "convert_uint_to_ascii_array")
+    shifts = np.arange(8*(nb_bytes - 1), -1, -8, dtype=np.uint64)
+    chars = ((data[..., np.newaxis] >> shifts) & np.uint64(0xFF)).astype(np.uint8)
+    text = chars.tobytes().decode('latin-1')
+    result = np.empty(data.size, dtype=object)
+    result[:] = [text[i:i + nb_bytes] for i in range(0, len(text), nb_bytes)]
+    return result.reshape(data.shape)
+
+class RunningStats:
+    """
+       Streaming statistics of vectors (Welford's algorithm): mean, standard deviation, min and max
+       by component with O(1) memory
+    """
+
+    def __init__(self,shape_p):
+        """init the variable
+
+        Args:
+            shape_p (tuple or uint): shape of one sample (ex: 8 for the 8 ADC channels)
+        """
+        self.count = 0
+        self.mean = np.zeros(shape_p, dtype=np.float64)
+        # sum of the squared differences from the mean
+        self._m2 = np.zeros(shape_p, dtype=np.float64)
+        self.min = np.full(shape_p, np.inf)
+        self.max = np.full(shape_p, -np.inf)
+
+    def update(self,sample_p):
+        """Add a sample
+
+        Args:
+            sample_p (array_like): sample (shape: shape_p)
+        """
+        sample = np.asarray(sample_p, dtype=np.float64)
+        self.count += 1
+        delta = sample - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (sample - self.mean)
+        np.minimum(self.min, sample, out=self.min)
+        np.maximum(self.max, sample, out=self.max)
+
+    @property
+    def std(self):
+        """
+          Sample standard deviation (0 with less than 2 samples)
+        """
+        if self.count < 2:
+            return np.zeros_like(self.mean)
+        return np.sqrt(self._m2 / (self.count - 1))
+
+    @property
+    def stderr(self):
+        """
+          Standard error of the mean (uncertainty of the mean)
+        """
+        if self.count < 2:
+            return np.zeros_like(self.mean)
+        return self.std / np.sqrt(self.count)
@@ -0,0 +1,197 @@
+# ------------------------------------------------------------------------------------------------------------
+#                            Copyright (C) 2024-2030 Ken-ji de la ROSA, IRAP Toulouse.
+# ------------------------------------------------------------------------------------------------------------
+#                            This file is part of the ATHENA X-IFU DRE Telemetry and Telecommand Firmware.
+#
+#                            dcdc-hk-fw is free software: you can redistribute it and/or modify
+#                            it under the terms of the GNU General Public License as published by
+#                            the Free Software Foundation, either version 3 of the License, or
+#                            (at your option) any later version.
+#
+#                            This program is distributed in the hope that it will be useful,
+#                            but WITHOUT ANY WARRANTY; without even the implied warranty of
+#                            MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#                            GNU General Public License for more details.
+#
+#                            You should have received a copy of the GNU General Public License
+#                            along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------------------------------------
+#    email                   kenji.delarosa@alten.com
+#    @file                   async_dcdc.py
+# -------------------------------------------------------------------------------------------------------------
+#    Automatic Generation    No
+#    Code Rules Reference    N/A
+# -------------------------------------------------------------------------------------------------------------
+#   @details
+#
+#   asyncio front-end of the DCDC class.
+#   All the FrontPanel transactions are serialized on one dedicated I/O thread:
+#   an event loop can run the housekeeping polling, the power commands and the operator
+#   interface concurrently without sharing the device handle between threads.
+#
+# ------------------------------------------------------------------------------------------------------------
+
+# standard library
+import asyncio
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .utils_tools import convert_uint_to_str_hex
+from .dcdc import DCDC
+
+class AsyncDCDC:
+    """
+       Awaitable wrapper of a DCDC instance
+    """
+
+    def __init__(self,dcdc_p=None):
+        """init the variable
+
+        Args:
+            dcdc_p (DCDC): instance to wrap (default: a new DCDC instance)
+        """
+        if dcdc_p is None:
+            dcdc_p = DCDC()
+        self.dcdc = dcdc_p
+
+        # only one thread accesses to the device
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dcdc-io")
+
+        # polling delays of wait_until_ready (expressed in s)
+        self._c_POLL_DELAY_MIN = self.dcdc._c_POLL_DELAY_MIN
+        self._c_POLL_DELAY_MAX = self.dcdc._c_POLL_DELAY_MAX
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self,exc_type,exc_value,traceback):
+        # wait for the pending transactions without blocking the event loop
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.close)
+
+    def close(self):
+        """
+          Stop the I/O thread (after the pending transactions)
+        """
+        self._executor.shutdown(wait=True)
+
+    async def call(self,func_name_p,*args,**kwargs):
+        """Execute a DCDC method on the I/O thread
+
+        Args:
+            func_name_p (str): name of the DCDC method (ex: 'get_adcs')
+            *args: positional arguments of the method
+            **kwargs: keyword arguments of the method
+
+        Returns:
+            the returned value of the method
+        """
+        func = functools.partial(getattr(self.dcdc, func_name_p), *args, **kwargs)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func)
+
+    async def open(self,firmware_filepath_p,**kwargs):
+        """Open and configure the board (see Driver.open)
+
+        Args:
+            firmware_filepath_p (file): path to the FPGA bitstream (firmware file)
+            **kwargs: other arguments of Driver.open (backend_p, force_configure_p, serial_p)
+        """
+        return await self.call('open', firmware_filepath_p, **kwargs)
+
+    async def set_power(self,dmx0_power_on_off_p,dmx1_power_on_off_p,ras_power_on_off_p,wfee_power_on_off_p):
+        """Configure the power and trig the power FSM (see DCDC.set_power)
+
+        Args:
+            dmx0_power_on_off_p (uint32_t): dmx0 power (1: on, 0: off)
+            dmx1_power_on_off_p (uint32_t): dmx1 power (1: on, 0: off)
+            ras_power_on_off_p (uint32_t): ras power (1: on, 0: off)
+            wfee_power_on_off_p (uint32_t): wfee power (1: on, 0: off)
+        """
+        return await self.call('set_power', dmx0_power_on_off_p, dmx1_power_on_off_p, ras_power_on_off_p, wfee_power_on_off_p)
+
+    async def set_adc(self):
+        """
+          Trig the ADC acquisition (see DCDC.set_adc)
+        """
+        return await self.call('set_adc')
+
+    async def read_snapshot(self):
+        """Read all the wire-out registers (see DCDC.read_snapshot)
+
+        Returns:
+            WireOutSnapshot: read values
+        """
+        return await self.call('read_snapshot')
+
+    async def get_adcs(self,data_p=None):
+        """Read the ADC channels (see DCDC.get_adcs)
+
+        Returns:
+            tuple (np.ndarray, np.ndarray): ADC codes, ADC voltages (expressed in V)
+        """
+        return await self.call('get_adcs', data_p)
+
+    async def wait_until_ready(self,bits_p,timeout_p=1.0):
+        """Poll the POWER_ADC_STATUS register until all the selected ready bits are set.
+        Note:
+          . the I/O thread is released between 2 readings: other transactions can be interleaved
+          . the delay between 2 readings starts small and is doubled after each reading (adaptive back-off)
+
+        Args:
+            bits_p (str, list of str or uint32_t): 'power_ready', 'adc_ready', a list of them or a bit mask
+            timeout_p (float): maximal waiting time (expressed in s)
+
+        Returns:
+            float: waiting time (expressed in s). -1 if the timeout is reached
+        """
+        mask = self.dcdc._get_ready_mask(bits_p)
+        addr = self.dcdc._addr_wire_out['POWER_ADC_STATUS']
+        delay = self._c_POLL_DELAY_MIN
+        t0 = time.perf_counter()
+        deadline = t0 + timeout_p
+        while True:
+            data = await self.call('get_wire_out', addr)
+            now = time.perf_counter()
+            if (data & mask) == mask:
+                return now - t0
+            if now >= deadline:
+                msg = "[KO]: [async_dcdc.wait_until_ready]: timeout (POWER_ADC_STATUS: 0x" + convert_uint_to_str_hex(data, self.dcdc._c_REG_DATA_WIDTH) + ")"
+                # the display (sink) is only accessed from the I/O thread
+                await self.call('display', msg, self.dcdc.level)
+                return -1
+            await asyncio.sleep(min(delay, deadline - now))
+            delay = min(2 * delay, self._c_POLL_DELAY_MAX)
+
+    async def set_power_wait(self,dmx0_power_on_off_p,dmx1_power_on_off_p,ras_power_on_off_p,wfee_power_on_off_p,timeout_p=1.0):
+        """Configure the power, trig the power FSM and wait the end of the power sequence (see DCDC.set_power_wait)
+        Note:
+          . the I/O thread is busy until the end of the power sequence: use set_power then wait_until_ready
+            to interleave other transactions
+
+        Args:
+            dmx0_power_on_off_p (uint32_t): dmx0 power (1: on, 0: off)
+            dmx1_power_on_off_p (uint32_t): dmx1 power (1: on, 0: off)
+            ras_power_on_off_p (uint32_t): ras power (1: on, 0: off)
+            wfee_power_on_off_p (uint32_t): wfee power (1: on, 0: off)
+            timeout_p (float): maximal waiting time (expressed in s)
+
+        Returns:
+            float: completion latency from the trigger (expressed in s). -1 if the timeout is reached
+        """
+        return await self.call('set_power_wait', dmx0_power_on_off_p, dmx1_power_on_off_p, ras_power_on_off_p, wfee_power_on_off_p, timeout_p=timeout_p)
+
+    async def set_adc_wait(self,timeout_p=1.0):
+        """Trig the ADC acquisition and wait the end of the acquisition (see DCDC.set_adc_wait)
+        Note:
+          . the I/O thread is busy until the end of the acquisition: use set_adc then wait_until_ready
+            to interleave other transactions
+
+        Args:
+            timeout_p (float): maximal waiting time (expressed in s)
+
+        Returns:
+            float: completion latency from the trigger (expressed in s). -1 if the timeout is reached
+        """
+        return await self.call('set_adc_wait', timeout_p=timeout_p)
@@ -0,0 +1,118 @@
+# ------------------------------------------------------------------------------------------------------------
+#                            Copyright (C) 2024-2030 Ken-ji de la ROSA, IRAP Toulouse.
+# ------------------------------------------------------------------------------------------------------------
+#                            This file is part of the ATHENA X-IFU DRE Telemetry and Telecommand Firmware.
+#
+#                            dcdc-hk-fw is free software: you can redistribute it and/or modify
+#                            it under the terms of the GNU General Public License as published by
+#                            the Free Software Foundation, either version 3 of the License, or
+#                            (at your option) any later version.
+#
+#                            This program is distributed in the hope that it will be useful,
+#                            but WITHOUT ANY WARRANTY; without even the implied warranty of
+#                            MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#                            GNU General Public License for more details.
+#
+#                            You should have received a copy of the GNU General Public License
+#                            along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------------------------------------
+#    email                   kenji.delarosa@alten.com
+#    @file                   backend.py
+# -------------------------------------------------------------------------------------------------------------
+#    Automatic Generation    No
+#    Code Rules Reference    N/A
+# -------------------------------------------------------------------------------------------------------------
+#   @details
+#
+#   Select the device backend used by the Driver class:
+#     . 'ok': Opal Kelly FrontPanel board (USB)
+#     . 'sim': pure-Python simulated DCDC board (see sim.py)
+#     . 'remote': board shared by a RegisterServer on localhost (see register_server.py)
+#   The vendor FrontPanel library (ok module) is only loaded when an 'ok' backend is created.
+#
+# ------------------------------------------------------------------------------------------------------------
+
+from .sim import SimBackend
+from .register_server import RemoteBackend
+
+def _import_ok():
+    """Load the vendor FrontPanel library
+
+    Returns:
+        module: ok module
+    """
+    from .ok import ok
+    return ok
+
+class OkBackend:
+    """
+       Open the Opal Kelly FrontPanel devices (USB)
+    """
+
+    name = 'ok'
+    # the client loads the firmware (see Driver.open)
+    can_configure = True
+    # the pipes are available (see Driver.write_pipe)
+    can_pipe = True
+
+    def __init__(self):
+        """init the variable
+        """
+        # the vendor library is loaded here (not at the package import)
+        self._ok = _import_ok()
+
+    def list_serials(self):
+        """List the serial numbers of the connected FrontPanel devices
+
+        Returns:
+            list of str: serial numbers
+        """
+        devices = self._ok.FrontPanelDevices()
+        return [devices.GetSerial(i) for i in range(devices.GetCount())]
+
+    def open_device(self,serial_p=None):
+        """Open a FrontPanel device
+
+        Args:
+            serial_p (str): serial number of the device (None: first device found)
+
+        Returns:
+            ok.okCFrontPanel: opened device (None if no device can be opened)
+        """
+        if serial_p is None:
+            return self._ok.FrontPanelDevices().Open()
+        return self._ok.FrontPanelDevices().Open(serial_p)
+
+    def new_device_info(self):
+        """Create an empty device information structure
+
+        Returns:
+            ok.okTDeviceInfo: device information structure
+        """
+        return self._ok.okTDeviceInfo()
+
+
+# available backends (by name)
+_backend_dict = {}
+_backend_dict['ok'] = OkBackend
+_backend_dict['sim'] = SimBackend
+_backend_dict['remote'] = RemoteBackend
+
+def get_backend(backend_p=None):
+    """Get a backend instance
+
+    Args:
+        backend_p (str or backend instance): 'ok' (default), 'sim', 'remote' or an already built backend
+            (any object with the list_serials, open_device and new_device_info functions and the can_configure/can_pipe attributes)
+
+    Returns:
+        backend instance
+    """
+    if backend_p is None:
+        backend_p = 'ok'
+    if isinstance(backend_p, str):
+        backend_class = _backend_dict.get(backend_p)
+        if backend_class is None:
+            raise ValueError("unknown backend: " + backend_p + " (available: " + ", ".join(_backend_dict.keys()) + ")")
+        return backend_class()
+    return backend_p
@@ -29,15 +29,16 @@
 # ------------------------------------------------------------------------------------------------------------
 
 # standard library
-import sys
-from pathlib import Path
 import time
 
-# compute the script path
-script_base_path = str(Path(__file__).parents[0])
-sys.path.append(script_base_path)
+# third party library
+import numpy as np
 
-from driver import Driver, convert_uint_to_ascii, convert_uint_to_str_hex
+from .driver import Driver
+from .utils_tools import convert_uint_to_ascii, convert_uint_to_str_hex
+from .snapshot import WireOutSnapshot
+from .regmap import load_register_map
+from .array_tools import RunningStats
 
 class DCDC(Driver):
     """Provide functions (write/read) in order to access to all DCDC registers.
@@ -46,6 +47,9 @@ class DCDC(Driver):
         Driver (class): provide low level function to access to the register (write/read).
     """
 
+    # register map file (see regmap.py)
+    _c_REGMAP_FILENAME = 'dcdc_regmap.json'
+
     def __init__(self):
         """Define the available register addresses for:
                 . wire_in
@@ -54,86 +58,53 @@ class DCDC(Driver):
         # init the parent class
         super().__init__()
 
-        # list all wire_in addresses
+        # register map (addresses, bit fields)
         #################################################
-        self._addr_wire_in = {}
-        self._addr_wire_in['CTRL'] = 0x00
-        self._addr_wire_in['POWER_CONF'] = 0x01
-        # self._addr_wire_in['RFU'] = 0x02
-        # self._addr_wire_in['RFU'] = 0x03
-        # self._addr_wire_in['RFU'] = 0x04
-        # self._addr_wire_in['POWER_ADC_STATUS'] = 0x05
-        # self._addr_wire_in['RFU'] = 0x06
-        # self._addr_wire_in['RFU'] = 0x07
-        # self._addr_wire_in['RFU'] = 0x08
-        # self._addr_wire_in['RFU'] = 0x09
-        # self._addr_wire_in['RFU'] = 0x0A
-        # self._addr_wire_in['RFU'] = 0x0B
-        # self._addr_wire_in['RFU'] = 0x0C
-        # self._addr_wire_in['RFU'] = 0x0D
-        # self._addr_wire_in['RFU'] = 0x0E
-        # self._addr_wire_in['RFU'] = 0x0F
-        # self._addr_wire_in['ADC0'] = 0x10
-        # self._addr_wire_in['ADC1'] = 0x11
-        # self._addr_wire_in['ADC2'] = 0x12
-        # self._addr_wire_in['ADC3'] = 0x13
-        # self._addr_wire_in['ADC4'] = 0x14
-        # self._addr_wire_in['ADC5'] = 0x15
-        # self._addr_wire_in['ADC6'] = 0x16
-        # self._addr_wire_in['ADC7'] = 0x17
-        self._addr_wire_in['DEBUG_CTRL'] = 0x18
-        self._addr_wire_in['ERROR_SEL'] = 0x19
-        # self._addr_wire_in['ERRORS'] = 0x1A
-        # self._addr_wire_in['STATUS'] = 0x1B
-        # self._addr_wire_in['RFU'] = 0x1C
-        # self._addr_wire_in['HARDWARE_ID'] = 0x1D
-        # self._addr_wire_in['FIRMWARE_NAME'] = 0x1E
-        # self._addr_wire_in['FIRMWARE_ID'] = 0x1F
+        self._regmap = load_register_map(self._c_REGMAP_FILENAME)
 
+        # list all wire_in addresses
+        self._addr_wire_in = dict(self._regmap.addr_wire_in)
         # list all wire_out addresses
-        #################################################
-        self._addr_wire_out = {}
-        self._addr_wire_out['CTRL'] = 0x20
-        self._addr_wire_out['POWER_CONF'] = 0x21
-        # self._addr_wire_out['RFU'] = 0x22
-        # self._addr_wire_out['RFU'] = 0x23
-        # self._addr_wire_out['RFU'] = 0x24
-        self._addr_wire_out['POWER_ADC_STATUS'] = 0x25
-        # self._addr_wire_out['RFU'] = 0x26
-        # self._addr_wire_out['RFU'] = 0x27
-        # self._addr_wire_out['RFU'] = 0x28
-        # self._addr_wire_out['RFU'] = 0x29
-        # self._addr_wire_out['RFU'] = 0x2A
-        # self._addr_wire_out['RFU'] = 0x2B
-        # self._addr_wire_out['RFU'] = 0x2C
-        # self._addr_wire_out['RFU'] = 0x2D
-        # self._addr_wire_out['RFU'] = 0x2E
-        # self._addr_wire_out['RFU'] = 0x2F
-        self._addr_wire_out['ADC0'] = 0x30
-        self._addr_wire_out['ADC1'] = 0x31
-        self._addr_wire_out['ADC2'] = 0x32
-        self._addr_wire_out['ADC3'] = 0x33
-        self._addr_wire_out['ADC4'] = 0x34
-        self._addr_wire_out['ADC5'] = 0x35
-        self._addr_wire_out['ADC6'] = 0x36
-        self._addr_wire_out['ADC7'] = 0x37
-        self._addr_wire_out['DEBUG_CTRL'] = 0x38
-        self._addr_wire_out['ERROR_SEL'] = 0x39
-        self._addr_wire_out['ERRORS'] = 0x3A
-        self._addr_wire_out['STATUS'] = 0x3B
-        # self._addr_wire_out['RFU'] = 0x3C
-        self._addr_wire_out['HARDWARE_ID'] = 0x3D
-        self._addr_wire_out['FIRMWARE_NAME'] = 0x3E
-        self._addr_wire_out['FIRMWARE_ID'] = 0x3F
+        self._addr_wire_out = dict(self._regmap.addr_wire_out)
+
+        # wire_out register name -> get function (see the get_debug_wireout_by_name function)
+        self._get_func_by_name = {}
+        for name in self._addr_wire_out.keys():
+            self._get_func_by_name[name] = getattr(self, 'get_' + name.lower())
+
+        # wire_out snapshot
+        #######################################
+        # last snapshot (see the read_snapshot function)
+        self._snapshot = None
+        # maximal age of a snapshot to be reused by the get_* functions (expressed in s).
+        # None: the get_* functions always read the register through the USB
+        self._snapshot_max_age = None
 
         # Trig in: index of the bit
         #######################################
-        self._addr_trigin = {}
-        self._addr_trigin['TRIG_CTRL']  = 0x40;
+        self._addr_trigin = dict(self._regmap.addr_trigin)
+        self._pos_trigin = dict(self._regmap.pos_trigin)
 
-        self._pos_trigin = {}
-        self._pos_trigin['power_valid'] = 0;
-        self._pos_trigin['adc_valid']   = 4;
+        # POWER_ADC_STATUS: index of the ready bits
+        #######################################
+        self._pos_power_adc_status = {}
+        for field in self._regmap['POWER_ADC_STATUS'].field_list:
+            self._pos_power_adc_status[field.name] = field.pos
+
+        # polling of the POWER_ADC_STATUS register (see the wait_until_ready function)
+        # first delay between 2 readings (expressed in s). It's doubled after each reading.
+        self._c_POLL_DELAY_MIN = 50e-6
+        # maximal delay between 2 readings (expressed in s)
+        self._c_POLL_DELAY_MAX = 10e-3
+
+        # error scan: number of internal errors/status selectable by ERROR_SEL
+        register = self._regmap['ERROR_SEL']
+        if register.nb_selectors is None:
+            self._c_ERROR_NB_SELECTORS = 2**register.fields['error_sel'].width
+        else:
+            self._c_ERROR_NB_SELECTORS = register.nb_selectors
+        # error scan: maximal waiting time of the ERROR_SEL loopback and of the stable ERRORS/STATUS readings (expressed in s)
+        self._c_ERROR_SEL_TIMEOUT = 0.2
 
         # ADC
         #######################################
@@ -143,6 +114,11 @@ class DCDC(Driver):
         # ADC resolution (expressed in bits)
         self._c_ADC_res = 12
 
+        # number of ADC channels
+        self._c_ADC_NB_CHANNELS = 8
+        # register names of the ADC channels (ordered by channel index)
+        self._adc_name_list = ['ADC' + str(i) for i in range(self._c_ADC_NB_CHANNELS)]
+
         # register
         #######################################
         # data width of the register
@@ -162,6 +138,46 @@ class DCDC(Driver):
         # level of _verbosity to print the bit values
         self._c_VERBOSITY_BIT = 2
 
+    def _read_firmware_ids(self):
+        """Read the firmware identifiers used to check the loaded firmware (fast attach)
+
+        Returns:
+            list of uint32_t: HARDWARE_ID, FIRMWARE_NAME, FIRMWARE_ID values
+        """
+        addr_list = [self._addr_wire_out[name] for name in ['HARDWARE_ID', 'FIRMWARE_NAME', 'FIRMWARE_ID']]
+        return self.get_wire_outs(addr_list)
+
+    def _get_register_name(self,kind_p,addr_p):
+        """Get the register name of an address (used by the transaction statistics)
+
+        Args:
+            kind_p (str): transaction kind ('wire_in', 'wire_ins', 'wire_out', 'wire_outs', 'trig_in')
+            addr_p (uint8_t): address
+
+        Returns:
+            str: register name (None: unknown)
+        """
+        if kind_p in ('wire_in', 'wire_ins'):
+            # wire_ins: batch recorded with its first staged register
+            register = self._regmap.register_by_wire_in.get(addr_p)
+        elif kind_p == 'trig_in':
+            for name, addr in self._addr_trigin.items():
+                if addr == addr_p:
+                    return name
+            return None
+        else:
+            register = self._regmap.register_by_wire_out.get(addr_p)
+        if register is None:
+            return None
+        return register.name
+
+    def _sync_wire_ins(self):
+        """Align the FrontPanel wire_in buffer (and the shadow cache) with the wire_out mirrors after a fast attach
+        """
+        value_list = self.get_wire_outs([self._addr_wire_out[name] for name in self._addr_wire_in.keys()])
+        for addr, value in zip(self._addr_wire_in.values(), value_list):
+            self.load_shadow(addr, value)
+
     def set_verbosity(self,value_p):
         """Set the level of verbosity
 
@@ -170,6 +186,166 @@ class DCDC(Driver):
         """
         self._verbosity =  value_p
 
+    def get_verbosity(self):
+        """Get the level of verbosity
+
+        Returns:
+            int: level of verbosity (-1: no verbosity, level of verbosity: 1 to 2)
+        """
+        return self._verbosity
+
+    def get_register_map(self):
+        """Get the register map of the board (addresses, bit fields)
+        Note:
+          . the register map is shared by all the DCDC instances: it must not be modified
+
+        Returns:
+            RegisterMap: register map
+        """
+        return self._regmap
+
+    def get_adc_name_list(self):
+        """Get the register names of the ADC channels
+
+        Returns:
+            list of str: register names ordered by channel index (same order as the get_adcs values)
+        """
+        return list(self._adc_name_list)
+
+    def set_snapshot_max_age(self,value_p):
+        """Allow the get_* functions to serve their value from the last snapshot
+
+        Note:
+          . a snapshot is reused only if no wire_in write or trigger occurred since its reading
+
+        Args:
+            value_p (float): maximal age of the snapshot (expressed in s). None: disabled
+        """
+        self._snapshot_max_age = value_p
+
+    def read_snapshot(self):
+        """Read all wire_out registers with a single UpdateWireOuts
+
+        Returns:
+            WireOutSnapshot: immutable set of the read values (by register name)
+        """
+        name_list = list(self._addr_wire_out.keys())
+        addr_list = list(self._addr_wire_out.values())
+        value_list = self.get_wire_outs(addr_list)
+        snapshot = WireOutSnapshot(name_list, addr_list, value_list, time.perf_counter(), self._tx_epoch)
+        self._snapshot = snapshot
+
+        # print
+        ####################################
+        level0 = self.level
+        level1 = self.level + 1
+
+        if self._verbosity < 0:
+            # no print
+            pass
+        else:
+            if self._verbosity >= self._c_VERBOSITY_REG:
+                msg = "[dcdc.read_snapshot]: Get all the register values ";
+                self.display(msg,level0)
+            if self._verbosity >= self._c_VERBOSITY_ADDR:
+                for name, addr in self._addr_wire_out.items():
+                    msg = name + ": 0x" + convert_uint_to_str_hex(snapshot[name], self._c_REG_DATA_WIDTH)
+                    self.display(msg,level1)
+
+        return snapshot
+
+    def _read_wire_out(self,addr_p):
+        """Retrieve a wire_out value from a fresh snapshot (if allowed) or through the USB
+
+        Args:
+            addr_p (uint8_t): address of the wire_out
+
+        Returns:
+            uint32_t: read value
+        """
+        snapshot = self._snapshot
+        if (self._snapshot_max_age is not None) and (snapshot is not None) and (snapshot.epoch == self._tx_epoch):
+            if (time.perf_counter() - snapshot.timestamp) <= self._snapshot_max_age:
+                return snapshot.get_by_addr(addr_p)
+        return self.get_wire_out(addr_p=addr_p)
+
+    def resync(self):
+        """Refresh the wire_in shadow cache from the wire_out mirrors (single UpdateWireOuts)
+        Note:
+          . the shadow cache is enabled if it isn't
+
+        Returns:
+            WireOutSnapshot: snapshot used to refresh the cache
+        """
+        if self._shadow is None:
+            self.enable_shadow(True)
+        snapshot = self.read_snapshot()
+        for name, addr in self._addr_wire_in.items():
+            self.load_shadow(addr, snapshot[name])
+        return snapshot
+
+    def get_wire_in_by_name(self,reg_name_p):
+        """Get the current value of a wire_in register from the shadow cache.
+        Note:
+          . if the value is unknown, the shadow cache is refreshed (see the resync function)
+
+        Args:
+            reg_name_p (str): register name (wire_in)
+
+        Returns:
+            uint32_t: register value
+        """
+        addr = self._addr_wire_in[reg_name_p]
+        value = self.get_shadow(addr)
+        if value is None:
+            snapshot = self.resync()
+            value = snapshot[reg_name_p]
+        return value
+
+    def modify_wire_in_by_name(self,reg_name_p,value_p,mask_p):
+        """Read-modify-write of a wire_in register using the shadow cache (no USB readback).
+
+        Args:
+            reg_name_p (str): register name (wire_in)
+            value_p (uint32_t): value to write
+            mask_p (uint32_t): only the bits set to 1 are modified
+
+        Returns:
+            uint32_t: new register value
+        """
+        value_old = self.get_wire_in_by_name(reg_name_p)
+        value = (value_old & ~mask_p & 0xFFFF_FFFF) | (value_p & mask_p)
+        self.set_wire_in(self._addr_wire_in[reg_name_p], value_p, mask_p)
+        return value
+
+    def set_wire_in_field(self,reg_name_p,pos_p,width_p,value_p):
+        """Write a bit field of a wire_in register using the shadow cache (no USB readback).
+
+        Args:
+            reg_name_p (str): register name (wire_in)
+            pos_p (uint): index low of the position of the bit field (start from @0)
+            width_p (uint): bit field width (expressed in bits: start@1)
+            value_p (uint): bit field value
+
+        Returns:
+            uint32_t: new register value
+        """
+        mask = (2**width_p - 1) << pos_p
+        return self.modify_wire_in_by_name(reg_name_p, value_p << pos_p, mask)
+
+    def get_wire_in_field(self,reg_name_p,pos_p,width_p):
+        """Read a bit field of a wire_in register from the shadow cache.
+
+        Args:
+            reg_name_p (str): register name (wire_in)
+            pos_p (uint): index low of the position of the bit field (start from @0)
+            width_p (uint): bit field width (expressed in bits: start@1)
+
+        Returns:
+            uint: bit field value
+        """
+        return (self.get_wire_in_by_name(reg_name_p) >> pos_p) & (2**width_p - 1)
+
     def set_ctrl(self,rst_p):
         """Configure the CTRL register
 
@@ -177,7 +353,7 @@ class DCDC(Driver):
             rst_p (uint1_t): software reset
         """
 
-        data = rst_p & 0x1
+        data = self._regmap['CTRL'].encode(rst=rst_p)
         addr = self._addr_wire_in['CTRL']
         self.set_wire_in(addr,data)
 
@@ -264,10 +440,10 @@ class DCDC(Driver):
             ras_power_on_off_p (uint1_t): RAS- 1: power up, 0: power down
             wfee_power_on_off_p (uint1_t): WFEE- 1: power up, 0: power down
         """
-        data1 = (wfee_power_on_off_p << 3) + (ras_power_on_off_p << 2)
-        data0 = (dmx1_power_on_off_p << 1 ) + (dmx0_power_on_off_p << 0)
-
-        data = data1 + data0
+        data = self._regmap['POWER_CONF'].encode(dmx0_power_on_off=dmx0_power_on_off_p,
+                                                 dmx1_power_on_off=dmx1_power_on_off_p,
+                                                 ras_power_on_off=ras_power_on_off_p,
+                                                 wfee_power_on_off=wfee_power_on_off_p)
         addr = self._addr_wire_in['POWER_CONF']
         self.set_wire_in(addr,data)
 
@@ -313,6 +489,112 @@ class DCDC(Driver):
 
         self.set_adc_trig()
 
+    def _get_ready_mask(self,bits_p):
+        """Convert ready bit names to a POWER_ADC_STATUS bit mask.
+
+        Args:
+            bits_p (str, list of str or uint32_t): 'power_ready', 'adc_ready', a list of them or a bit mask
+
+        Returns:
+            uint32_t: bit mask
+        """
+        if isinstance(bits_p, str):
+            return 1 << self._pos_power_adc_status[bits_p]
+        if isinstance(bits_p, int):
+            return bits_p
+        mask = 0
+        for name in bits_p:
+            mask |= 1 << self._pos_power_adc_status[name]
+        return mask
+
+    def wait_until_ready(self,bits_p,timeout_p=1.0):
+        """Poll the POWER_ADC_STATUS register until all the selected ready bits are set.
+        Note:
+          . the delay between 2 readings starts small and is doubled after each reading (adaptive back-off)
+
+        Args:
+            bits_p (str, list of str or uint32_t): 'power_ready', 'adc_ready', a list of them or a bit mask
+            timeout_p (float): maximal waiting time (expressed in s)
+
+        Returns:
+            float: waiting time (expressed in s). -1 if the timeout is reached
+        """
+        mask = self._get_ready_mask(bits_p)
+
+        addr = self._addr_wire_out['POWER_ADC_STATUS']
+        delay = self._c_POLL_DELAY_MIN
+        t0 = time.perf_counter()
+        deadline = t0 + timeout_p
+        while True:
+            data = self.get_wire_out(addr_p=addr)
+            now = time.perf_counter()
+            if (data & mask) == mask:
+                latency = now - t0
+                break
+            if now >= deadline:
+                latency = -1
+                break
+            time.sleep(min(delay, deadline - now))
+            delay = min(2 * delay, self._c_POLL_DELAY_MAX)
+
+        # print
+        ####################################
+        level0 = self.level
+        level1 = self.level + 1
+
+        if latency < 0:
+            msg = "[KO]: [dcdc.wait_until_ready]: timeout (POWER_ADC_STATUS: 0x" + convert_uint_to_str_hex(data, self._c_REG_DATA_WIDTH) + ")"
+            self.display(msg,level0)
+        elif self._verbosity >= self._c_VERBOSITY_ADDR:
+            msg = "[dcdc.wait_until_ready]: ready after (s): " + str(latency)
+            self.display(msg,level1)
+
+        return latency
+
+    def set_adc_wait(self,timeout_p=1.0):
+        """
+            Start the dcdc_top function and wait until the ADC acquisition is done.
+
+        Args:
+            timeout_p (float): maximal waiting time (expressed in s)
+
+        Returns:
+            float: completion latency from the trigger (expressed in s). -1 if the timeout is reached
+        """
+        # wait until the FSM is ready to accept a new acquisition
+        if self.wait_until_ready('adc_ready', timeout_p) < 0:
+            return -1
+
+        t0 = time.perf_counter()
+        self.set_adc_trig()
+        if self.wait_until_ready('adc_ready', timeout_p) < 0:
+            return -1
+        return time.perf_counter() - t0
+
+    def set_power_wait(self,dmx0_power_on_off_p,dmx1_power_on_off_p,ras_power_on_off_p,wfee_power_on_off_p,timeout_p=1.0):
+        """ Start the power_top function and wait until the power FSM is done.
+
+        Args:
+            dmx0_power_on_off_p (uint1_t): DMX0- 1: power up, 0: power down
+            dmx1_power_on_off_p (uint1_t): DMX1- 1: power up, 0: power down
+            ras_power_on_off_p (uint1_t): RAS- 1: power up, 0: power down
+            wfee_power_on_off_p (uint1_t): WFEE- 1: power up, 0: power down
+            timeout_p (float): maximal waiting time (expressed in s)
+
+        Returns:
+            float: completion latency from the trigger (expressed in s). -1 if the timeout is reached
+        """
+        # wait until the FSM is ready to accept a new configuration
+        if self.wait_until_ready('power_ready', timeout_p) < 0:
+            return -1
+
+        self.set_power_conf(dmx0_power_on_off_p,dmx1_power_on_off_p,ras_power_on_off_p,wfee_power_on_off_p)
+        t0 = time.perf_counter()
+        self.set_power_trig()
+        if self.wait_until_ready('power_ready', timeout_p) < 0:
+            return -1
+        return time.perf_counter() - t0
+
     def set_adc_trig(self):
         """
            Activate the adc_valid trig
@@ -350,7 +632,7 @@ class DCDC(Driver):
             debug_pulse_p (uint1_t): 1: delay error, 0: latch error
         """
 
-        data = ( rst_status_p << 1) + debug_pulse_p
+        data = self._regmap['DEBUG_CTRL'].encode(rst_status=rst_status_p, debug_pulse=debug_pulse_p)
         addr = self._addr_wire_in['DEBUG_CTRL']
         self.set_wire_in(addr,data)
 
@@ -402,14 +684,18 @@ class DCDC(Driver):
             if self._verbosity >= self._c_VERBOSITY_BIT:
                 self.display_bit("sel_error_p", sel_error_p, 0, level2)
 
-    def get_ctrl(self):
-        """Retrieve the value from the CTRL register (wire_out)
+    def _get_register(self,reg_name_p):
+        """Retrieve a wire_out register value and print it according to the level of verbosity
+
+        Args:
+            reg_name_p (str): register name (wire_out)
 
         Returns:
             uint32_t: read value
         """
-        addr = self._addr_wire_out['CTRL']
-        data = self.get_wire_out(addr_p=addr)
+        register = self._regmap[reg_name_p]
+        addr = register.wire_out
+        data = self._read_wire_out(addr_p=addr)
 
         # print
         ####################################
@@ -422,46 +708,51 @@ class DCDC(Driver):
             pass
         else:
             if self._verbosity >= self._c_VERBOSITY_REG:
-                msg = "[dcdc.get_ctrl]: Get the register value ";
+                msg = "[dcdc.get_" + reg_name_p.lower() + "]: Get the register value ";
                 self.display(msg,level0)
             if self._verbosity >= self._c_VERBOSITY_ADDR:
                 self.display_register(addr, self._c_REG_ADDR_WIDTH, data, self._c_REG_DATA_WIDTH, level1)
             if self._verbosity >= self._c_VERBOSITY_BIT:
-                self.display_bit_from_data("rst", 0, 1, data, level2)
+                for field in register.field_list:
+                    self.display_bit_from_data(field.name, field.pos, field.width, data, level2)
+                if register.format == 'adc_voltage':
+                    voltage = self._compute_adc_voltage(data)
+                    msg = "ADC (Volt): "+ str(voltage)
+                    self.display(msg,level2 + 1)
+                elif register.format == 'ascii':
+                    msg = "(ASCII): " + convert_uint_to_ascii(data, self._c_REG_DATA_WIDTH)
+                    self.display(msg, level2 + 1)
 
         return data
 
-    def get_power_conf(self):
-        """Retrieve the value from the POWER_CONF register (wire_out)
+    def decode_snapshot(self,snapshot_p=None):
+        """Decode all the registers of a snapshot into their bit field values (one pass)
+
+        Args:
+            snapshot_p (WireOutSnapshot): snapshot to decode (default: read a new snapshot)
 
         Returns:
-            uint32_t: read value
+            dict: register name -> (bit field name -> value)
         """
-        addr = self._addr_wire_out['POWER_CONF']
-        data = self.get_wire_out(addr_p=addr)
+        if snapshot_p is None:
+            snapshot_p = self.read_snapshot()
+        return self._regmap.decode_values(snapshot_p)
 
-        # print
-        ####################################
-        level0 = self.level
-        level1 = self.level + 1
-        level2 = self.level + 2
+    def get_ctrl(self):
+        """Retrieve the value from the CTRL register (wire_out)
 
-        if self._verbosity < 0:
-            # no print
-            pass
-        else:
-            if self._verbosity >= self._c_VERBOSITY_REG:
-                msg = "[dcdc.get_power_conf]: Get the register value ";
-                self.display(msg,level0)
-            if self._verbosity >= self._c_VERBOSITY_ADDR:
-                self.display_register(addr, self._c_REG_ADDR_WIDTH, data, self._c_REG_DATA_WIDTH, level1)
-            if self._verbosity >= self._c_VERBOSITY_BIT:
-                self.display_bit_from_data("dmx0_power_on_off", 0, 1, data, level2)
-                self.display_bit_from_data("dmx1_power_on_off", 1, 1, data, level2)
-                self.display_bit_from_data("ras_power_on_off", 2, 1, data, level2)
-                self.display_bit_from_data("wfee_power_on_off", 3, 1, data, level2)
+        Returns:
+            uint32_t: read value
+        """
+        return self._get_register('CTRL')
 
-        return data
+    def get_power_conf(self):
+        """Retrieve the value from the POWER_CONF register (wire_out)
+
+        Returns:
+            uint32_t: read value
+        """
+        return self._get_register('POWER_CONF')
 
     def get_power_adc_status(self):
         """Retrieve the value from the POWER_ADC_STATUS register (wire_out)
@@ -469,29 +760,7 @@ class DCDC(Driver):
         Returns:
             uint32_t: read value
         """
-        addr = self._addr_wire_out['POWER_ADC_STATUS']
-        data = self.get_wire_out(addr_p=addr)
-
-        # print
-        ####################################
-        level0 = self.level
-        level1 = self.level + 1
-        level2 = self.level + 2
-
-        if self._verbosity < 0:
-            # no print
-            pass
-        else:
-            if self._verbosity >= self._c_VERBOSITY_REG:
-                msg = "[dcdc.get_power_adc_status]: Get the register value ";
-                self.display(msg,level0)
-            if self._verbosity >= self._c_VERBOSITY_ADDR:
-                self.display_register(addr, self._c_REG_ADDR_WIDTH, data, self._c_REG_DATA_WIDTH, level1)
-            if self._verbosity >= self._c_VERBOSITY_BIT:
-                self.display_bit_from_data("adc_ready", 4, 1, data, level2)
-                self.display_bit_from_data("power_ready", 0, 1, data, level2)
-
-        return data
+        return self._get_register('POWER_ADC_STATUS')
 
     def _compute_adc_voltage(self,data_p):
         """ Convert an ADC numerical value into the corresponding ADC voltage
@@ -503,175 +772,164 @@ class DCDC(Driver):
         voltage = data_p * self._c_ADC_VA/(2**self._c_ADC_res)
         return voltage
 
-    def get_adc0(self):
-        """Retrieve the read ADC0 value from the ADC device.
-        Note:
-          . The reading should be done after calling the set_adc_ctrl function
+    def compute_adc_voltages(self,data_p):
+        """ Convert ADC numerical values into the corresponding ADC voltages (vectorized)
+
+        Args:
+            data_p (array_like of uint): ADC numerical values. Any shape is accepted
+                                         (ex: (8,) for one acquisition, (nb_acquisitions, 8) for a capture)
 
         Returns:
-            uint32_t: read value
+            numpy.ndarray of float64: ADC voltages (same shape as data_p)
         """
-        addr = self._addr_wire_out['ADC0']
-        data = self.get_wire_out(addr_p=addr)
-
-        # print
-        ####################################
-        level0 = self.level
-        level1 = self.level + 1
-        level2 = self.level + 2
-
-        if self._verbosity < 0:
-            # no print
-            pass
-        else:
-            if self._verbosity >= self._c_VERBOSITY_REG:
-                msg = "[dcdc.get_adc0]: Get the register value ";
-                self.display(msg,level0)
-            if self._verbosity >= self._c_VERBOSITY_ADDR:
-                self.display_register(addr, self._c_REG_ADDR_WIDTH, data, self._c_REG_DATA_WIDTH, level1)
-            if self._verbosity >= self._c_VERBOSITY_BIT:
-                self.display_bit_from_data("adc0", 0, 16, data, level2)
-                voltage = self._compute_adc_voltage(data)
-                msg = "ADC (Volt): "+ str(voltage)
-                self.display(msg,level2 + 1)
+        data = np.asarray(data_p)
+        voltages = np.multiply(data, self._c_ADC_VA/(2**self._c_ADC_res), dtype=np.float64)
+        return voltages
 
-        return data
-
-    def get_adc1(self):
-        """Retrieve the read ADC1 value from the ADC device.
+    def get_adcs(self,data_p=None):
+        """Retrieve the 8 ADC values and the corresponding voltages.
         Note:
-          . The reading should be done after calling the set_adc_ctrl function
+          . The reading should be done after calling the set_adc function
+          . without data_p, the 8 registers are read with a single UpdateWireOuts
+
+        Args:
+            data_p (array_like of uint): ADC numerical values to convert instead of reading the registers.
+                                         Shape: (8,) or (nb_acquisitions, 8)
 
         Returns:
-            uint32_t: read value
+            tuple (numpy.ndarray, numpy.ndarray of float64): ADC numerical values, ADC voltages
         """
-        addr = self._addr_wire_out['ADC1']
-        data = self.get_wire_out(addr_p=addr)
+        if data_p is None:
+            addr_list = [self._addr_wire_out[name] for name in self._adc_name_list]
+            data = np.array(self.get_wire_outs(addr_list), dtype=np.uint32)
+        else:
+            data = np.asarray(data_p)
+        voltages = self.compute_adc_voltages(data)
 
         # print
         ####################################
         level0 = self.level
         level1 = self.level + 1
-        level2 = self.level + 2
 
         if self._verbosity < 0:
             # no print
             pass
         else:
             if self._verbosity >= self._c_VERBOSITY_REG:
-                msg = "[dcdc.get_adc1]: Get the register value ";
+                msg = "[dcdc.get_adcs]: Get the ADC values ";
                 self.display(msg,level0)
-            if self._verbosity >= self._c_VERBOSITY_ADDR:
-                self.display_register(addr, self._c_REG_ADDR_WIDTH, data, self._c_REG_DATA_WIDTH, level1)
-            if self._verbosity >= self._c_VERBOSITY_BIT:
-                self.display_bit_from_data("adc1", 0, 16, data, level2)
-                voltage = self._compute_adc_voltage(data)
-                msg = "ADC (Volt): "+ str(voltage)
-                self.display(msg,level2 + 1)
+            if (self._verbosity >= self._c_VERBOSITY_ADDR) and (data.ndim == 1):
+                for i in range(data.shape[0]):
+                    msg = self._adc_name_list[i] + ": 0x" + convert_uint_to_str_hex(int(data[i]), 16) + " (Volt): " + str(voltages[i])
+                    self.display(msg,level1)
 
-        return data
+        return data, voltages
 
-    def get_adc2(self):
-        """Retrieve the read ADC2 value from the ADC device.
+    def get_adcs_oversampled(self,nb_samples_p,timeout_p=1.0):
+        """Acquire the 8 ADC channels nb_samples_p times back-to-back and compute their statistics.
         Note:
-          . The reading should be done after calling the set_adc_ctrl function
+          . the statistics are computed on the fly (O(1) memory: see RunningStats)
+          . the failed acquisitions (timeout) are not accumulated
+
+        Args:
+            nb_samples_p (uint): number of acquisitions
+            timeout_p (float): maximal waiting time of each acquisition (expressed in s)
 
         Returns:
-            uint32_t: read value
+            dict: 'count' (number of accumulated acquisitions) and, by channel (numpy.ndarray of float64, expressed in V):
+                  'mean', 'std' (noise), 'stderr' (uncertainty of the mean), 'min', 'max'
         """
-        addr = self._addr_wire_out['ADC2']
-        data = self.get_wire_out(addr_p=addr)
+        addr_list = [self._addr_wire_out[name] for name in self._adc_name_list]
+        stats = RunningStats(self._c_ADC_NB_CHANNELS)
+
+        # no print by register access during the acquisitions
+        verbosity = self._verbosity
+        self._verbosity = -1
+        try:
+            for i in range(nb_samples_p):
+                if self.set_adc_wait(timeout_p) < 0:
+                    continue
+                stats.update(self.get_wire_outs(addr_list))
+        finally:
+            self._verbosity = verbosity
+
+        result = {}
+        result['count'] = stats.count
+        result['mean'] = self.compute_adc_voltages(stats.mean)
+        result['std'] = self.compute_adc_voltages(stats.std)
+        result['stderr'] = self.compute_adc_voltages(stats.stderr)
+        result['min'] = self.compute_adc_voltages(stats.min)
+        result['max'] = self.compute_adc_voltages(stats.max)
 
         # print
         ####################################
         level0 = self.level
         level1 = self.level + 1
-        level2 = self.level + 2
 
         if self._verbosity < 0:
             # no print
             pass
         else:
             if self._verbosity >= self._c_VERBOSITY_REG:
-                msg = "[dcdc.get_adc2]: Get the register value ";
+                msg = "[dcdc.get_adcs_oversampled]: " + str(stats.count) + "/" + str(nb_samples_p) + " acquisitions"
                 self.display(msg,level0)
             if self._verbosity >= self._c_VERBOSITY_ADDR:
-                self.display_register(addr, self._c_REG_ADDR_WIDTH, data, self._c_REG_DATA_WIDTH, level1)
-            if self._verbosity >= self._c_VERBOSITY_BIT:
-                self.display_bit_from_data("adc2", 0, 16, data, level2)
-                voltage = self._compute_adc_voltage(data)
-                msg = "ADC (Volt): "+ str(voltage)
-                self.display(msg,level2 + 1)
+                for i in range(self._c_ADC_NB_CHANNELS):
+                    msg = self._adc_name_list[i] + " (Volt): " + '{0:.5f}'.format(result['mean'][i]) + " +/- " + '{0:.5f}'.format(result['stderr'][i])
+                    msg += " (std: " + '{0:.5f}'.format(result['std'][i]) + ", min: " + '{0:.5f}'.format(result['min'][i]) + ", max: " + '{0:.5f}'.format(result['max'][i]) + ")"
+                    self.display(msg,level1)
 
-        return data
+        return result
 
-    def get_adc3(self):
-        """Retrieve the read ADC3 value from the ADC device.
+    def get_adc0(self):
+        """Retrieve the read ADC0 value from the ADC device.
         Note:
           . The reading should be done after calling the set_adc_ctrl function
 
         Returns:
             uint32_t: read value
         """
-        addr = self._addr_wire_out['ADC3']
-        data = self.get_wire_out(addr_p=addr)
+        return self._get_register('ADC0')
 
-        # print
-        ####################################
-        level0 = self.level
-        level1 = self.level + 1
-        level2 = self.level + 2
-
-        if self._verbosity < 0:
-            # no print
-            pass
-        else:
-            if self._verbosity >= self._c_VERBOSITY_REG:
-                msg = "[dcdc.get_adc3]: Get the register value ";
-                self.display(msg,level0)
-            if self._verbosity >= self._c_VERBOSITY_ADDR:
-                self.display_register(addr, self._c_REG_ADDR_WIDTH, data, self._c_REG_DATA_WIDTH, level1)
-            if self._verbosity >= self._c_VERBOSITY_BIT:
-                self.display_bit_from_data("adc3", 0, 16, data, level2)
-                voltage = self._compute_adc_voltage(data)
-                msg = "ADC (Volt): "+ str(voltage)
-                self.display(msg,level2 + 1)
+    def get_adc1(self):
+        """Retrieve the read ADC1 value from the ADC device.
+        Note:
+          . The reading should be done after calling the set_adc_ctrl function
 
-        return data
+        Returns:
+            uint32_t: read value
+        """
+        return self._get_register('ADC1')
 
-    def get_adc4(self):
-        """Retrieve the read ADC4 value from the ADC device.
+    def get_adc2(self):
+        """Retrieve the read ADC2 value from the ADC device.
         Note:
           . The reading should be done after calling the set_adc_ctrl function
 
         Returns:
             uint32_t: read value
         """
-        addr = self._addr_wire_out['ADC4']
-        data = self.get_wire_out(addr_p=addr)
+        return self._get_register('ADC2')
 
-        # print
-        ####################################
-        level0 = self.level
-        level1 = self.level + 1
-        level2 = self.level + 2
+    def get_adc3(self):
+        """Retrieve the read ADC3 value from the ADC device.
+        Note:
+          . The reading should be done after calling the set_adc_ctrl function
 
-        if self._verbosity < 0:
-            # no print
-            pass
-        else:
-            if self._verbosity >= self._c_VERBOSITY_REG:
-                msg = "[dcdc.get_adc4]: Get the register value ";
-                self.display(msg,level0)
-            if self._verbosity >= self._c_VERBOSITY_ADDR:
-                self.display_register(addr, self._c_REG_ADDR_WIDTH, data, self._c_REG_DATA_WIDTH, level1)
-            if self._verbosity >= self._c_VERBOSITY_BIT:
-                self.display_bit_from_data("adc4", 0, 16, data, level2)
-                voltage = self._compute_adc_voltage(data)
-                msg = "ADC (Volt): "+ str(voltage)
-                self.display(msg,level2 + 1)
+        Returns:
+            uint32_t: read value
+        """
+        return self._get_register('ADC3')
 
-        return data
+    def get_adc4(self):
+        """Retrieve the read ADC4 value from the ADC device.
+        Note:
+          . The reading should be done after calling the set_adc_ctrl function
+
+        Returns:
+            uint32_t: read value
+        """
+        return self._get_register('ADC4')
 
     def get_adc5(self):
         """Retrieve the read ADC5 value from the ADC device.
@@ -681,31 +939,7 @@ class DCDC(Driver):
         Returns:
             uint32_t: read value
         """
-        addr = self._addr_wire_out['ADC5']
-        data = self.get_wire_out(addr_p=addr)
-
-        # print
-        ####################################
-        level0 = self.level
-        level1 = self.level + 1
-        level2 = self.level + 2
-
-        if self._verbosity < 0:
-            # no print
-            pass
-        else:
-            if self._verbosity >= self._c_VERBOSITY_REG:
-                msg = "[dcdc.get_adc5]: Get the register value ";
-                self.display(msg,level0)
-            if self._verbosity >= self._c_VERBOSITY_ADDR:
-                self.display_register(addr, self._c_REG_ADDR_WIDTH, data, self._c_REG_DATA_WIDTH, level1)
-            if self._verbosity >= self._c_VERBOSITY_BIT:
-                self.display_bit_from_data("adc5", 0, 16, data, level2)
-                voltage = self._compute_adc_voltage(data)
-                msg = "ADC (Volt): "+ str(voltage)
-                self.display(msg,level2 + 1)
-
-        return data
+        return self._get_register('ADC5')
 
     def get_adc6(self):
         """Retrieve the read ADC6 value from the ADC device.
@@ -715,31 +949,7 @@ class DCDC(Driver):
         Returns:
             uint32_t: read value
         """
-        addr = self._addr_wire_out['ADC6']
-        data = self.get_wire_out(addr_p=addr)
-
-        # print
-        ####################################
-        level0 = self.level
-        level1 = self.level + 1
-        level2 = self.level + 2
-
-        if self._verbosity < 0:
-            # no print
-            pass
-        else:
-            if self._verbosity >= self._c_VERBOSITY_REG:
-                msg = "[dcdc.get_adc6]: Get the register value ";
-                self.display(msg,level0)
-            if self._verbosity >= self._c_VERBOSITY_ADDR:
-                self.display_register(addr, self._c_REG_ADDR_WIDTH, data, self._c_REG_DATA_WIDTH, level1)
-            if self._verbosity >= self._c_VERBOSITY_BIT:
-                self.display_bit_from_data("adc6", 0, 16, data, level2)
-                voltage = self._compute_adc_voltage(data)
-                msg = "ADC (Volt): "+ str(voltage)
-                self.display(msg,level2 + 1)
-
-        return data
+        return self._get_register('ADC6')
 
     def get_adc7(self):
         """Retrieve the read ADC7 value from the ADC device.
@@ -749,31 +959,7 @@ class DCDC(Driver):
         Returns:
             uint32_t: read value
         """
-        addr = self._addr_wire_out['ADC7']
-        data = self.get_wire_out(addr_p=addr)
-
-        # print
-        ####################################
-        level0 = self.level
-        level1 = self.level + 1
-        level2 = self.level + 2
-
-        if self._verbosity < 0:
-            # no print
-            pass
-        else:
-            if self._verbosity >= self._c_VERBOSITY_REG:
-                msg = "[dcdc.get_adc7]: Get the register value ";
-                self.display(msg,level0)
-            if self._verbosity >= self._c_VERBOSITY_ADDR:
-                self.display_register(addr, self._c_REG_ADDR_WIDTH, data, self._c_REG_DATA_WIDTH, level1)
-            if self._verbosity >= self._c_VERBOSITY_BIT:
-                self.display_bit_from_data("adc7", 0, 16, data, level2)
-                voltage = self._compute_adc_voltage(data)
-                msg = "ADC (Volt): "+ str(voltage)
-                self.display(msg,level2 + 1)
-
-        return data
+        return self._get_register('ADC7')
 
     def get_debug_ctrl(self):
         """Retrieve the value from the DEBUG_CTRL register (wire_out)
@@ -781,29 +967,7 @@ class DCDC(Driver):
         Returns:
             uint32_t: read value
         """
-        addr = self._addr_wire_out['DEBUG_CTRL']
-        data = self.get_wire_out(addr_p=addr)
-
-        # print
-        ####################################
-        level0 = self.level
-        level1 = self.level + 1
-        level2 = self.level + 2
-
-        if self._verbosity < 0:
-            # no print
-            pass
-        else:
-            if self._verbosity >= self._c_VERBOSITY_REG:
-                msg = "[dcdc.get_debug_ctrl]: Get the register value ";
-                self.display(msg,level0)
-            if self._verbosity >= self._c_VERBOSITY_ADDR:
-                self.display_register(addr, self._c_REG_ADDR_WIDTH, data, self._c_REG_DATA_WIDTH, level1)
-            if self._verbosity >= self._c_VERBOSITY_BIT:
-                self.display_bit_from_data("debug_pulse", 0, 1, data, level2)
-                self.display_bit_from_data("rst_status", 1, 1, data, level2)
-
-        return data
+        return self._get_register('DEBUG_CTRL')
 
     def get_error_sel(self):
         """Retrieve the value from the ERROR_SEL register (wire_out)
@@ -811,29 +975,7 @@ class DCDC(Driver):
         Returns:
             uint32_t: read value
         """
-        addr = self._addr_wire_out['ERROR_SEL']
-        data = self.get_wire_out(addr_p=addr)
-
-        # print
-        ####################################
-        level0 = self.level
-        level1 = self.level + 1
-        level2 = self.level + 2
-
-        if self._verbosity < 0:
-            # no print
-            pass
-        else:
-            if self._verbosity >= self._c_VERBOSITY_REG:
-                msg = "[dcdc.get_error_sel]: Get the register value ";
-                self.display(msg,level0)
-            if self._verbosity >= self._c_VERBOSITY_ADDR:
-                self.display_register(addr, self._c_REG_ADDR_WIDTH, data, self._c_REG_DATA_WIDTH, level1)
-            if self._verbosity >= self._c_VERBOSITY_BIT:
-                self.display_bit_from_data("error_sel", 0, 1, data, level2)
-
-
-        return data
+        return self._get_register('ERROR_SEL')
 
     def get_errors(self):
         """Retrieve the value from the selected internal error register (wire_out)
@@ -842,28 +984,7 @@ class DCDC(Driver):
         Returns:
             uint32_t: read value
         """
-        addr = self._addr_wire_out['ERRORS']
-        data = self.get_wire_out(addr_p=addr)
-
-        # print
-        ####################################
-        level0 = self.level
-        level1 = self.level + 1
-        level2 = self.level + 2
-
-        if self._verbosity < 0:
-            # no print
-            pass
-        else:
-            if self._verbosity >= self._c_VERBOSITY_REG:
-                msg = "[dcdc.get_errors]: Get the register value ";
-                self.display(msg,level0)
-            if self._verbosity >= self._c_VERBOSITY_ADDR:
-                self.display_register(addr, self._c_REG_ADDR_WIDTH, data, self._c_REG_DATA_WIDTH, level1)
-            if self._verbosity >= self._c_VERBOSITY_BIT:
-                self.display_bit_from_data("errors", 0, 32, data, level2)
-
-        return data
+        return self._get_register('ERRORS')
 
     def get_status(self):
         """Retrieve the value from the selected internal status register (wire_out)
@@ -872,113 +993,28 @@ class DCDC(Driver):
         Returns:
             uint32_t: read value
         """
-        addr = self._addr_wire_out['STATUS']
-        data = self.get_wire_out(addr_p=addr)
-
-        # print
-        ####################################
-        level0 = self.level
-        level1 = self.level + 1
-        level2 = self.level + 2
-
-        if self._verbosity < 0:
-            # no print
-            pass
-        else:
-            if self._verbosity >= self._c_VERBOSITY_REG:
-                msg = "[dcdc.get_status]: Get the register value ";
-                self.display(msg,level0)
-            if self._verbosity >= self._c_VERBOSITY_ADDR:
-                self.display_register(addr, self._c_REG_ADDR_WIDTH, data, self._c_REG_DATA_WIDTH, level1)
-            if self._verbosity >= self._c_VERBOSITY_BIT:
-                self.display_bit_from_data("status", 0, 32, data, level2)
-        return data
+        return self._get_register('STATUS')
 
     def get_hardware_id(self):
         """Retrieve the value from HARDWARE_ID register (wire_out)
         Returns:
             uint32_t: read value
         """
-        addr = self._addr_wire_out['HARDWARE_ID']
-        data = self.get_wire_out(addr_p=addr)
-
-        # print
-        ####################################
-        level0 = self.level
-        level1 = self.level + 1
-        level2 = self.level + 2
-
-        if self._verbosity < 0:
-            # no print
-            pass
-        else:
-            if self._verbosity >= self._c_VERBOSITY_REG:
-                msg = "[dcdc.get_hardware_id]: Get the register value ";
-                self.display(msg,level0)
-            if self._verbosity >= self._c_VERBOSITY_ADDR:
-                self.display_register(addr, self._c_REG_ADDR_WIDTH, data, self._c_REG_DATA_WIDTH, level1)
-            if self._verbosity >= self._c_VERBOSITY_BIT:
-                self.display_bit_from_data("HARDWARE_ID", 0, 32, data, level2)
-
-        return data
+        return self._get_register('HARDWARE_ID')
 
     def get_firmware_name(self):
         """Retrieve the value from FIRMWARE_NAME register (wire_out)
         Returns:
             uint32_t: read value
         """
-        addr = self._addr_wire_out['FIRMWARE_NAME']
-        data = self.get_wire_out(addr_p=addr)
-
-        # print
-        ####################################
-        level0 = self.level
-        level1 = self.level + 1
-        level2 = self.level + 2
-
-        if self._verbosity < 0:
-            # no print
-            pass
-        else:
-            if self._verbosity >= self._c_VERBOSITY_REG:
-                msg = "[dcdc.get_firmware_name]: Get the register value ";
-                self.display(msg,level0)
-            if self._verbosity >= self._c_VERBOSITY_ADDR:
-                self.display_register(addr, self._c_REG_ADDR_WIDTH, data, self._c_REG_DATA_WIDTH, level1)
-            if self._verbosity >= self._c_VERBOSITY_BIT:
-                self.display_bit_from_data("FIRMWARE_NAME", 0, 32, data, level2)
-                msg = "(ASCII): " + convert_uint_to_ascii(data, self._c_REG_DATA_WIDTH)
-                self.display(msg, level2 + 1)
-
-        return data
+        return self._get_register('FIRMWARE_NAME')
 
     def get_firmware_id(self):
         """Retrieve the value from FIRMWARE_ID register (wire_out)
         Returns:
             uint32_t: read value
         """
-        addr = self._addr_wire_out['FIRMWARE_ID']
-        data = self.get_wire_out(addr_p=addr)
-
-        # print
-        ####################################
-        level0 = self.level
-        level1 = self.level + 1
-        level2 = self.level + 2
-
-        if self._verbosity < 0:
-            # no print
-            pass
-        else:
-            if self._verbosity >= self._c_VERBOSITY_REG:
-                msg = "[dcdc.get_firmware_id]: Get the register value ";
-                self.display(msg,level0)
-            if self._verbosity >= self._c_VERBOSITY_ADDR:
-                self.display_register(addr, self._c_REG_ADDR_WIDTH, data, self._c_REG_DATA_WIDTH, level1)
-            if self._verbosity >= self._c_VERBOSITY_BIT:
-                self.display_bit_from_data("FIRMWARE_ID", 0, 32, data, level2)
-
-        return data
+        return self._get_register('FIRMWARE_ID')
 
     ###########################################
     # debugging
@@ -1019,76 +1055,113 @@ class DCDC(Driver):
         Args:
             reg_name_p (str): register name (wire_out)
         """
-        if self._verbosity < 0:
-            # no print
-            pass
-        else:
-            if self._verbosity >= self._c_VERBOSITY_REG:
-                msg = "[dcdc.set_debug_wirein_by_name]: Get the register value of "+ reg_name_p;
-        addr = self._addr_wire_out.get(reg_name_p)
-        if addr is None:
+        get_func = self._get_func_by_name.get(reg_name_p)
+        if get_func is None:
             print("[KO]: " + reg_name_p + "register doesn't exist")
             return -1
+        return get_func()
 
-        if reg_name_p == 'CTRL':
-            value = self.get_ctrl()
-        elif reg_name_p == "POWER_CONF":
-            value = self.get_power_conf()
-        elif reg_name_p == "POWER_ADC_STATUS":
-            value = self.get_power_adc_status()
-        elif reg_name_p == "ADC0":
-            value = self.get_adc0()
-        elif reg_name_p == "ADC1":
-            value = self.get_adc1()
-        elif reg_name_p == "ADC2":
-            value = self.get_adc2()
-        elif reg_name_p == "ADC3":
-            value = self.get_adc3()
-        elif reg_name_p == "ADC4":
-            value = self.get_adc4()
-        elif reg_name_p == "ADC5":
-            value = self.get_adc5()
-        elif reg_name_p == "ADC6":
-            value = self.get_adc6()
-        elif reg_name_p == "ADC7":
-            value = self.get_adc7()
-        elif reg_name_p == "DEBUG_CTRL":
-            value = self.get_debug_ctrl()
-        elif reg_name_p == "ERROR_SEL":
-            value = self.get_error_sel()
-        elif reg_name_p == "ERRORS":
-            value = self.get_errors()
-        elif reg_name_p == "STATUS":
-            value = self.get_status()
-        elif reg_name_p == "HARDWARE_ID":
-            value = self.get_hardware_id()
-        elif reg_name_p == "FIRMWARE_NAME":
-            value = self.get_firmware_name()
-        elif reg_name_p == "FIRMWARE_ID":
-            value = self.get_firmware_id()
+    def scan_errors(self,nb_selectors_p=None):
+        """Read the ERRORS and STATUS registers of each internal error/status selector
 
+        Note:
+          . for each selector, ERROR_SEL is written then its loopback is polled (adaptive back-off,
+            see wait_until_ready) until it reports the selector
+          . the ERROR_SEL loopback only proves that the selector reached the FPGA: the ERRORS and STATUS
+            registers are then read until 2 consecutive readings are equal (the multiplexer has settled).
+            A settled multiplexer costs 2 readings (no fixed delay)
 
+        Args:
+            nb_selectors_p (uint): number of selectors to scan (default: defined by the register map)
 
-        return value
+        Returns:
+            list of dict: by selector: {'selector', 'errors', 'status', 'loopback_time' (expressed in s, -1: timeout),
+                                        'settle_time' (from the loopback to the stable readings, expressed in s, -1: timeout)}
+        """
+        if nb_selectors_p is None:
+            nb_selectors_p = self._c_ERROR_NB_SELECTORS
+
+        addr_sel = self._addr_wire_in['ERROR_SEL']
+        addr_loopback = self._addr_wire_out['ERROR_SEL']
+        addr_list = [self._addr_wire_out['ERRORS'], self._addr_wire_out['STATUS']]
+
+        report = []
+        for i in range(nb_selectors_p):
+            t0 = time.perf_counter()
+            self.set_wire_in(addr_sel, i)
+            # wait for the ERROR_SEL loopback
+            deadline = t0 + self._c_ERROR_SEL_TIMEOUT
+            delay = self._c_POLL_DELAY_MIN
+            while True:
+                sel = self.get_wire_out(addr_loopback)
+                now = time.perf_counter()
+                if sel == i:
+                    loopback_time = now - t0
+                    break
+                if now >= deadline:
+                    loopback_time = -1
+                    break
+                time.sleep(min(delay, deadline - now))
+                delay = min(2 * delay, self._c_POLL_DELAY_MAX)
+            # wait for the ERRORS/STATUS multiplexer: 2 consecutive readings are equal
+            t0 = time.perf_counter()
+            deadline = t0 + self._c_ERROR_SEL_TIMEOUT
+            delay = self._c_POLL_DELAY_MIN
+            value_list = self.get_wire_outs(addr_list)
+            while True:
+                value_list_next = self.get_wire_outs(addr_list)
+                now = time.perf_counter()
+                if value_list_next == value_list:
+                    settle_time = now - t0
+                    break
+                value_list = value_list_next
+                if now >= deadline:
+                    settle_time = -1
+                    break
+                time.sleep(min(delay, deadline - now))
+                delay = min(2 * delay, self._c_POLL_DELAY_MAX)
+            errors, status = value_list_next
+            report.append({'selector': i, 'errors': errors, 'status': status, 'loopback_time': loopback_time, 'settle_time': settle_time})
+
+        # print
+        ####################################
+        level0 = self.level
+        level1 = self.level + 1
+
+        if self._verbosity < 0:
+            # no print
+            pass
+        else:
+            if self._verbosity >= self._c_VERBOSITY_REG:
+                msg = "[dcdc.scan_errors]: Scan the internal errors/status (" + str(nb_selectors_p) + " selectors)"
+                self.display(msg,level0)
+            if self._verbosity >= self._c_VERBOSITY_ADDR:
+                for result in report:
+                    msg = "sel " + str(result['selector']) + ": errors: 0x" + convert_uint_to_str_hex(result['errors'], self._c_REG_DATA_WIDTH) + ", status: 0x" + convert_uint_to_str_hex(result['status'], self._c_REG_DATA_WIDTH)
+                    self.display(msg,level1)
+
+        return report
 
     def check_internal_errors(self):
         """ Check and count the number of internal errors.
 
         Note:
           . All internal errors should be set to 0
+          . see scan_errors
         """
-        # number of internal error/status
-        nb_errors = 1
-
         cnt = 0
-        for i in range(nb_errors):
-            self.set_debug_wirein_by_name("ERROR_SEL",i)
-            # sleep (in s)
-            time.sleep(0.2)
-            value = self.get_errors()
-            if value != 0:
+        for result in self.scan_errors():
+            i = result['selector']
+            if result['loopback_time'] < 0:
+                msg = "[KO]: ERROR_SEL loopback timeout: errors" + str(i)
+                self.display(msg)
+                cnt += 1
+            elif result['settle_time'] < 0:
+                msg = "[KO]: ERRORS/STATUS not stable: errors" + str(i)
+                self.display(msg)
+                cnt += 1
+            elif result['errors'] != 0:
                 msg = "[KO]: errors" + str(i)
                 self.display(msg)
                 cnt += 1
         return cnt
-
@@ -0,0 +1,189 @@
+# ------------------------------------------------------------------------------------------------------------
+#                            Copyright (C) 2024-2030 Ken-ji de la ROSA, IRAP Toulouse.
+# ------------------------------------------------------------------------------------------------------------
+#                            This file is part of the ATHENA X-IFU DRE Telemetry and Telecommand Firmware.
+#
+#                            dcdc-hk-fw is free software: you can redistribute it and/or modify
+#                            it under the terms of the GNU General Public License as published by
+#                            the Free Software Foundation, either version 3 of the License, or
+#                            (at your option) any later version.
+#
+#                            This program is distributed in the hope that it will be useful,
+#                            but WITHOUT ANY WARRANTY; without even the implied warranty of
+#                            MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#                            GNU General Public License for more details.
+#
+#                            You should have received a copy of the GNU General Public License
+#                            along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------------------------------------
+#    email                   kenji.delarosa@alten.com
+#    @file                   device_manager.py
+# -------------------------------------------------------------------------------------------------------------
+#    Automatic Generation    No
+#    Code Rules Reference    N/A
+# -------------------------------------------------------------------------------------------------------------
+#   @details
+#
+#   Drive several FrontPanel boards from one process:
+#     . enumerate the boards by serial number
+#     . map each serial number to a role (DCDC, FPAsim, ...) and a firmware
+#     . open and configure all the boards concurrently (thread pool)
+#
+# ------------------------------------------------------------------------------------------------------------
+
+# standard library
+import io
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .utils_tools import Display, StreamSink, ConsoleSink
+from .backend import get_backend
+from .driver import Driver
+from .dcdc import DCDC
+
+class DeviceManager(Display):
+    """
+       Open and configure several boards concurrently
+    """
+
+    def __init__(self,backend_p=None):
+        """init the variable
+
+        Args:
+            backend_p (str or backend instance): 'ok' (default: Opal Kelly boards), 'sim' or an already built backend
+        """
+        # init the parent class
+        super().__init__()
+
+        self._backend = get_backend(backend_p)
+
+        # serial number -> role description (dict)
+        self._role_dict = {}
+
+        # role name -> driver class (the other roles use the Driver class)
+        self._class_by_role = {}
+        self._class_by_role['DCDC'] = DCDC
+
+    def list_serials(self):
+        """List the serial numbers of the connected boards
+
+        Returns:
+            list of str: serial numbers
+        """
+        return self._backend.list_serials()
+
+    def set_role(self,serial_p,role_p,firmware_filepath_p,driver_class_p=None):
+        """Associate a board to a role
+
+        Args:
+            serial_p (str): board serial number
+            role_p (str): role name (ex: 'DCDC', 'FPAsim'). Must be unique
+            firmware_filepath_p (str): path to the FPGA bitstream of this role
+            driver_class_p (class): class of the returned instance (default: DCDC for the 'DCDC' role, Driver otherwise)
+        """
+        if driver_class_p is None:
+            driver_class_p = self._class_by_role.get(role_p, Driver)
+        role = {}
+        role['role'] = role_p
+        role['firmware_filepath'] = firmware_filepath_p
+        role['driver_class'] = driver_class_p
+        self._role_dict[serial_p] = role
+
+    def load_roles(self,filepath_p):
+        """Load the role of each board from a JSON file
+        Example:
+            {"1234000ABC": {"role": "DCDC", "firmware_filepath": "dcdc-fw_002.bit"}}
+
+        Args:
+            filepath_p (str): path to the JSON file
+        """
+        with open(filepath_p, 'r') as file:
+            desc = json.load(file)
+        for serial, role in desc.items():
+            self.set_role(serial, role['role'], role['firmware_filepath'])
+
+    def _open_board(self,serial_p,role_p,force_configure_p,verbosity_p):
+        """Open and configure one board (executed by a thread of the pool)
+
+        Args:
+            serial_p (str): board serial number
+            role_p (dict): role description
+            force_configure_p (bool): True: always configure the FPGA
+            verbosity_p (int): level of verbosity of the returned instance
+
+        Returns:
+            tuple (driver instance, bool, str, float): board, True if the board is ready (see Driver.open),
+                messages printed during the opening, duration (s)
+        """
+        t0 = time.perf_counter()
+        board = role_p['driver_class']()
+        if hasattr(board, 'set_verbosity'):
+            board.set_verbosity(verbosity_p)
+        # buffer the messages: the boards are opened concurrently
+        buffer = io.StringIO()
+        board.set_sink(StreamSink(buffer))
+        try:
+            ready = board.open(role_p['firmware_filepath'], backend_p=self._backend, force_configure_p=force_configure_p, serial_p=serial_p)
+        finally:
+            board.set_sink(ConsoleSink())
+        return board, ready, buffer.getvalue(), time.perf_counter() - t0
+
+    def open_all(self,max_workers_p=None,force_configure_p=False,verbosity_p=0):
+        """Open and configure all the boards with a role, concurrently
+
+        Args:
+            max_workers_p (uint): number of threads (default: one by board)
+            force_configure_p (bool): True: always configure the FPGA
+            verbosity_p (int): level of verbosity of the returned instances
+
+        Returns:
+            dict: role name -> ready board (the boards which are not connected or failed to open/configure are missing)
+        """
+        msg = "DeviceManager: open " + str(len(self._role_dict)) + " board(s)"
+        self.display_title(msg)
+
+        board_dict = {}
+        if len(self._role_dict) == 0:
+            return board_dict
+
+        # enumerate the connected boards once
+        serial_set = set(self.list_serials())
+        job_dict = {}
+        for serial, role in self._role_dict.items():
+            if serial in serial_set:
+                job_dict[serial] = role
+            else:
+                msg = "[KO]: " + role['role'] + " (" + serial + "): board not connected"
+                self.display(msg)
+        if len(job_dict) == 0:
+            return board_dict
+        if max_workers_p is None:
+            max_workers_p = len(job_dict)
+
+        t0 = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max_workers_p, thread_name_prefix="device-manager") as executor:
+            future_dict = {}
+            for serial, role in job_dict.items():
+                future_dict[serial] = executor.submit(self._open_board, serial, role, force_configure_p, verbosity_p)
+
+            for serial, future in future_dict.items():
+                role_name = job_dict[serial]['role']
+                try:
+                    board, ready, str_log, duration = future.result()
+                except Exception as exc:
+                    msg = "[KO]: " + role_name + " (" + serial + "): " + str(exc)
+                    self.display(msg)
+                    continue
+                # print the buffered messages of this board
+                self.display_subtitle(role_name + " (" + serial + "): opened in (s): " + '{0:.3f}'.format(duration))
+                self._sink.write(str_log)
+                if not ready:
+                    msg = "[KO]: " + role_name + " (" + serial + "): the board isn't ready (see the messages above)"
+                    self.display(msg)
+                    continue
+                board_dict[role_name] = board
+
+        msg = "DeviceManager: " + str(len(board_dict)) + "/" + str(len(self._role_dict)) + " boards ready in (s): " + '{0:.3f}'.format(time.perf_counter() - t0)
+        self.display(msg)
+        return board_dict
@@ -31,11 +31,15 @@
 
 import sys
 from pathlib import Path
+from contextlib import contextmanager
+from time import perf_counter
 
 #script_base_path = str(Path(__file__).parents[0])
 #sys.path.append(script_base_path)
 
-from .ok import *
+from .backend import get_backend
+from .fpga_cache import FpgaConfigCache, compute_file_hash
+from .instrumentation import TransactionStats
 from .utils_tools import Display
 
 class Driver(Display):
@@ -49,13 +53,157 @@ class Driver(Display):
         # init the parent class
         super().__init__()
         self.dev = None
+        # device information of the opened board (see the open function)
+        self.device_info = None
 
-    def open(self,firmware_filepath_p):
+        # wire_in batch
+        #######################################
+        # number of opened batches (nested batches are merged into the outermost one)
+        self._batch_depth = 0
+        # True when staged wire_in values are waiting for the UpdateWireIns
+        self._batch_pending = False
+        # address of the first staged wire_in (the batch is recorded with it in the transaction statistics)
+        self._batch_addr = None
+
+        # transaction epoch: incremented on each wire_in write or trigger.
+        # It allows to detect if a wire_out snapshot is older than the last write.
+        self._tx_epoch = 0
+
+        # wire_in shadow cache (see the enable_shadow function)
+        # None: disabled, dict: wire_in address -> last written value
+        self._shadow = None
+
+        # record of the last FPGA configuration by board (see the open function)
+        self._fpga_cache = FpgaConfigCache()
+
+        # transaction statistics (see the enable_stats function)
+        # None: disabled (no overhead except a test), TransactionStats: enabled
+        self._stats = None
+
+        # session recording (see the start_recording function)
+        self._recorder = None
+
+        # pipes: the transfer length must be a multiple of this granularity (expressed in bytes)
+        self._c_PIPE_GRANULARITY = 16
+        # pipes: False if the backend of the opened device can't transfer the pipes (ex: 'remote')
+        self._can_pipe = True
+
+    def _get_register_name(self,kind_p,addr_p):
+        """Get the register name of an address (used by the transaction statistics)
+        Note:
+          . the child classes return the names of their register map
+
+        Args:
+            kind_p (str): transaction kind ('wire_in', 'wire_ins', 'wire_out', 'wire_outs', 'trig_in')
+            addr_p (uint8_t): address
+
+        Returns:
+            str: register name (None: unknown)
+        """
+        return None
+
+    def enable_stats(self,enable_p=True):
+        """Enable/disable the statistics of the USB transactions (set_wire_in, batch flush, get_wire_out(s), set_trig_in)
+        Note:
+          . enabling the statistics resets them
+
+        Args:
+            enable_p (bool): True: enable, False: disable
+        """
+        if enable_p:
+            self._stats = TransactionStats(self._get_register_name)
+        else:
+            self._stats = None
+
+    def stats(self):
+        """Get the statistics of the USB transactions (see the enable_stats function)
+
+        Returns:
+            dict: statistics by kind and address (None: disabled)
+        """
+        if self._stats is None:
+            return None
+        return self._stats.get_stats()
+
+    def dump_stats(self,filepath_p):
+        """Write the statistics of the USB transactions in a JSON file (nothing if disabled)
+
+        Args:
+            filepath_p (str): output filepath
+        """
+        if self._stats is not None:
+            self._stats.dump(filepath_p)
+
+    def start_recording(self,filepath_p):
+        """Log all the following FrontPanel transactions in a binary file (see session_log.py)
+        Note:
+          . the board must be opened (see the open function): the recording wraps the opened device
+
+        Args:
+            filepath_p (str): path to the output log file
+
+        Returns:
+            bool: True if the recording is started, False if no device is opened
+        """
+        if self.dev is None:
+            msg = "[KO]: [driver.start_recording]: no opened device (call open before start_recording): " + filepath_p
+            self.display(msg)
+            return False
+        self.stop_recording()
+        from .session_log import RecordingDevice
+        self._recorder = RecordingDevice(self.dev, filepath_p)
+        self.dev = self._recorder
+        return True
+
+    def stop_recording(self):
+        """Stop the recording (if any) and close the log file
+
+        Returns:
+            uint: number of recorded transactions (0: no recording)
+        """
+        recorder = self._recorder
+        if recorder is None:
+            return 0
+        self._recorder = None
+        self.dev = recorder.close()
+        return recorder.nb_records
+
+    def _read_firmware_ids(self):
+        """Read the firmware identifiers used to check the loaded firmware (fast attach)
+        Note:
+          . the child classes return their identifier registers (ex: HARDWARE_ID, FIRMWARE_NAME, FIRMWARE_ID)
+
+        Returns:
+            list of uint32_t: firmware identifiers (None: not available)
+        """
+        return None
+
+    def _sync_wire_ins(self):
+        """Align the FrontPanel wire_in buffer with the board after a fast attach
+        Note:
+          . the child classes read back their wire_in registers (ex: through the wire_out mirrors)
+        """
+        pass
+
+    def open(self,firmware_filepath_p,backend_p=None,force_configure_p=False,serial_p=None):
         """Load the firmware in the FPGA
+        Note:
+          . fast attach: the FPGA configuration is skipped if the board already runs the firmware:
+            same .bit file hash as recorded at the last configuration of this board and same firmware identifiers
+          . a backend without the configuration capability (can_configure = False, ex: 'remote') never loads the firmware
 
         Args:
             firmware_filepath_p (file): path to the FPGA bitstream (firmware file)
+            backend_p (str or backend instance): 'ok' (default: Opal Kelly board), 'sim' (simulated board)
+                or an already built backend (ex: SimBackend(latency_p=100e-6))
+            force_configure_p (bool): True: always configure the FPGA
+            serial_p (str): serial number of the board to open (None: first board found)
+
+        Returns:
+            bool: True if the board is ready (FPGA configured or already running the firmware), False otherwise
         """
+        backend = get_backend(backend_p)
+
         # print("********************************************************")
         # print("** Opal Kelly Board Info:")
         # print("********************************************************")
@@ -63,14 +211,15 @@ class Driver(Display):
         self.display_title(msg)
 
 
-        # Open the first device we find.
-        dev = ok.FrontPanelDevices().Open()
+        # Open the selected device (default: the first device we find).
+        dev = backend.open_device(serial_p)
         if not dev:
             # print ("A device could not be opened.  Is one connected?")
             msg = "[KO]: A device could not be opened.  Is one connected?"
             self.display(msg)
+            return False
 
-        devInfo = ok.okTDeviceInfo()
+        devInfo = backend.new_device_info()
         if (dev.NoError != dev.GetDeviceInfo(devInfo)):
             # print ("Unable to retrieve device information.")
             msg = "[KO]: Unable to retrieve device information."
@@ -87,6 +236,32 @@ class Driver(Display):
         msg_list.append("       Device ID: %s" % devInfo.deviceID)
         self.display(msg_list)
 
+        self.dev = dev
+        self.device_info = devInfo
+        self._can_pipe = getattr(backend, 'can_pipe', True)
+        # the wire_in values of the previous device are meaningless
+        if self._shadow is not None:
+            self._shadow = {}
+
+        serial = devInfo.serialNumber
+
+        # shared board (ex: RemoteBackend): the owner of the board loads the firmware.
+        # The configuration cache is not used: it describes the boards configured by this computer
+        if not getattr(backend, 'can_configure', True):
+            msg = "[OK]: FPGA configuration owned by the " + backend.name + " backend (not loaded): " + firmware_filepath_p
+            self.display(msg)
+            self._sync_wire_ins()
+            return True
+
+        bit_hash = compute_file_hash(firmware_filepath_p)
+
+        # fast attach: check the firmware already running
+        if (not force_configure_p) and self._is_firmware_loaded(serial, firmware_filepath_p, bit_hash):
+            msg = "[OK]: FPGA firmware already loaded (configuration skipped): "+ firmware_filepath_p
+            self.display(msg)
+            self._sync_wire_ins()
+            return True
+
         # Configures the PLL with settings stored in EEPROM.
         dev.LoadDefaultPLLConfiguration()
 
@@ -95,6 +270,8 @@ class Driver(Display):
             # print ("FPGA configuration failed.")
             msg = "[KO]: Load FPGA firmware: "+ firmware_filepath_p
             self.display(msg)
+            self._fpga_cache.remove(serial)
+            return False
         else:
             msg = "[OK]: Load FPGA firmware: "+ firmware_filepath_p
             self.display(msg)
@@ -104,23 +281,182 @@ class Driver(Display):
             # print ("FrontPanel support is not available.")
             msg = "[KO]: FrontPanel support is not available."
             self.display(msg)
+            self._fpga_cache.remove(serial)
+            return False
 
+        # record the configuration for the next fast attach
+        if bit_hash is not None:
+            self._fpga_cache.set(serial, firmware_filepath_p, bit_hash, self._read_firmware_ids())
+        return True
 
-        self.dev = dev
+    def _is_firmware_loaded(self,serial_p,firmware_filepath_p,bit_hash_p):
+        """Check if the board already runs the firmware
 
-    def set_wire_in(self,addr_p,value_p):
+        Args:
+            serial_p (str): board serial number
+            firmware_filepath_p (file): path to the FPGA bitstream (firmware file)
+            bit_hash_p (str): hash of the FPGA bitstream
+
+        Returns:
+            bool: True if the FPGA configuration can be skipped
+        """
+        if bit_hash_p is None:
+            return False
+        record = self._fpga_cache.get(serial_p)
+        if (record is None) or (record.get('bit_hash') != bit_hash_p):
+            return False
+        if False == self.dev.IsFrontPanelEnabled():
+            return False
+        firmware_ids = self._read_firmware_ids()
+        if firmware_ids != record.get('firmware_ids'):
+            return False
+        return True
+
+    def start_batch(self):
+        """Open a wire_in batch.
+        Note:
+          . until the matching end_batch call, set_wire_in only stages the values
+          . nested batches are allowed: only the outermost end_batch sends the values
+        """
+        self._batch_depth += 1
+
+    def end_batch(self):
+        """Close a wire_in batch.
+        Note:
+          . when the outermost batch is closed, all staged values are sent with a single UpdateWireIns
+        """
+        if self._batch_depth > 0:
+            self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self.flush_wire_ins()
+
+    @contextmanager
+    def batch(self):
+        """Context manager grouping wire_in writes into one USB transaction.
+
+        Example:
+            with board.batch():
+                board.set_ctrl(0)
+                board.set_power_conf(1,1,0,0)
+                board.set_debug_ctrl(0,0)
+
+        Yields:
+            Driver: this instance
+        """
+        self.start_batch()
+        try:
+            yield self
+        finally:
+            self.end_batch()
+
+    def flush_wire_ins(self):
+        """Send the staged wire_in values (if any) with a single UpdateWireIns.
+        Note:
+          . with the statistics, the UpdateWireIns is recorded as one 'wire_ins' transaction
+        """
+        if self._batch_pending:
+            self._batch_pending = False
+            stats = self._stats
+            if stats is None:
+                self.dev.UpdateWireIns()
+            else:
+                t0 = perf_counter()
+                self.dev.UpdateWireIns()
+                stats.record('wire_ins', self._batch_addr, perf_counter() - t0)
+
+    def enable_shadow(self,enable_p=True):
+        """Enable/disable the wire_in shadow cache.
+        Note:
+          . the shadow cache records the last value written to each wire_in address
+          . when enabled, set_wire_in skips the USB transaction if the register value is unchanged
+
+        Args:
+            enable_p (bool): True: enable (the cache starts empty), False: disable
+        """
+        if enable_p:
+            self._shadow = {}
+        else:
+            self._shadow = None
+
+    def get_shadow(self,addr_p):
+        """Get the last value written to a wire_in address (no USB access)
+
+        Args:
+            addr_p (uint8_t): address of the wire_in
+
+        Returns:
+            uint32_t: last written value. None if unknown or if the shadow cache is disabled
+        """
+        if self._shadow is None:
+            return None
+        return self._shadow.get(addr_p)
+
+    def load_shadow(self,addr_p,value_p):
+        """Set the known value of a wire_in address without USB transaction.
+        Note:
+          . used to resynchronize the shadow cache (and the FrontPanel wire_in buffer) with the board
+          . a shared device (ex: RemoteDevice) has no local wire_in buffer: SeedWireInValue only records
+            the value locally (a SetWireInValue would be sent by the next UpdateWireIns)
+
+        Args:
+            addr_p (uint8_t): address of the wire_in
+            value_p (uint32_t): current register value
+        """
+        seed_wire_in = getattr(self.dev, 'SeedWireInValue', None)
+        if seed_wire_in is None:
+            self.dev.SetWireInValue(addr_p,value_p)
+        else:
+            seed_wire_in(addr_p,value_p)
+        if self._shadow is not None:
+            self._shadow[addr_p] = value_p
+
+    def set_wire_in(self,addr_p,value_p,mask_p=0xFFFF_FFFF):
         """configure a USB wire (register)
+        Note:
+          . inside a batch, the value is only staged (see the batch function)
+          . with the shadow cache, the write is skipped if the register value is unchanged
 
         Args:
             addr_p (uint8_t): address of the wire_in
             value_p (uint32_t): value to write
+            mask_p (uint32_t): only the bits set to 1 are modified
         """
 
-        self.dev.SetWireInValue(addr_p,value_p)
+        shadow = self._shadow
+        if shadow is not None:
+            value_old = shadow.get(addr_p)
+            if value_old is not None:
+                value_new = (value_old & ~mask_p & 0xFFFF_FFFF) | (value_p & mask_p)
+                if value_new == value_old:
+                    # unchanged register value => nothing to send
+                    return
+                shadow[addr_p] = value_new
+            elif mask_p == 0xFFFF_FFFF:
+                shadow[addr_p] = value_p
+
+        self._tx_epoch += 1
+        if self._batch_depth > 0:
+            # staged value: no USB transaction (see the flush_wire_ins function)
+            self.dev.SetWireInValue(addr_p,value_p,mask_p)
+            if not self._batch_pending:
+                self._batch_pending = True
+                self._batch_addr = addr_p
+            return
+
+        stats = self._stats
+        if stats is not None:
+            t0 = perf_counter()
+
+        self.dev.SetWireInValue(addr_p,value_p,mask_p)
         self.dev.UpdateWireIns()
 
+        if stats is not None:
+            stats.record('wire_in', addr_p, perf_counter() - t0)
+
     def get_wire_out(self,addr_p):
         """ Retreive a USB wire value (register)
+        Note:
+          . the staged wire_in values (if any) are sent before the reading
 
         Args:
             addr_p (uint8_t): address of the wire_out
@@ -128,18 +464,272 @@ class Driver(Display):
         Returns:
             uint32_t: read register value.
         """
+        stats = self._stats
+        if stats is not None:
+            t0 = perf_counter()
+
+        self.flush_wire_ins()
         self.dev.UpdateWireOuts()
         result = self.dev.GetWireOutValue(addr_p)
+
+        if stats is not None:
+            stats.record('wire_out', addr_p, perf_counter() - t0)
         return result
 
+    def get_wire_outs(self,addr_list_p):
+        """ Retrieve several USB wire values (registers) with a single UpdateWireOuts
+        Note:
+          . all the values are sampled at the same time
+          . the staged wire_in values (if any) are sent before the reading
+
+        Args:
+            addr_list_p (list of uint8_t): addresses of the wire_out
+
+        Returns:
+            list of uint32_t: read register values (same order as addr_list_p)
+        """
+        stats = self._stats
+        if stats is not None:
+            t0 = perf_counter()
+
+        self.flush_wire_ins()
+        self.dev.UpdateWireOuts()
+        dev = self.dev
+        result = [dev.GetWireOutValue(addr) for addr in addr_list_p]
+
+        if stats is not None:
+            # recorded with the address of the first register
+            stats.record('wire_outs', addr_list_p[0] if addr_list_p else None, perf_counter() - t0)
+        return result
+
+
+    def write_pipe(self,addr_p,data_p,block_size_p=None,chunk_size_p=None):
+        """Write a buffer to a pipe_in (or block pipe_in) without intermediate copy
+        Note:
+          . data_p can be any C-contiguous buffer: bytes, bytearray, memoryview, numpy.ndarray, ...
+          . the staged wire_in values (if any) are sent before the transfer
+          . FrontPanel constraint: the transfer length must be a multiple of 16 bytes (USB3)
+            and a multiple of block_size_p for a block pipe
+
+        Args:
+            addr_p (uint8_t): address of the pipe_in (0x80-0x9F)
+            data_p (buffer): data to write
+            block_size_p (uint): None: pipe_in, otherwise: block pipe_in with this block size (expressed in bytes)
+            chunk_size_p (uint): None: single transfer, otherwise: maximal size of each transfer (expressed in bytes)
+
+        Returns:
+            int: number of transferred bytes (negative FrontPanel error code in case of error)
+
+        Raises:
+            ValueError: invalid transfer length, block size or chunk size (see _check_pipe_length)
+                or backend without pipe (see _check_pipe_support)
+        """
+        self._check_pipe_support("write_pipe")
+        view = _convert_to_byte_view(data_p)
+        self._check_pipe_length(len(view), block_size_p, chunk_size_p, "write_pipe")
+        self.flush_wire_ins()
+        self._tx_epoch += 1
+        if block_size_p is None:
+            func = lambda part: self.dev.WriteToPipeIn(addr_p, part)
+        else:
+            func = lambda part: self.dev.WriteToBlockPipeIn(addr_p, block_size_p, part)
+        return self._transfer_pipe(func, view, block_size_p, chunk_size_p, "write_pipe")
+
+    def read_pipe(self,addr_p,data_p,block_size_p=None,chunk_size_p=None):
+        """Read a pipe_out (or block pipe_out) directly into a buffer (no intermediate copy)
+        Note:
+          . data_p can be any writable C-contiguous buffer: bytearray, memoryview, numpy.ndarray, ...
+            The number of bytes to read is the buffer size
+          . the staged wire_in values (if any) are sent before the transfer
+          . FrontPanel constraint: the transfer length must be a multiple of 16 bytes (USB3)
+            and a multiple of block_size_p for a block pipe
+
+        Args:
+            addr_p (uint8_t): address of the pipe_out (0xA0-0xBF)
+            data_p (buffer): buffer to fill
+            block_size_p (uint): None: pipe_out, otherwise: block pipe_out with this block size (expressed in bytes)
+            chunk_size_p (uint): None: single transfer, otherwise: maximal size of each transfer (expressed in bytes)
+
+        Returns:
+            int: number of transferred bytes (negative FrontPanel error code in case of error)
+
+        Raises:
+            ValueError: invalid transfer length, block size or chunk size (see _check_pipe_length)
+                or backend without pipe (see _check_pipe_support)
+        """
+        self._check_pipe_support("read_pipe")
+        view = _convert_to_byte_view(data_p)
+        self._check_pipe_length(len(view), block_size_p, chunk_size_p, "read_pipe")
+        self.flush_wire_ins()
+        if block_size_p is None:
+            func = lambda part: self.dev.ReadFromPipeOut(addr_p, part)
+        else:
+            func = lambda part: self.dev.ReadFromBlockPipeOut(addr_p, block_size_p, part)
+        return self._transfer_pipe(func, view, block_size_p, chunk_size_p, "read_pipe")
+
+    def iter_read_pipe(self,addr_p,nb_bytes_p,chunk_size_p,block_size_p=None):
+        """Stream a pipe_out by chunks. A single buffer is allocated and reused for all the chunks.
+        Note:
+          . each yielded memoryview is overwritten by the next chunk: copy it if it must be kept
+
+        Args:
+            addr_p (uint8_t): address of the pipe_out (0xA0-0xBF)
+            nb_bytes_p (uint): total number of bytes to read
+            chunk_size_p (uint): size of each chunk (expressed in bytes)
+            block_size_p (uint): None: pipe_out, otherwise: block pipe_out with this block size (expressed in bytes)
+
+        Yields:
+            memoryview: read chunk (with a block size, a chunk is rounded down to whole blocks)
+
+        Raises:
+            ValueError: invalid total length, block size or chunk size (see _check_pipe_length)
+                or backend without pipe (see _check_pipe_support)
+            RuntimeError: FrontPanel error or short transfer (the stream is truncated)
+        """
+        self._check_pipe_support("iter_read_pipe")
+        self._check_pipe_length(nb_bytes_p, block_size_p, chunk_size_p, "iter_read_pipe")
+        chunk_size = self._get_pipe_chunk_size(nb_bytes_p, block_size_p, chunk_size_p)
+        buffer = bytearray(min(chunk_size, nb_bytes_p))
+        view = memoryview(buffer)
+        offset = 0
+        while offset < nb_bytes_p:
+            part = view[:min(chunk_size, nb_bytes_p - offset)]
+            ret = self.read_pipe(addr_p, part, block_size_p=block_size_p)
+            if ret != len(part):
+                # the caller must be able to distinguish a truncated stream from a complete one
+                raise RuntimeError("[driver.iter_read_pipe]: stream truncated after " + str(offset + max(ret, 0)) + " of " + str(nb_bytes_p) + " bytes (return code: " + str(ret) + ")")
+            offset += len(part)
+            yield part
+
+    def _get_pipe_chunk_size(self,nb_bytes_p,block_size_p,chunk_size_p):
+        """Get the size of each transfer of a pipe
+        Note:
+          . with a block size, a chunk is made of whole blocks (the chunk size is rounded down, 1 block at least)
+
+        Args:
+            nb_bytes_p (uint): total transfer length (expressed in bytes)
+            block_size_p (uint): block size (None: no block)
+            chunk_size_p (uint): maximal size of each transfer (None: single transfer)
+
+        Returns:
+            uint: size of each transfer (expressed in bytes)
+        """
+        if chunk_size_p is None:
+            return nb_bytes_p
+        if block_size_p is None:
+            return chunk_size_p
+        return max(block_size_p, chunk_size_p - chunk_size_p % block_size_p)
+
+    def _transfer_pipe(self,func_p,view_p,block_size_p,chunk_size_p,func_name_p):
+        """Transfer a byte view by chunks
+
+        Args:
+            func_p (function): transfer function of one chunk (argument: memoryview)
+            view_p (memoryview): data to transfer (format 'B')
+            block_size_p (uint): block size (None: no block)
+            chunk_size_p (uint): maximal size of each transfer (None: single transfer)
+            func_name_p (str): caller name (for the error message)
+
+        Returns:
+            int: number of transferred bytes (negative FrontPanel error code in case of error).
+                A short transfer stops the transfer: the returned value is lower than the buffer size
+        """
+        nb_bytes = len(view_p)
+        chunk_size = self._get_pipe_chunk_size(nb_bytes, block_size_p, chunk_size_p)
+
+        offset = 0
+        while offset < nb_bytes:
+            part = view_p[offset:offset + chunk_size]
+            ret = func_p(part)
+            if ret < 0:
+                msg = "[KO]: [driver." + func_name_p + "]: FrontPanel error code: " + str(ret)
+                self.display(msg)
+                return ret
+            offset += ret
+            if ret < len(part):
+                msg = "[KO]: [driver." + func_name_p + "]: short transfer: " + str(offset) + " of " + str(nb_bytes) + " bytes"
+                self.display(msg)
+                break
+        return offset
+
+    def _check_pipe_support(self,func_name_p):
+        """Check that the backend of the opened device transfers the pipes
+
+        Args:
+            func_name_p (str): caller name (for the error message)
+
+        Raises:
+            ValueError: the backend has no pipe (can_pipe = False, ex: 'remote')
+        """
+        if not self._can_pipe:
+            msg = "[KO]: [driver." + func_name_p + "]: the backend of the device doesn't support the pipes"
+            self.display(msg)
+            raise ValueError(msg)
+
+    def _check_pipe_length(self,nb_bytes_p,block_size_p,chunk_size_p,func_name_p):
+        """Check the FrontPanel length constraints of a pipe transfer before any USB transaction
+
+        Args:
+            nb_bytes_p (uint): total transfer length (expressed in bytes)
+            block_size_p (uint): block size (None: no block)
+            chunk_size_p (uint): maximal size of each transfer (None: single transfer)
+            func_name_p (str): caller name (for the error message)
+
+        Raises:
+            ValueError: the total length or the block size isn't a multiple of the pipe granularity (16 bytes),
+                the total length isn't a multiple of the block size or the chunk size isn't strictly positive.
+                Without block, the chunk size must also be a multiple of the pipe granularity
+                (with a block size, a chunk is rounded down to whole blocks)
+        """
+        granularity = self._c_PIPE_GRANULARITY
+        prefix = "[driver." + func_name_p + "]: "
+        if nb_bytes_p % granularity != 0:
+            raise ValueError(prefix + "the transfer length (" + str(nb_bytes_p) + " bytes) must be a multiple of " + str(granularity) + " bytes")
+        if block_size_p is not None:
+            if (block_size_p <= 0) or (block_size_p % granularity != 0):
+                raise ValueError(prefix + "the block size (" + str(block_size_p) + " bytes) must be a strictly positive multiple of " + str(granularity) + " bytes")
+            if nb_bytes_p % block_size_p != 0:
+                raise ValueError(prefix + "the transfer length (" + str(nb_bytes_p) + " bytes) must be a multiple of the block size (" + str(block_size_p) + " bytes)")
+        if chunk_size_p is not None:
+            if chunk_size_p <= 0:
+                raise ValueError(prefix + "the chunk size (" + str(chunk_size_p) + " bytes) must be strictly positive")
+            if (block_size_p is None) and (chunk_size_p % granularity != 0):
+                raise ValueError(prefix + "the chunk size (" + str(chunk_size_p) + " bytes) must be a multiple of " + str(granularity) + " bytes")
 
     def set_trig_in(self,addr_p,index_bit_p):
         """configure a USB wire (register)
+        Note:
+          . the staged wire_in values (if any) are sent before the trigger
 
         Args:
             addr_p (uint8_t): address of the trig_in
             value_p (uint32_t): index bit to trig
         """
 
+        stats = self._stats
+        if stats is not None:
+            t0 = perf_counter()
+
+        self.flush_wire_ins()
+        self._tx_epoch += 1
         self.dev.ActivateTriggerIn(addr_p,index_bit_p)
 
+        if stats is not None:
+            stats.record('trig_in', addr_p, perf_counter() - t0)
+
+
+def _convert_to_byte_view(data_p):
+    """Get a flat byte view of a buffer (no copy)
+
+    Args:
+        data_p (buffer): C-contiguous buffer (bytes, bytearray, memoryview, numpy.ndarray, ...)
+
+    Returns:
+        memoryview: 1-D view with the 'B' format
+    """
+    view = memoryview(data_p)
+    if not view.c_contiguous:
+        raise ValueError("the pipe buffer must be C-contiguous")
+    if (view.format != 'B') or (view.ndim != 1):
+        view = view.cast('B')
+    return view
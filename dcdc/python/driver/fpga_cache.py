@@ -0,0 +1,193 @@
+# ------------------------------------------------------------------------------------------------------------
+#                            Copyright (C) 2024-2030 Ken-ji de la ROSA, IRAP Toulouse.
+# ------------------------------------------------------------------------------------------------------------
+#                            This file is part of the ATHENA X-IFU DRE Telemetry and Telecommand Firmware.
+#
+#                            dcdc-hk-fw is free software: you can redistribute it and/or modify
+#                            it under the terms of the GNU General Public License as published by
+#                            the Free Software Foundation, either version 3 of the License, or
+#                            (at your option) any later version.
+#
+#                            This program is distributed in the hope that it will be useful,
+#                            but WITHOUT ANY WARRANTY; without even the implied warranty of
+#                            MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#                            GNU General Public License for more details.
+#
+#                            You should have received a copy of the GNU General Public License
+#                            along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------------------------------------
+#    email                   kenji.delarosa@alten.com
+#    @file                   fpga_cache.py
+# -------------------------------------------------------------------------------------------------------------
+#    Automatic Generation    No
+#    Code Rules Reference    N/A
+# -------------------------------------------------------------------------------------------------------------
+#   @details
+#
+#   Record, by board serial number, the firmware loaded at the last FPGA configuration:
+#     . hash of the .bit file
+#     . firmware identifiers read just after the configuration (ex: HARDWARE_ID, FIRMWARE_NAME, FIRMWARE_ID)
+#   It allows the Driver class to skip the FPGA configuration when the board already runs the firmware.
+#
+# ------------------------------------------------------------------------------------------------------------
+
+# standard library
+import os
+import json
+import hashlib
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+# inter-process lock of the cache file
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+# default cache filepath
+default_cache_filepath = str(Path.home() / '.sgse-tools' / 'fpga_config_cache.json')
+
+def compute_file_hash(filepath_p):
+    """Compute the hash of a file
+
+    Args:
+        filepath_p (str): path to the file
+
+    Returns:
+        str: hexadecimal hash (None if the file can't be read)
+    """
+    hash_obj = hashlib.blake2b(digest_size=16)
+    try:
+        with open(filepath_p, 'rb') as file:
+            for chunk in iter(lambda: file.read(1 << 20), b''):
+                hash_obj.update(chunk)
+    except OSError:
+        return None
+    return hash_obj.hexdigest()
+
+# intra-process lock: the file locks don't exclude the threads of a same process on all the platforms
+_cache_lock = threading.Lock()
+
+@contextmanager
+def _lock_file(filepath_p):
+    """Lock a cache file (threads of this process and other processes) during a read-modify-write
+
+    Args:
+        filepath_p (str): cache filepath (the lock file is filepath_p + '.lock')
+    """
+    with _cache_lock:
+        try:
+            Path(filepath_p).parent.mkdir(parents=True, exist_ok=True)
+            lock_file = open(filepath_p + '.lock', 'a+')
+        except OSError:
+            # no lock file (ex: read-only directory): only the threads are excluded
+            yield
+            return
+        try:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            elif msvcrt is not None:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            elif msvcrt is not None:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+            lock_file.close()
+
+class FpgaConfigCache:
+    """
+       Board serial number -> record of the last FPGA configuration (JSON file)
+    """
+
+    def __init__(self,filepath_p=None):
+        """init the variable
+
+        Args:
+            filepath_p (str): cache filepath (default: ~/.sgse-tools/fpga_config_cache.json)
+        """
+        if filepath_p is None:
+            filepath_p = default_cache_filepath
+        self.filepath = filepath_p
+
+    def _load(self):
+        """Load the whole cache
+
+        Returns:
+            dict: serial number -> record
+        """
+        try:
+            with open(self.filepath, 'r') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def get(self,serial_p):
+        """Get the record of a board
+
+        Args:
+            serial_p (str): board serial number
+
+        Returns:
+            dict: record (keys: firmware_filepath, bit_hash, firmware_ids). None if unknown
+        """
+        return self._load().get(serial_p)
+
+    def set(self,serial_p,firmware_filepath_p,bit_hash_p,firmware_ids_p):
+        """Record the FPGA configuration of a board
+
+        Args:
+            serial_p (str): board serial number
+            firmware_filepath_p (str): path to the loaded .bit file
+            bit_hash_p (str): hash of the .bit file
+            firmware_ids_p (list of uint32_t): firmware identifiers read after the configuration (None: not available)
+        """
+        record = {}
+        record['firmware_filepath'] = str(firmware_filepath_p)
+        record['bit_hash'] = bit_hash_p
+        record['firmware_ids'] = firmware_ids_p
+        with _lock_file(self.filepath):
+            cache = self._load()
+            cache[serial_p] = record
+            self._write(cache)
+
+    def remove(self,serial_p):
+        """Forget the record of a board (ex: after a failed configuration)
+
+        Args:
+            serial_p (str): board serial number
+        """
+        with _lock_file(self.filepath):
+            cache = self._load()
+            if cache.pop(serial_p, None) is not None:
+                self._write(cache)
+
+    def _write(self,cache_p):
+        """Replace the cache file atomically (unique temporary file then rename)
+        Note:
+          . the caller holds the file lock
+
+        Args:
+            cache_p (dict): serial number -> record
+        """
+        directory = Path(self.filepath).parent
+        tmp_filepath = None
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_filepath = tempfile.mkstemp(dir=str(directory), prefix=Path(self.filepath).name + '.', suffix='.tmp')
+            with os.fdopen(fd, 'w') as file:
+                json.dump(cache_p, file, indent=2)
+            os.replace(tmp_filepath, self.filepath)
+        except OSError:
+            # the cache is optional: a write failure only disables the next fast attach
+            if tmp_filepath is not None and os.path.exists(tmp_filepath):
+                os.remove(tmp_filepath)
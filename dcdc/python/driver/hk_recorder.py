@@ -0,0 +1,225 @@
+# ------------------------------------------------------------------------------------------------------------
+#                            Copyright (C) 2024-2030 Ken-ji de la ROSA, IRAP Toulouse.
+# ------------------------------------------------------------------------------------------------------------
+#                            This file is part of the ATHENA X-IFU DRE Telemetry and Telecommand Firmware.
+#
+#                            dcdc-hk-fw is free software: you can redistribute it and/or modify
+#                            it under the terms of the GNU General Public License as published by
+#                            the Free Software Foundation, either version 3 of the License, or
+#                            (at your option) any later version.
+#
+#                            This program is distributed in the hope that it will be useful,
+#                            but WITHOUT ANY WARRANTY; without even the implied warranty of
+#                            MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#                            GNU General Public License for more details.
+#
+#                            You should have received a copy of the GNU General Public License
+#                            along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------------------------------------
+#    email                   kenji.delarosa@alten.com
+#    @file                   hk_recorder.py
+# -------------------------------------------------------------------------------------------------------------
+#    Automatic Generation    No
+#    Code Rules Reference    N/A
+# -------------------------------------------------------------------------------------------------------------
+#   @details
+#
+#   Continuous housekeeping recorder of the DCDC board.
+#   At a fixed rate, the recorder:
+#     . triggers the ADC acquisition and waits for the end of the acquisition
+#     . reads ADC0..ADC7, POWER_ADC_STATUS, STATUS and ERRORS (one wire-out update)
+#     . appends a fixed-size record (see HK_DTYPE) with a monotonic timestamp to a binary file
+#   A frame acquired after an ADC timeout is still recorded (the periodic status/errors remain valid)
+#   but its adc_latency field is negative: its ADC codes are the ones of a previous acquisition.
+#   The binary files have no header: a file can be memory-mapped with load_hk_file.
+#   A new file is started when the current file reaches a maximal size or a maximal duration.
+#
+# ------------------------------------------------------------------------------------------------------------
+
+# standard library
+import os
+import time
+from pathlib import Path
+
+# numpy
+import numpy as np
+
+from .utils_tools import Display
+
+# record of one housekeeping frame (little endian, packed)
+HK_DTYPE = np.dtype([
+    ('timestamp', '<f8'),             # time.monotonic() (expressed in s)
+    ('adc', '<u2', (8,)),             # ADC0..ADC7 codes
+    ('power_adc_status', '<u4'),
+    ('status', '<u4'),
+    ('errors', '<u4'),
+    ('adc_latency', '<f4'),           # ADC acquisition latency (expressed in s). < 0: ADC timeout (stale ADC codes)
+])
+
+def load_hk_file(filepath_p):
+    """Memory-map a housekeeping file
+
+    Args:
+        filepath_p (str): path to a file written by HkRecorder
+
+    Returns:
+        np.memmap: array of HK_DTYPE records (read-only)
+    """
+    # a file truncated by a crash is trimmed to its last complete record
+    nb_records = os.path.getsize(filepath_p) // HK_DTYPE.itemsize
+    if nb_records == 0:
+        return np.zeros(0, dtype=HK_DTYPE)
+    return np.memmap(filepath_p, dtype=HK_DTYPE, mode='r', shape=(nb_records,))
+
+class HkRecorder(Display):
+    """
+       Record the DCDC housekeeping to rotating binary files
+    """
+
+    def __init__(self,dcdc_p,output_dir_p,rate_p=1.0,max_file_size_p=64*1024*1024,max_file_duration_p=3600.0,prefix_p='dcdc_hk'):
+        """init the variable
+
+        Args:
+            dcdc_p (DCDC): opened DCDC board
+            output_dir_p (str): directory of the output files
+            rate_p (float): number of frames by second
+            max_file_size_p (uint): maximal size of one file (expressed in bytes)
+            max_file_duration_p (float): maximal duration of one file (expressed in s)
+            prefix_p (str): prefix of the output filenames (<prefix>_<YYYYmmdd_HHMMSS>_<index>.bin)
+        """
+        # init the parent class
+        super().__init__()
+
+        self.dcdc = dcdc_p
+        self._output_dir = Path(output_dir_p)
+        self._period = 1.0 / rate_p
+        # the maximal size is a whole number of records
+        self._max_file_nb_records = max(1, max_file_size_p // HK_DTYPE.itemsize)
+        self._max_file_duration = max_file_duration_p
+        self._prefix = prefix_p
+
+        # wire-out addresses: ADC0..ADC7, POWER_ADC_STATUS, STATUS, ERRORS
+        addr_wire_out = self.dcdc._addr_wire_out
+        self._addr_list = [addr_wire_out['ADC' + str(i)] for i in range(8)]
+        self._addr_list.append(addr_wire_out['POWER_ADC_STATUS'])
+        self._addr_list.append(addr_wire_out['STATUS'])
+        self._addr_list.append(addr_wire_out['ERRORS'])
+
+        # one record buffer, re-used for each frame
+        self._record = np.zeros(1, dtype=HK_DTYPE)
+
+        self._file = None
+        self._file_index = 0
+        self._file_nb_records = 0
+        self._file_t0 = 0
+        self.filepath_list = []
+        self.nb_frames = 0
+        self.nb_timeouts = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self,exc_type,exc_value,traceback):
+        self.close()
+
+    def _open_file(self,now_p):
+        """Close the current file and start a new one
+
+        Args:
+            now_p (float): time.monotonic() of the first record
+        """
+        self.close()
+        self._output_dir.mkdir(parents=True, exist_ok=True)
+        filename = self._prefix + '_' + time.strftime('%Y%m%d_%H%M%S') + '_' + '{0:04d}'.format(self._file_index) + '.bin'
+        filepath = str(Path(self._output_dir, filename))
+        self._file = open(filepath, 'wb')
+        self._file_index += 1
+        self._file_nb_records = 0
+        self._file_t0 = now_p
+        self.filepath_list.append(filepath)
+
+        msg = "HkRecorder: new file: " + filepath
+        self.display(msg)
+
+    def close(self):
+        """
+          Close the current file
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def record_frame(self):
+        """Acquire one housekeeping frame and append it to the current file
+
+        Returns:
+            np.void: copy of the recorded frame (HK_DTYPE)
+        """
+        latency = self.dcdc.set_adc_wait()
+        if latency < 0:
+            self.nb_timeouts += 1
+        value_list = self.dcdc.get_wire_outs(self._addr_list)
+        now = time.monotonic()
+
+        record = self._record[0]
+        record['timestamp'] = now
+        record['adc'] = value_list[0:8]
+        record['power_adc_status'] = value_list[8]
+        record['status'] = value_list[9]
+        record['errors'] = value_list[10]
+        record['adc_latency'] = latency
+
+        # rotation
+        if (self._file is None) or (self._file_nb_records >= self._max_file_nb_records) or (now - self._file_t0 >= self._max_file_duration):
+            self._open_file(now)
+        self._file.write(self._record.tobytes())
+        self._file_nb_records += 1
+        self.nb_frames += 1
+        # the record buffer is re-used by the next frame
+        return record.copy()
+
+    def run(self,duration_p=None,nb_frames_p=None):
+        """Record frames at the configured rate until the duration or the number of frames is reached
+        Note:
+          . a late frame doesn't shift the next ones: the missed periods are skipped
+          . KeyboardInterrupt (Ctrl+C) stops the recording properly
+
+        Args:
+            duration_p (float): recording duration (expressed in s). None: no limit
+            nb_frames_p (uint): number of frames to record. None: no limit
+
+        Returns:
+            uint: number of recorded frames
+        """
+        period = self._period
+        t_start = time.monotonic()
+        t_next = t_start
+        nb_frames = 0
+        try:
+            while True:
+                if (nb_frames_p is not None) and (nb_frames >= nb_frames_p):
+                    break
+                if (duration_p is not None) and (time.monotonic() - t_start >= duration_p):
+                    break
+                self.record_frame()
+                nb_frames += 1
+                if self._file_nb_records % 64 == 0:
+                    self._file.flush()
+
+                t_next += period
+                now = time.monotonic()
+                if t_next < now:
+                    # skip the missed periods
+                    t_next += ((now - t_next) // period + 1) * period
+                time.sleep(t_next - now)
+        except KeyboardInterrupt:
+            msg = "HkRecorder: stopped by the user"
+            self.display(msg)
+        finally:
+            self.close()
+
+        msg_list = []
+        msg_list.append("HkRecorder: recorded frames: " + str(nb_frames) + " (in (s): " + '{0:.3f}'.format(time.monotonic() - t_start) + ")")
+        msg_list.append("HkRecorder: ADC timeouts: " + str(self.nb_timeouts))
+        self.display(msg_list)
+        return nb_frames
@@ -0,0 +1,130 @@
+# ------------------------------------------------------------------------------------------------------------
+#                            Copyright (C) 2024-2030 Ken-ji de la ROSA, IRAP Toulouse.
+# ------------------------------------------------------------------------------------------------------------
+#                            This file is part of the ATHENA X-IFU DRE Telemetry and Telecommand Firmware.
+#
+#                            dcdc-hk-fw is free software: you can redistribute it and/or modify
+#                            it under the terms of the GNU General Public License as published by
+#                            the Free Software Foundation, either version 3 of the License, or
+#                            (at your option) any later version.
+#
+#                            This program is distributed in the hope that it will be useful,
+#                            but WITHOUT ANY WARRANTY; without even the implied warranty of
+#                            MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#                            GNU General Public License for more details.
+#
+#                            You should have received a copy of the GNU General Public License
+#                            along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------------------------------------
+#    email                   kenji.delarosa@alten.com
+#    @file                   instrumentation.py
+# -------------------------------------------------------------------------------------------------------------
+#    Automatic Generation    No
+#    Code Rules Reference    N/A
+# -------------------------------------------------------------------------------------------------------------
+#   @details
+#
+#   Per-register statistics of the USB transactions (see Driver.enable_stats):
+#     . number of calls, total/min/max duration
+#     . latency histogram with logarithmic bins (powers of 2 of microseconds)
+#
+# ------------------------------------------------------------------------------------------------------------
+
+# standard library
+import json
+import math
+
+class TransactionStats:
+    """
+       Accumulate the duration of the USB transactions by (kind, address)
+    """
+
+    # number of histogram bins: bin 0: < 1 us, bin i: [2**(i-1), 2**i[ us, last bin: everything above
+    _c_NB_BINS = 24
+
+    def __init__(self,name_func_p=None):
+        """init the variable
+
+        Args:
+            name_func_p (function): (kind, addr) -> register name (None: no name)
+        """
+        self._name_func = name_func_p
+        # (kind, addr) -> [count, total, min, max, histogram]
+        self._entry_dict = {}
+
+    def reset(self):
+        """
+          Clear the accumulated statistics
+        """
+        self._entry_dict = {}
+
+    def record(self,kind_p,addr_p,duration_p):
+        """Add a transaction
+
+        Args:
+            kind_p (str): transaction kind ('wire_in', 'wire_ins', 'wire_out', 'wire_outs', 'trig_in')
+            addr_p (uint8_t): address
+            duration_p (float): duration (expressed in s)
+        """
+        key = (kind_p, addr_p)
+        entry = self._entry_dict.get(key)
+        if entry is None:
+            entry = [0, 0.0, duration_p, duration_p, [0] * self._c_NB_BINS]
+            self._entry_dict[key] = entry
+        entry[0] += 1
+        entry[1] += duration_p
+        if duration_p < entry[2]:
+            entry[2] = duration_p
+        if duration_p > entry[3]:
+            entry[3] = duration_p
+        duration_us = duration_p * 1e6
+        if duration_us < 1:
+            index = 0
+        else:
+            index = min(int(math.log2(duration_us)) + 1, self._c_NB_BINS - 1)
+        entry[4][index] += 1
+
+    def get_stats(self):
+        """Get the accumulated statistics
+
+        Returns:
+            dict: 'transactions': list of dict (one by kind and address, sorted by total duration),
+                  'histogram_bins_us': upper bound of each histogram bin (expressed in us)
+                  'total': number of transactions and total duration (expressed in s)
+        """
+        transaction_list = []
+        nb_calls = 0
+        total = 0.0
+        for (kind, addr), (count, duration, duration_min, duration_max, histogram) in self._entry_dict.items():
+            name = None
+            if self._name_func is not None:
+                name = self._name_func(kind, addr)
+            item = {}
+            item['kind'] = kind
+            item['addr'] = addr
+            item['name'] = name
+            item['count'] = count
+            item['total_s'] = duration
+            item['mean_s'] = duration / count
+            item['min_s'] = duration_min
+            item['max_s'] = duration_max
+            item['histogram'] = list(histogram)
+            transaction_list.append(item)
+            nb_calls += count
+            total += duration
+        transaction_list.sort(key=lambda item: item['total_s'], reverse=True)
+
+        stats = {}
+        stats['transactions'] = transaction_list
+        stats['histogram_bins_us'] = [2**i for i in range(self._c_NB_BINS - 1)] + [None]
+        stats['total'] = {'count': nb_calls, 'total_s': total}
+        return stats
+
+    def dump(self,filepath_p):
+        """Write the statistics in a JSON file
+
+        Args:
+            filepath_p (str): output filepath
+        """
+        with open(filepath_p, 'w') as file:
+            json.dump(self.get_stats(), file, indent=2)
@@ -0,0 +1,205 @@
+# ------------------------------------------------------------------------------------------------------------
+#                            Copyright (C) 2024-2030 Ken-ji de la ROSA, IRAP Toulouse.
+# ------------------------------------------------------------------------------------------------------------
+#                            This file is part of the ATHENA X-IFU DRE Telemetry and Telecommand Firmware.
+#
+#                            dcdc-hk-fw is free software: you can redistribute it and/or modify
+#                            it under the terms of the GNU General Public License as published by
+#                            the Free Software Foundation, either version 3 of the License, or
+#                            (at your option) any later version.
+#
+#                            This program is distributed in the hope that it will be useful,
+#                            but WITHOUT ANY WARRANTY; without even the implied warranty of
+#                            MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#                            GNU General Public License for more details.
+#
+#                            You should have received a copy of the GNU General Public License
+#                            along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------------------------------------
+#    email                   kenji.delarosa@alten.com
+#    @file                   mem_file.py
+# -------------------------------------------------------------------------------------------------------------
+#    Automatic Generation    No
+#    Code Rules Reference    N/A
+# -------------------------------------------------------------------------------------------------------------
+#   @details
+#
+#   Load the *.mem RAM files (ex: fpasim/fpasim_default_ram/*.mem) into numpy uint16 arrays.
+#   File format: one hexadecimal word by line, "@<addr>" lines set the address of the next word.
+#
+#   The parsed array is cached in a .npy file (__pycache__ directory next to the *.mem file).
+#   The cache file name contains a hash of the *.mem content and is memory-mapped on the next loads.
+#   Within a process, an unchanged file (same modification time and size) is returned without any reading.
+#
+# ------------------------------------------------------------------------------------------------------------
+
+# standard library
+import os
+import re
+import hashlib
+from pathlib import Path
+
+# third party library
+import numpy as np
+
+# name of the cache directory (created next to the *.mem file)
+_c_CACHE_DIRNAME = '__pycache__'
+
+# hexadecimal ASCII character -> value (255: not an hexadecimal character)
+_hex_lut = np.full(256, 255, dtype=np.uint8)
+for i, char in enumerate(b'0123456789abcdef'):
+    _hex_lut[char] = i
+for i, char in enumerate(b'ABCDEF'):
+    _hex_lut[char] = 10 + i
+
+# arrays already loaded by this process: (filepath, mtime, size, cache directory) -> array
+_loaded_dict = {}
+
+# "@<addr>" line
+_addr_pattern = re.compile(rb'^[ \t]*@([0-9A-Fa-f]+)[^\n]*$', re.MULTILINE)
+
+def parse_mem_data(data_p):
+    """Parse the content of a *.mem file
+
+    Args:
+        data_p (bytes): file content
+
+    Returns:
+        numpy.ndarray of uint16: RAM values (indexed by address). The missing addresses are set to 0
+    """
+    # split the words by "@<addr>" sections: (address, section content)
+    section_list = []
+    addr = 0
+    start = 0
+    for match in _addr_pattern.finditer(data_p):
+        section_list.append((addr, data_p[start:match.start()]))
+        addr = int(match.group(1), 16)
+        start = match.end()
+    section_list.append((addr, data_p[start:]))
+
+    array_list = []
+    size = 0
+    for addr, text in section_list:
+        words = _parse_section(text)
+        if len(words) > 0:
+            array_list.append((addr, words))
+            size = max(size, addr + len(words))
+
+    if (len(array_list) == 1) and (array_list[0][0] == 0):
+        # usual case: a single section starting at the address 0
+        return array_list[0][1]
+
+    array = np.zeros(size, dtype=np.uint16)
+    for addr, words in array_list:
+        array[addr:addr + len(words)] = words
+    return array
+
+def _parse_section(text_p):
+    """Convert the hexadecimal words of a section (no "@<addr>" line)
+
+    Args:
+        text_p (bytes): section content
+
+    Returns:
+        numpy.ndarray of uint16: converted values
+    """
+    text = text_p.replace(b'\r', b'').strip()
+    if len(text) == 0:
+        return np.zeros(0, dtype=np.uint16)
+
+    # usual case: one 4-character word by line => the whole section is converted in a single vectorized pass
+    raw = text + b'\n'
+    if len(raw) % 5 == 0:
+        chars = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 5)
+        if (chars[:, 4] == ord('\n')).all():
+            return _convert_hex_chars(chars[:, :4])
+
+    # general case: words of any width (up to 4 characters)
+    token_list = text.split()
+    for token in token_list:
+        if len(token) > 4:
+            raise ValueError("word wider than 16 bits in the mem file: " + token.decode(errors='replace'))
+    joined = b''.join(token.rjust(4, b'0') for token in token_list)
+    chars = np.frombuffer(joined, dtype=np.uint8).reshape(-1, 4)
+    return _convert_hex_chars(chars)
+
+def _convert_hex_chars(chars_p):
+    """Convert hexadecimal characters into values
+
+    Args:
+        chars_p (numpy.ndarray of uint8): ASCII characters. Shape: (nb_words, 4)
+
+    Returns:
+        numpy.ndarray of uint16: converted values
+    """
+    digits = _hex_lut[chars_p]
+    if (digits == 255).any():
+        row = int(np.nonzero((digits == 255).any(axis=1))[0][0])
+        raise ValueError("bad hexadecimal word in the mem file: " + bytes(chars_p[row]).decode(errors='replace'))
+    digits = digits.astype(np.uint16)
+    return (digits[:, 0] << 12) | (digits[:, 1] << 8) | (digits[:, 2] << 4) | digits[:, 3]
+
+def parse_mem_file(filepath_p):
+    """Parse a *.mem file (no cache)
+
+    Args:
+        filepath_p (str): path to the *.mem file
+
+    Returns:
+        numpy.ndarray of uint16: RAM values
+    """
+    with open(filepath_p, 'rb') as file:
+        data = file.read()
+    return parse_mem_data(data)
+
+def load_mem_file(filepath_p,cache_p=True,cache_dir_p=None):
+    """Load a *.mem file using the .npy cache
+
+    Args:
+        filepath_p (str): path to the *.mem file
+        cache_p (bool): True: use/create the cache, False: parse the file
+        cache_dir_p (str): cache directory (default: __pycache__ next to the *.mem file)
+
+    Returns:
+        numpy.ndarray of uint16: RAM values (read-only memory-mapped array when the cache is used)
+    """
+    filepath = Path(filepath_p)
+    if cache_p:
+        # already loaded by this process and unchanged since
+        stat = filepath.stat()
+        key = (str(filepath.resolve()), stat.st_mtime_ns, stat.st_size, str(cache_dir_p))
+        array = _loaded_dict.get(key)
+        if array is not None:
+            return array
+
+    with open(filepath, 'rb') as file:
+        data = file.read()
+    if not cache_p:
+        return parse_mem_data(data)
+
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+    if cache_dir_p is None:
+        cache_dir = filepath.parent / _c_CACHE_DIRNAME
+    else:
+        cache_dir = Path(cache_dir_p)
+    cache_filepath = cache_dir / (filepath.stem + '.' + digest + '.npy')
+
+    if cache_filepath.exists():
+        array = np.load(cache_filepath, mmap_mode='r')
+        _loaded_dict[key] = array
+        return array
+
+    array = parse_mem_data(data)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # write then rename: a concurrent reader never sees a partial file
+        tmp_filepath = cache_filepath.with_name(cache_filepath.name + '.' + str(os.getpid()) + '.tmp')
+        with open(tmp_filepath, 'wb') as file:
+            np.save(file, array)
+        os.replace(tmp_filepath, cache_filepath)
+    except OSError:
+        # read-only directory: work without cache
+        return array
+    array = np.load(cache_filepath, mmap_mode='r')
+    _loaded_dict[key] = array
+    return array
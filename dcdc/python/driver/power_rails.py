@@ -0,0 +1,180 @@
+# ------------------------------------------------------------------------------------------------------------
+#                            Copyright (C) 2024-2030 Ken-ji de la ROSA, IRAP Toulouse.
+# ------------------------------------------------------------------------------------------------------------
+#                            This file is part of the ATHENA X-IFU DRE Telemetry and Telecommand Firmware.
+#
+#                            dcdc-hk-fw is free software: you can redistribute it and/or modify
+#                            it under the terms of the GNU General Public License as published by
+#                            the Free Software Foundation, either version 3 of the License, or
+#                            (at your option) any later version.
+#
+#                            This program is distributed in the hope that it will be useful,
+#                            but WITHOUT ANY WARRANTY; without even the implied warranty of
+#                            MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#                            GNU General Public License for more details.
+#
+#                            You should have received a copy of the GNU General Public License
+#                            along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------------------------------------
+#    email                   kenji.delarosa@alten.com
+#    @file                   power_rails.py
+# -------------------------------------------------------------------------------------------------------------
+#    Automatic Generation    No
+#    Code Rules Reference    N/A
+# -------------------------------------------------------------------------------------------------------------
+#   @details
+#
+#   Power rails of the DCDC board:
+#     . description of each switched rail (JSON file): POWER_CONF bit field, monitoring ADC channel
+#       and expected voltage windows when the rail is off/on
+#     . a file is considered unvalidated (placeholder mapping/windows) until its "validated" key is true:
+#       the rail checks of an unvalidated file aren't a verification of the hardware
+#     . automated power sweep: apply a list of POWER_CONF values, wait the end of the power FSM,
+#       acquire the ADCs and check the rails against their windows
+#
+# ------------------------------------------------------------------------------------------------------------
+
+# standard library
+import json
+from pathlib import Path
+
+# directory of the power rail files
+power_rails_base_path = Path(__file__).parents[0]
+
+class PowerRail:
+    """
+       Switched power rail: POWER_CONF bit field, monitoring ADC and expected voltage windows
+    """
+
+    def __init__(self,desc_p):
+        """init the variable
+
+        Args:
+            desc_p (dict): rail description (see the JSON file)
+        """
+        self.name = desc_p['name']
+        self.power_field = desc_p['power_field']
+        self.adc = desc_p['adc']
+        # (min, max) voltage (expressed in V) when the rail is off/on
+        self.window_off = tuple(desc_p['off'])
+        self.window_on = tuple(desc_p['on'])
+
+    def check(self,voltage_p,on_off_p):
+        """Check a measured voltage against the expected window
+
+        Args:
+            voltage_p (float): measured voltage (expressed in V)
+            on_off_p (uint1_t): 1: the rail is on, 0: the rail is off
+
+        Returns:
+            bool: True if the voltage is inside the window
+        """
+        if on_off_p:
+            v_min, v_max = self.window_on
+        else:
+            v_min, v_max = self.window_off
+        return v_min <= voltage_p <= v_max
+
+class PowerRails:
+    """
+       Set of the switched power rails of a board
+    """
+
+    def __init__(self,filepath_p):
+        """Load the rail descriptions
+
+        Args:
+            filepath_p (str): path to the JSON file
+        """
+        with open(filepath_p, 'r') as file:
+            desc = json.load(file)
+        self.name = desc.get('name', '')
+        # True: the rail mapping and the windows are checked against the hardware
+        self.validated = bool(desc.get('validated', False))
+        self.rail_list = [PowerRail(rail_desc) for rail_desc in desc['rails']]
+        self.rails = {rail.name: rail for rail in self.rail_list}
+        # named power sequences (see PowerSequencer): plan name -> list of steps
+        self.plans = desc.get('plans', {})
+
+    def check(self,power_dict_p,voltage_dict_p):
+        """Check all the rails
+
+        Args:
+            power_dict_p (dict): POWER_CONF bit field name -> value (1: on, 0: off)
+            voltage_dict_p (dict): ADC name -> measured voltage (expressed in V)
+
+        Returns:
+            list of dict: by rail: {'name', 'on_off', 'voltage', 'ok'}
+        """
+        result_list = []
+        for rail in self.rail_list:
+            on_off = power_dict_p[rail.power_field]
+            voltage = float(voltage_dict_p[rail.adc])
+            result_list.append({'name': rail.name, 'on_off': on_off, 'voltage': voltage, 'ok': rail.check(voltage, on_off)})
+        return result_list
+
+# loaded power rails (by filepath)
+_power_rails_dict = {}
+
+def load_power_rails(filepath_p='dcdc_power_rails.json'):
+    """Load the power rail descriptions (only once by filepath)
+
+    Args:
+        filepath_p (str): path to the JSON file. A relative path is relative to this directory
+
+    Returns:
+        PowerRails: power rails
+    """
+    filepath = Path(filepath_p)
+    if not filepath.is_absolute():
+        filepath = power_rails_base_path / filepath
+    key = str(filepath)
+    power_rails = _power_rails_dict.get(key)
+    if power_rails is None:
+        power_rails = PowerRails(key)
+        _power_rails_dict[key] = power_rails
+    return power_rails
+
+def run_power_sweep(device_p,power_rails_p=None,value_list_p=None,timeout_p=1.0):
+    """Apply a list of POWER_CONF values and check the rails after each transition
+    Note:
+      . by step: set_power_wait (settle time), set_adc_wait, get_adcs then check the rails
+      . the caller sets the verbosity of the device (ex: -1 for a silent sweep)
+
+    Args:
+        device_p (DCDC): opened DCDC board
+        power_rails_p (PowerRails): rail descriptions (default: load_power_rails())
+        value_list_p (list of uint): POWER_CONF values (default: the 16 combinations: 0 to 15)
+        timeout_p (float): maximal waiting time of the power/ADC FSM (expressed in s)
+
+    Returns:
+        list of dict: by step: {'value', 'settle_time' (expressed in s, -1: timeout),
+                                'adc_time' (expressed in s, -1: timeout), 'rails' (see PowerRails.check), 'ok'}
+    """
+    if power_rails_p is None:
+        power_rails_p = load_power_rails()
+    if value_list_p is None:
+        value_list_p = list(range(16))
+
+    register = device_p.get_register_map()['POWER_CONF']
+    adc_name_list = device_p.get_adc_name_list()
+
+    step_list = []
+    for value in value_list_p:
+        power_dict = register.decode(value)
+        # by keyword: the POWER_CONF field xxx is the argument xxx_p of set_power_wait
+        kwargs = {name + '_p': on_off for name, on_off in power_dict.items()}
+        settle_time = device_p.set_power_wait(timeout_p=timeout_p, **kwargs)
+        adc_time = device_p.set_adc_wait(timeout_p)
+        data, voltages = device_p.get_adcs()
+        voltage_dict = dict(zip(adc_name_list, voltages))
+        rail_list = power_rails_p.check(power_dict, voltage_dict)
+
+        step = {}
+        step['value'] = value
+        step['settle_time'] = settle_time
+        step['adc_time'] = adc_time
+        step['rails'] = rail_list
+        step['ok'] = (settle_time >= 0) and (adc_time >= 0) and all(rail['ok'] for rail in rail_list)
+        step_list.append(step)
+    return step_list
@@ -0,0 +1,215 @@
+# ------------------------------------------------------------------------------------------------------------
+#                            Copyright (C) 2024-2030 Ken-ji de la ROSA, IRAP Toulouse.
+# ------------------------------------------------------------------------------------------------------------
+#                            This file is part of the ATHENA X-IFU DRE Telemetry and Telecommand Firmware.
+#
+#                            dcdc-hk-fw is free software: you can redistribute it and/or modify
+#                            it under the terms of the GNU General Public License as published by
+#                            the Free Software Foundation, either version 3 of the License, or
+#                            (at your option) any later version.
+#
+#                            This program is distributed in the hope that it will be useful,
+#                            but WITHOUT ANY WARRANTY; without even the implied warranty of
+#                            MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#                            GNU General Public License for more details.
+#
+#                            You should have received a copy of the GNU General Public License
+#                            along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------------------------------------
+#    email                   kenji.delarosa@alten.com
+#    @file                   power_sequencer.py
+# -------------------------------------------------------------------------------------------------------------
+#    Automatic Generation    No
+#    Code Rules Reference    N/A
+# -------------------------------------------------------------------------------------------------------------
+#   @details
+#
+#   Power sequencer of the DCDC board.
+#   A plan is an ordered list of steps. Each step switches on/off some rails (see dcdc_power_rails.json):
+#       {"on": ["dmx0"], "off": [], "delay": 0.0, "verify": true}
+#   For each step, the sequencer:
+#     . applies POWER_CONF with DCDC.set_power_wait (readiness check, trigger, wait for power_ready)
+#     . (verify) acquires the ADCs (DCDC.set_adc_wait, DCDC.get_adcs) and checks all the rails against their windows
+#     . waits the inter-step delay
+#   The plan is stopped at the first failed step.
+#   An unvalidated rail file (placeholder mapping/windows, see power_rails.py) can't verify a step:
+#   a plan with verified steps is refused unless the caller explicitly allows it (allow_unvalidated_p)
+#
+# ------------------------------------------------------------------------------------------------------------
+
+# standard library
+import time
+
+from .utils_tools import Display
+from .power_rails import load_power_rails
+
+class PowerSequencer(Display):
+    """
+       Execute timed and verified power plans
+    """
+
+    def __init__(self,dcdc_p,power_rails_p=None,timeout_p=1.0,allow_unvalidated_p=False):
+        """init the variable
+
+        Args:
+            dcdc_p (DCDC): opened DCDC board
+            power_rails_p (PowerRails): rail descriptions and plans (default: load_power_rails())
+            timeout_p (float): maximal waiting time of the power/ADC FSM (expressed in s)
+            allow_unvalidated_p (bool): True: allow the verified steps with an unvalidated rail file
+                (the rail checks aren't a hardware verification)
+        """
+        # init the parent class
+        super().__init__()
+
+        self.dcdc = dcdc_p
+        if power_rails_p is None:
+            power_rails_p = load_power_rails()
+        self.power_rails = power_rails_p
+        self._timeout = timeout_p
+        self._allow_unvalidated = allow_unvalidated_p
+
+        self._register = self.dcdc.get_register_map()['POWER_CONF']
+        self._adc_name_list = self.dcdc.get_adc_name_list()
+
+    def get_plan(self,plan_p):
+        """Get a plan by name
+
+        Args:
+            plan_p (str or list of dict): plan name (see the JSON file) or plan
+
+        Returns:
+            list of dict: plan steps
+        """
+        if isinstance(plan_p, str):
+            plan = self.power_rails.plans.get(plan_p)
+            if plan is None:
+                raise ValueError("unknown power plan: " + plan_p + " (available: " + ", ".join(self.power_rails.plans.keys()) + ")")
+            return plan
+        return plan_p
+
+    def _compute_power_conf(self,value_p,step_p):
+        """Apply the on/off rails of a step to a POWER_CONF value
+
+        Args:
+            value_p (uint32_t): current POWER_CONF value
+            step_p (dict): plan step
+
+        Returns:
+            uint32_t: new POWER_CONF value
+        """
+        fields = self._register.fields
+        rails = self.power_rails.rails
+        for name in step_p.get('on', []):
+            field = fields[rails[name].power_field]
+            value_p |= field.mask << field.pos
+        for name in step_p.get('off', []):
+            field = fields[rails[name].power_field]
+            value_p &= ~(field.mask << field.pos)
+        return value_p
+
+    def run(self,plan_p):
+        """Execute a plan
+
+        Args:
+            plan_p (str or list of dict): plan name (see the JSON file) or plan
+
+        Returns:
+            list of dict: by executed step: {'index', 'value' (POWER_CONF), 'start_time' (from the plan start),
+                'settle_time' (expressed in s, -1: timeout), 'adc_time' (expressed in s, None: not verified, -1: timeout),
+                'rails' (see PowerRails.check, None: not verified), 'ok',
+                'verified' (True: rails checked with a validated rail file)}
+
+        Raises:
+            ValueError: unknown plan, or plan with verified steps and an unvalidated rail file
+                (see the allow_unvalidated_p argument of the constructor)
+        """
+        plan = self.get_plan(plan_p)
+        dcdc = self.dcdc
+        register = self._register
+        timeout = self._timeout
+        validated = self.power_rails.validated
+
+        if not validated:
+            if (not self._allow_unvalidated) and any(step.get('verify', True) for step in plan):
+                msg = "[KO]: PowerSequencer: UNVALIDATED rail mapping/windows (" + self.power_rails.name + "): verify refused (see allow_unvalidated_p)"
+                self.display(msg)
+                raise ValueError(msg)
+            msg = "[WARNING]: PowerSequencer: UNVALIDATED rail mapping/windows (" + self.power_rails.name + "): the rail checks aren't a hardware verification"
+            self.display(msg)
+
+        # the sequencer prints a summary by step: no print by register access
+        verbosity = dcdc.get_verbosity()
+        dcdc.set_verbosity(-1)
+
+        step_list = []
+        t_plan = time.perf_counter()
+        try:
+            value = dcdc.get_power_conf()
+
+            for index, step in enumerate(plan):
+                value = self._compute_power_conf(value, step)
+                power_dict = register.decode(value)
+
+                # by keyword: the POWER_CONF field xxx is the argument xxx_p of set_power_wait
+                t0 = time.perf_counter()
+                settle_time = dcdc.set_power_wait(timeout_p=timeout, **{name + '_p': on_off for name, on_off in power_dict.items()})
+
+                adc_time = None
+                rail_list = None
+                ok = settle_time >= 0
+                if ok and step.get('verify', True):
+                    adc_time = dcdc.set_adc_wait(timeout)
+                    data, voltages = dcdc.get_adcs()
+                    rail_list = self.power_rails.check(power_dict, dict(zip(self._adc_name_list, voltages)))
+                    ok = (adc_time >= 0) and all(rail['ok'] for rail in rail_list)
+
+                result = {}
+                result['index'] = index
+                result['value'] = value
+                result['start_time'] = t0 - t_plan
+                result['settle_time'] = settle_time
+                result['adc_time'] = adc_time
+                result['rails'] = rail_list
+                result['ok'] = ok
+                result['verified'] = validated and (rail_list is not None)
+                step_list.append(result)
+
+                if not ok:
+                    break
+
+                delay = step.get('delay', 0.0)
+                if delay > 0:
+                    time.sleep(delay)
+        finally:
+            dcdc.set_verbosity(verbosity)
+
+        # print
+        ####################################
+        for result in step_list:
+            if result['ok']:
+                status = "[OK]"
+            else:
+                status = "[KO]"
+            msg = status + ": PowerSequencer: step " + str(result['index']) + ": POWER_CONF: 0x" + '{0:x}'.format(result['value'])
+            msg += ", start (ms): " + '{0:.3f}'.format(result['start_time']*1e3)
+            if result['settle_time'] < 0:
+                msg += ", settle time: timeout"
+            else:
+                msg += ", settle time (ms): " + '{0:.3f}'.format(result['settle_time']*1e3)
+            self.display(msg)
+            if result['rails'] is not None:
+                for rail in result['rails']:
+                    if not rail['ok']:
+                        msg = rail['name'] + " (" + ("on" if rail['on_off'] else "off") + "): " + '{0:.3f}'.format(rail['voltage']) + " V => out of the window"
+                        self.display(msg, self.level + 1)
+
+        nb_ok = sum(1 for result in step_list if result['ok'])
+        if (nb_ok == len(plan)):
+            msg = "[OK]: PowerSequencer: " + str(len(plan)) + " steps done in (ms): " + '{0:.3f}'.format((time.perf_counter() - t_plan)*1e3)
+            if not validated:
+                msg += " (not verified against the hardware: UNVALIDATED rail windows)"
+        else:
+            msg = "[KO]: PowerSequencer: stopped after " + str(len(step_list)) + "/" + str(len(plan)) + " steps"
+        self.display(msg)
+
+        return step_list
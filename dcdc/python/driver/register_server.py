@@ -0,0 +1,465 @@
+# ------------------------------------------------------------------------------------------------------------
+#                            Copyright (C) 2024-2030 Ken-ji de la ROSA, IRAP Toulouse.
+# ------------------------------------------------------------------------------------------------------------
+#                            This file is part of the ATHENA X-IFU DRE Telemetry and Telecommand Firmware.
+#
+#                            dcdc-hk-fw is free software: you can redistribute it and/or modify
+#                            it under the terms of the GNU General Public License as published by
+#                            the Free Software Foundation, either version 3 of the License, or
+#                            (at your option) any later version.
+#
+#                            This program is distributed in the hope that it will be useful,
+#                            but WITHOUT ANY WARRANTY; without even the implied warranty of
+#                            MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#                            GNU General Public License for more details.
+#
+#                            You should have received a copy of the GNU General Public License
+#                            along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------------------------------------
+#    email                   kenji.delarosa@alten.com
+#    @file                   register_server.py
+# -------------------------------------------------------------------------------------------------------------
+#    Automatic Generation    No
+#    Code Rules Reference    N/A
+# -------------------------------------------------------------------------------------------------------------
+#   @details
+#
+#   Share one board between several processes (ex: housekeeping logger, control GUI, test script).
+#     . RegisterServer: owns the opened Driver/DCDC instance and serves register requests on a
+#       localhost TCP socket (or a Unix socket). A single worker thread accesses the board:
+#         . the write requests are executed one after the other (in arrival order)
+#         . the pending read-only requests of all the clients are merged into one UpdateWireOuts
+#     . RemoteBackend/RemoteDevice: client side. RemoteDevice implements the FrontPanel device
+#       functions used by the Driver class: DCDC().open(..., backend_p=RemoteBackend(port_p=...))
+#       gives a drop-in DCDC instance connected to the server.
+#       The board configuration belongs to the server: a client never loads the firmware
+#
+#   Protocol: one JSON object by line.
+#     request:  {"ops": [op, ...]} with op:
+#                 ["set", addr, value, mask]: wire_in write (the writes of a request are sent with one UpdateWireIns)
+#                 ["trig", addr, bit]: trigger
+#                 ["get", [addr, ...]]: wire_out reading
+#                 ["info"]: device information of the board
+#     response: {"results": [result, ...]} (null for "set"/"trig", list of values for "get", dict for "info")
+#               or {"error": "message"}
+#   Note:
+#     . the pipes are not supported (RemoteBackend.can_pipe = False: the Driver pipe functions raise a ValueError)
+#
+# ------------------------------------------------------------------------------------------------------------
+
+# standard library
+import json
+import queue
+import socket
+import socketserver
+import threading
+
+from .utils_tools import Display
+from .sim import SimDeviceInfo
+
+# default TCP port of the server
+c_DEFAULT_PORT = 50100
+
+# number of arguments by operation
+_c_OP_NB_ARGS = {'set': 3, 'trig': 2, 'get': 1, 'info': 0}
+
+def _check_ops(ops_p):
+    """Check the format of the operations of a request (before any merge with the other requests)
+
+    Args:
+        ops_p (list): operations (see the protocol)
+
+    Raises:
+        ValueError: malformed operation
+    """
+    if not isinstance(ops_p, list):
+        raise ValueError("ops must be a list")
+    for op in ops_p:
+        if (not isinstance(op, list)) or (len(op) == 0) or (op[0] not in _c_OP_NB_ARGS):
+            raise ValueError("unknown operation: " + str(op))
+        if len(op) != 1 + _c_OP_NB_ARGS[op[0]]:
+            raise ValueError("wrong number of arguments: " + str(op))
+        if op[0] == 'get':
+            arg_list = op[1]
+            if not isinstance(arg_list, list):
+                raise ValueError("the addresses of a get must be a list: " + str(op))
+        else:
+            arg_list = op[1:]
+        for arg in arg_list:
+            if (not isinstance(arg, int)) or isinstance(arg, bool) or (arg < 0) or (arg > 0xFFFF_FFFF):
+                raise ValueError("invalid argument: " + str(op))
+
+class _Request:
+    """
+       Request waiting for the worker thread
+    """
+
+    __slots__ = ('ops', 'results', 'error', 'done')
+
+    def __init__(self,ops_p):
+        self.ops = ops_p
+        self.results = None
+        self.error = None
+        self.done = threading.Event()
+
+    def is_read_only(self):
+        for op in self.ops:
+            if op[0] != 'get':
+                return False
+        return True
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """
+       One thread by client connection: forward each request line to the worker thread
+    """
+
+    def handle(self):
+        server = self.server.register_server
+        for line in self.rfile:
+            try:
+                ops = json.loads(line)['ops']
+                # a malformed request is rejected alone: it never joins the merged reads of the other clients
+                _check_ops(ops)
+            except (ValueError, KeyError, TypeError) as exc:
+                response = {'error': 'invalid request: ' + str(exc)}
+            else:
+                request = _Request(ops)
+                server._queue.put(request)
+                request.done.wait()
+                if request.error is not None:
+                    response = {'error': request.error}
+                else:
+                    response = {'results': request.results}
+            self.wfile.write((json.dumps(response) + '\n').encode('ascii'))
+            self.wfile.flush()
+
+class _TCPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+if hasattr(socketserver, 'UnixStreamServer'):
+    class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+
+class RegisterServer(Display):
+    """
+       Serve the registers of one opened board to several client processes
+    """
+
+    def __init__(self,driver_p,host_p='127.0.0.1',port_p=c_DEFAULT_PORT,unix_path_p=None):
+        """init the variable
+
+        Args:
+            driver_p (Driver): opened board (ex: DCDC instance)
+            host_p (str): TCP host (default: localhost only)
+            port_p (uint): TCP port (0: any free port, see the address attribute)
+            unix_path_p (str): path of a Unix socket (used instead of TCP if not None)
+        """
+        # init the parent class
+        super().__init__()
+
+        self.driver = driver_p
+        self._queue = queue.Queue()
+
+        if unix_path_p is not None:
+            self._server = _UnixServer(unix_path_p, _RequestHandler)
+        else:
+            self._server = _TCPServer((host_p, port_p), _RequestHandler)
+        self._server.register_server = self
+        # (host, port) or Unix socket path
+        self.address = self._server.server_address
+
+        self._worker = None
+        self._thread = None
+        # statistics: number of served requests and of UpdateWireOuts
+        self.nb_requests = 0
+        self.nb_wire_out_updates = 0
+
+    def start(self):
+        """
+          Start the worker thread and the server thread
+        """
+        self._worker = threading.Thread(target=self._run_worker, name="register-server-worker", daemon=True)
+        self._worker.start()
+        self._thread = threading.Thread(target=self._server.serve_forever, name="register-server", daemon=True)
+        self._thread.start()
+
+        msg = "RegisterServer: listening on " + str(self.address)
+        self.display(msg)
+
+    def serve_forever(self):
+        """
+          Start the worker thread and serve until KeyboardInterrupt (Ctrl+C)
+        """
+        self._worker = threading.Thread(target=self._run_worker, name="register-server-worker", daemon=True)
+        self._worker.start()
+        msg = "RegisterServer: listening on " + str(self.address)
+        self.display(msg)
+        self.flush()
+        try:
+            self._server.serve_forever()
+        except KeyboardInterrupt:
+            msg = "RegisterServer: stopped by the user"
+            self.display(msg)
+        finally:
+            self._stop_worker()
+
+    def stop(self):
+        """
+          Stop the server and the worker thread
+        """
+        self._server.shutdown()
+        self._server.server_close()
+        self._stop_worker()
+
+    def _stop_worker(self):
+        if (self._worker is not None) and self._worker.is_alive():
+            self._queue.put(None)
+            self._worker.join()
+
+    def _run_worker(self):
+        """
+          Worker thread: the only thread which accesses to the board
+        """
+        request_queue = self._queue
+        while True:
+            request = request_queue.get()
+            if request is None:
+                return
+            # take all the pending requests
+            request_list = [request]
+            while True:
+                try:
+                    request = request_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if request is None:
+                    request_queue.put(None)
+                    break
+                request_list.append(request)
+
+            index = 0
+            nb_requests = len(request_list)
+            while index < nb_requests:
+                request = request_list[index]
+                if request.is_read_only():
+                    # merge the consecutive read-only requests
+                    end = index + 1
+                    while (end < nb_requests) and request_list[end].is_read_only():
+                        end += 1
+                    self._execute_reads(request_list[index:end])
+                    index = end
+                else:
+                    self._execute(request)
+                    index += 1
+            self.nb_requests += nb_requests
+
+    def _execute_reads(self,request_list_p):
+        """Execute read-only requests with a single UpdateWireOuts
+
+        Args:
+            request_list_p (list of _Request): read-only requests
+        """
+        try:
+            addr_set = set()
+            for request in request_list_p:
+                for op in request.ops:
+                    addr_set.update(op[1])
+            addr_list = sorted(addr_set)
+            value_dict = dict(zip(addr_list, self.driver.get_wire_outs(addr_list)))
+            self.nb_wire_out_updates += 1
+            for request in request_list_p:
+                request.results = [[value_dict[addr] for addr in op[1]] for op in request.ops]
+        except Exception as exc:
+            for request in request_list_p:
+                request.error = str(exc)
+        for request in request_list_p:
+            request.done.set()
+
+    def _execute(self,request_p):
+        """Execute a request (in order)
+
+        Args:
+            request_p (_Request): request
+        """
+        driver = self.driver
+        results = []
+        try:
+            # the consecutive writes are sent with a single UpdateWireIns
+            with driver.batch():
+                for op in request_p.ops:
+                    name = op[0]
+                    if name == 'set':
+                        driver.set_wire_in(op[1], op[2], op[3])
+                        results.append(None)
+                    elif name == 'trig':
+                        driver.set_trig_in(op[1], op[2])
+                        results.append(None)
+                    elif name == 'get':
+                        results.append(driver.get_wire_outs(op[1]))
+                        self.nb_wire_out_updates += 1
+                    elif name == 'info':
+                        info = driver.device_info
+                        results.append({'productName': info.productName, 'deviceMajorVersion': info.deviceMajorVersion,
+                                        'deviceMinorVersion': info.deviceMinorVersion, 'serialNumber': info.serialNumber,
+                                        'deviceID': info.deviceID})
+                    else:
+                        raise ValueError("unknown operation: " + str(name))
+            request_p.results = results
+        except Exception as exc:
+            request_p.error = str(exc)
+        request_p.done.set()
+
+class RemoteDevice:
+    """
+       FrontPanel device connected to a RegisterServer (same functions as ok.okCFrontPanel for the wires and triggers)
+    """
+
+    NoError = 0
+
+    # wire_out address range of FrontPanel (read by each UpdateWireOuts)
+    _c_WIRE_OUT_ADDR_LIST = list(range(0x20, 0x40))
+
+    def __init__(self,host_p='127.0.0.1',port_p=c_DEFAULT_PORT,unix_path_p=None):
+        """Connect to a RegisterServer
+
+        Args:
+            host_p (str): TCP host of the server
+            port_p (uint): TCP port of the server
+            unix_path_p (str): path of the Unix socket of the server (used instead of TCP if not None)
+        """
+        if unix_path_p is not None:
+            self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._socket.connect(unix_path_p)
+        else:
+            self._socket = socket.create_connection((host_p, port_p))
+            self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._file = self._socket.makefile('rwb')
+
+        # wire_in writes waiting for the UpdateWireIns
+        self._pending_set_list = []
+        # wire_out values of the last UpdateWireOuts
+        self._wire_out_dict = {}
+
+    def _request(self,ops_p):
+        """Send a request and wait for the response
+
+        Args:
+            ops_p (list): operations (see the protocol)
+
+        Returns:
+            list: results of the operations
+        """
+        self._file.write((json.dumps({'ops': ops_p}) + '\n').encode('ascii'))
+        self._file.flush()
+        line = self._file.readline()
+        if not line:
+            raise ConnectionError("RegisterServer: connection closed")
+        response = json.loads(line)
+        error = response.get('error')
+        if error is not None:
+            raise RuntimeError("RegisterServer: " + error)
+        return response['results']
+
+    def close(self):
+        """
+          Close the connection
+        """
+        self._file.close()
+        self._socket.close()
+
+    def GetDeviceInfo(self,info_p):
+        info = self._request([['info']])[0]
+        for name, value in info.items():
+            setattr(info_p, name, value)
+        return self.NoError
+
+    def SetWireInValue(self,ep_p,value_p,mask_p=0xFFFF_FFFF):
+        self._pending_set_list.append(['set', ep_p, value_p, mask_p])
+        return self.NoError
+
+    def SeedWireInValue(self,ep_p,value_p):
+        # the board is shared: only the masked writes of this client are sent (see Driver.load_shadow)
+        return self.NoError
+
+    def UpdateWireIns(self):
+        if self._pending_set_list:
+            ops = self._pending_set_list
+            self._pending_set_list = []
+            self._request(ops)
+
+    def UpdateWireOuts(self):
+        values = self._request([['get', self._c_WIRE_OUT_ADDR_LIST]])[0]
+        self._wire_out_dict = dict(zip(self._c_WIRE_OUT_ADDR_LIST, values))
+
+    def GetWireOutValue(self,ep_p):
+        return self._wire_out_dict.get(ep_p, 0)
+
+    def ActivateTriggerIn(self,ep_p,bit_p):
+        self._request([['trig', ep_p, bit_p]])
+        return self.NoError
+
+class RemoteBackend:
+    """
+       Open a board served by a RegisterServer (see get_backend)
+    """
+
+    name = 'remote'
+    # the server owns the board configuration: a client never loads the firmware (see Driver.open)
+    can_configure = False
+    # the protocol has no pipe: Driver.write_pipe/read_pipe/iter_read_pipe raise a ValueError
+    can_pipe = False
+
+    def __init__(self,host_p='127.0.0.1',port_p=c_DEFAULT_PORT,unix_path_p=None):
+        """init the variable
+
+        Args:
+            host_p (str): TCP host of the server
+            port_p (uint): TCP port of the server
+            unix_path_p (str): path of the Unix socket of the server (used instead of TCP if not None)
+        """
+        self.host = host_p
+        self.port = port_p
+        self.unix_path = unix_path_p
+
+    def list_serials(self):
+        """List the serial number of the served board
+
+        Returns:
+            list of str: serial numbers
+        """
+        dev = RemoteDevice(self.host, self.port, self.unix_path)
+        info = SimDeviceInfo()
+        dev.GetDeviceInfo(info)
+        dev.close()
+        return [info.serialNumber]
+
+    def open_device(self,serial_p=None):
+        """Connect to the server
+
+        Args:
+            serial_p (str): serial number of the served board (None: no check)
+
+        Returns:
+            RemoteDevice: connected device (None if the server can't be reached or the serial number is not the served one)
+        """
+        try:
+            dev = RemoteDevice(self.host, self.port, self.unix_path)
+        except OSError:
+            # no server: same result as a FrontPanel device which can't be opened (see Driver.open)
+            return None
+        if serial_p is not None:
+            info = SimDeviceInfo()
+            dev.GetDeviceInfo(info)
+            if info.serialNumber != serial_p:
+                dev.close()
+                return None
+        return dev
+
+    def new_device_info(self):
+        """Create an empty device information structure
+
+        Returns:
+            SimDeviceInfo: device information structure (same fields as ok.okTDeviceInfo)
+        """
+        return SimDeviceInfo()
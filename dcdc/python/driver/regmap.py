@@ -0,0 +1,232 @@
+# ------------------------------------------------------------------------------------------------------------
+#                            Copyright (C) 2024-2030 Ken-ji de la ROSA, IRAP Toulouse.
+# ------------------------------------------------------------------------------------------------------------
+#                            This file is part of the ATHENA X-IFU DRE Telemetry and Telecommand Firmware.
+#
+#                            dcdc-hk-fw is free software: you can redistribute it and/or modify
+#                            it under the terms of the GNU General Public License as published by
+#                            the Free Software Foundation, either version 3 of the License, or
+#                            (at your option) any later version.
+#
+#                            This program is distributed in the hope that it will be useful,
+#                            but WITHOUT ANY WARRANTY; without even the implied warranty of
+#                            MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#                            GNU General Public License for more details.
+#
+#                            You should have received a copy of the GNU General Public License
+#                            along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------------------------------------
+#    email                   kenji.delarosa@alten.com
+#    @file                   regmap.py
+# -------------------------------------------------------------------------------------------------------------
+#    Automatic Generation    No
+#    Code Rules Reference    N/A
+# -------------------------------------------------------------------------------------------------------------
+#   @details
+#
+#   Load a register map described in a JSON file (ex: dcdc_regmap.json) and build, once:
+#     . the address tables (by register name)
+#     . the bit field encoders/decoders
+#
+# ------------------------------------------------------------------------------------------------------------
+
+# standard library
+import json
+from pathlib import Path
+
+# directory of the register map files
+regmap_base_path = Path(__file__).parents[0]
+
+class Field:
+    """
+       Bit field of a register
+    """
+
+    __slots__ = ('name', 'pos', 'width', 'mask')
+
+    def __init__(self,name_p,pos_p,width_p):
+        """init the variable
+
+        Args:
+            name_p (str): bit field name
+            pos_p (uint): index low of the position of the bit field (start from @0)
+            width_p (uint): bit field width (expressed in bits: start@1)
+        """
+        self.name = name_p
+        self.pos = pos_p
+        self.width = width_p
+        # mask of the bit field (before the shift)
+        self.mask = 2**width_p - 1
+
+    def decode(self,data_p):
+        """Extract the bit field value from a register value
+
+        Args:
+            data_p (uint32_t): register value
+
+        Returns:
+            uint: bit field value
+        """
+        return (data_p >> self.pos) & self.mask
+
+    def encode(self,value_p):
+        """Place a bit field value at its position
+
+        Args:
+            value_p (uint): bit field value
+
+        Returns:
+            uint32_t: shifted value
+        """
+        return (value_p & self.mask) << self.pos
+
+class Register:
+    """
+       Register description (addresses, access, reset value and bit fields)
+    """
+
+    def __init__(self,desc_p):
+        """init the variable
+
+        Args:
+            desc_p (dict): register description (see the JSON file)
+        """
+        self.name = desc_p['name']
+        self.wire_in = _convert_to_int(desc_p.get('wire_in'))
+        self.wire_out = _convert_to_int(desc_p.get('wire_out'))
+        self.access = desc_p.get('access', 'ro')
+        self.reset = _convert_to_int(desc_p.get('reset', 0))
+        # optional display format of the value: 'adc_voltage', 'ascii'
+        self.format = desc_p.get('format')
+        # optional number of used values of a selector register (ex: ERROR_SEL)
+        self.nb_selectors = desc_p.get('nb_selectors')
+
+        self.field_list = [Field(f['name'], f['pos'], f['width']) for f in desc_p.get('fields', [])]
+        self.fields = {field.name: field for field in self.field_list}
+        # precomputed (name, pos, mask) tuples for the decoding
+        self._decode_list = [(field.name, field.pos, field.mask) for field in self.field_list]
+
+    def encode(self,**fields_p):
+        """Build a register value from bit field values. The missing fields are set to 0.
+
+        Args:
+            fields_p (uint): bit field values by name (ex: encode(rst=1))
+
+        Returns:
+            uint32_t: register value
+        """
+        fields = self.fields
+        data = 0
+        for name, value in fields_p.items():
+            field = fields[name]
+            data |= (value & field.mask) << field.pos
+        return data
+
+    def decode(self,data_p):
+        """Split a register value into its bit field values
+
+        Args:
+            data_p (uint32_t): register value
+
+        Returns:
+            dict: bit field name -> value
+        """
+        return {name: (data_p >> pos) & mask for name, pos, mask in self._decode_list}
+
+class RegisterMap:
+    """
+       Register map loaded from a JSON file
+    """
+
+    def __init__(self,filepath_p):
+        """Load the register map and build the address tables
+
+        Args:
+            filepath_p (str): path to the JSON file
+        """
+        with open(filepath_p, 'r') as file:
+            desc = json.load(file)
+
+        self.name = desc.get('name', '')
+        self.data_width = desc.get('data_width', 32)
+        self.addr_width = desc.get('addr_width', 32)
+
+        self.register_list = [Register(reg_desc) for reg_desc in desc['registers']]
+        self.registers = {register.name: register for register in self.register_list}
+
+        # address tables: register name -> address
+        self.addr_wire_in = {reg.name: reg.wire_in for reg in self.register_list if reg.wire_in is not None}
+        self.addr_wire_out = {reg.name: reg.wire_out for reg in self.register_list if reg.wire_out is not None}
+
+        # reverse tables: address -> register
+        self.register_by_wire_in = {reg.wire_in: reg for reg in self.register_list if reg.wire_in is not None}
+        self.register_by_wire_out = {reg.wire_out: reg for reg in self.register_list if reg.wire_out is not None}
+
+        # trig_in: trigger name -> address, bit name -> bit index
+        self.addr_trigin = {}
+        self.pos_trigin = {}
+        for trig_desc in desc.get('triggers', []):
+            self.addr_trigin[trig_desc['name']] = _convert_to_int(trig_desc['addr'])
+            for bit_desc in trig_desc['bits']:
+                self.pos_trigin[bit_desc['name']] = bit_desc['pos']
+
+        # precomputed (register name, [(field name, pos, mask)]) list for the snapshot decoding
+        self._decode_list = [(reg.name, reg._decode_list) for reg in self.register_list if reg.wire_out is not None]
+
+    def __getitem__(self,reg_name_p):
+        return self.registers[reg_name_p]
+
+    def __contains__(self,reg_name_p):
+        return reg_name_p in self.registers
+
+    def decode_values(self,values_p):
+        """Decode register values into bit field values in one pass
+
+        Args:
+            values_p (mapping): register name -> value (ex: WireOutSnapshot). Missing registers are skipped.
+
+        Returns:
+            dict: register name -> (bit field name -> value)
+        """
+        result = {}
+        for reg_name, decode_list in self._decode_list:
+            data = values_p.get(reg_name)
+            if data is None:
+                continue
+            result[reg_name] = {name: (data >> pos) & mask for name, pos, mask in decode_list}
+        return result
+
+def _convert_to_int(value_p):
+    """convert a JSON value ("0x20" or 32) into an integer
+
+    Args:
+        value_p (str or int): value to convert (None is kept)
+
+    Returns:
+        int: converted value
+    """
+    if isinstance(value_p, str):
+        return int(value_p, 0)
+    return value_p
+
+# loaded register maps (by filepath)
+_regmap_dict = {}
+
+def load_register_map(filepath_p):
+    """Load a register map (only once by filepath)
+
+    Args:
+        filepath_p (str): path to the JSON file. A relative path is relative to this directory
+
+    Returns:
+        RegisterMap: register map
+    """
+    filepath = Path(filepath_p)
+    if not filepath.is_absolute():
+        filepath = regmap_base_path / filepath
+    key = str(filepath)
+    regmap = _regmap_dict.get(key)
+    if regmap is None:
+        regmap = RegisterMap(key)
+        _regmap_dict[key] = regmap
+    return regmap
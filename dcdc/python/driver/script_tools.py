@@ -0,0 +1,116 @@
+# ------------------------------------------------------------------------------------------------------------
+#                            Copyright (C) 2024-2030 Ken-ji de la ROSA, IRAP Toulouse.
+# ------------------------------------------------------------------------------------------------------------
+#                            This file is part of the ATHENA X-IFU DRE Telemetry and Telecommand Firmware.
+#
+#                            dcdc-hk-fw is free software: you can redistribute it and/or modify
+#                            it under the terms of the GNU General Public License as published by
+#                            the Free Software Foundation, either version 3 of the License, or
+#                            (at your option) any later version.
+#
+#                            This program is distributed in the hope that it will be useful,
+#                            but WITHOUT ANY WARRANTY; without even the implied warranty of
+#                            MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#                            GNU General Public License for more details.
+#
+#                            You should have received a copy of the GNU General Public License
+#                            along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------------------------------------
+#    email                   kenji.delarosa@alten.com
+#    @file                   script_tools.py
+# -------------------------------------------------------------------------------------------------------------
+#    Automatic Generation    No
+#    Code Rules Reference    N/A
+# -------------------------------------------------------------------------------------------------------------
+#   @details
+#
+#   Command line options shared by the test scripts:
+#     . add_backend_arguments: --backend, --force-configure, --port, --unix_path (and --stats, --record)
+#     . make_backend: backend selected by the options (a register server can listen on another address)
+#     . open_board/close_board: open the board with these options, start/stop the optional
+#       USB transaction statistics and session recording
+#
+# ------------------------------------------------------------------------------------------------------------
+
+from .register_server import RemoteBackend
+
+def add_backend_arguments(parser_p,default_backend_p='ok',session_p=True):
+    """Add the backend options to a command line parser
+
+    Args:
+        parser_p (argparse.ArgumentParser): command line parser
+        default_backend_p (str): default backend ('ok', 'sim' or 'remote')
+        session_p (bool): True: add also the --stats and --record options
+    """
+    parser_p.add_argument('--backend', '-b', default=default_backend_p, choices=['ok', 'sim', 'remote'],
+                          help='ok: Opal Kelly board, sim: simulated board (no hardware needed), remote: board shared by dcdc_register_server.py.')
+    parser_p.add_argument('--force-configure', action='store_true',
+                          help='Always load the firmware (by default, skipped if the board already runs it).')
+    parser_p.add_argument('--port', type=int, default=None,
+                          help='With --backend remote: TCP port of the register server (default: 50100).')
+    parser_p.add_argument('--unix_path', default=None,
+                          help='With --backend remote: Unix socket of the register server (used instead of the TCP port).')
+    if session_p:
+        parser_p.add_argument('--stats', default=None,
+                              help='Write the USB transaction statistics (by register) to this JSON file.')
+        parser_p.add_argument('--record', default=None,
+                              help='Record the USB transactions to this binary file (see replay_dcdc_session.py).')
+
+def make_backend(args_p):
+    """Get the backend selected by the command line options (see add_backend_arguments)
+
+    Args:
+        args_p (argparse.Namespace): parsed options
+
+    Returns:
+        str or backend instance: backend name ('ok', 'sim') or RemoteBackend
+    """
+    if args_p.backend != 'remote':
+        return args_p.backend
+    # a register server can listen on another address
+    if args_p.port is None:
+        return RemoteBackend(unix_path_p=args_p.unix_path)
+    return RemoteBackend(port_p=args_p.port, unix_path_p=args_p.unix_path)
+
+def open_board(board_p,firmware_filepath_p,args_p):
+    """Open a board with the command line options (see add_backend_arguments)
+    Note:
+      . the optional statistics/recording are started only if the board is opened
+
+    Args:
+        board_p (Driver): board to open (ex: DCDC())
+        firmware_filepath_p (str): path to the FPGA bitstream
+        args_p (argparse.Namespace): parsed options
+
+    Returns:
+        bool: True if the board is ready, False otherwise (see Driver.open)
+    """
+    if not board_p.open(firmware_filepath_p=firmware_filepath_p, backend_p=make_backend(args_p), force_configure_p=args_p.force_configure):
+        return False
+    if getattr(args_p, 'stats', None) is not None:
+        board_p.enable_stats()
+    if getattr(args_p, 'record', None) is not None:
+        if not board_p.start_recording(args_p.record):
+            return False
+    return True
+
+def close_board(board_p,args_p):
+    """Write the optional statistics and stop the optional recording (see open_board)
+
+    Args:
+        board_p (Driver): opened board
+        args_p (argparse.Namespace): parsed options
+    """
+    # USB transaction statistics
+    ###########################################
+    if getattr(args_p, 'stats', None) is not None:
+        board_p.dump_stats(args_p.stats)
+        msg = "USB transaction statistics: " + args_p.stats
+        board_p.display(msg)
+
+    # session recording
+    ###########################################
+    if getattr(args_p, 'record', None) is not None:
+        nb_records = board_p.stop_recording()
+        msg = "USB transactions recorded: " + str(nb_records) + " (" + args_p.record + ")"
+        board_p.display(msg)
@@ -0,0 +1,211 @@
+# ------------------------------------------------------------------------------------------------------------
+#                            Copyright (C) 2024-2030 Ken-ji de la ROSA, IRAP Toulouse.
+# ------------------------------------------------------------------------------------------------------------
+#                            This file is part of the ATHENA X-IFU DRE Telemetry and Telecommand Firmware.
+#
+#                            dcdc-hk-fw is free software: you can redistribute it and/or modify
+#                            it under the terms of the GNU General Public License as published by
+#                            the Free Software Foundation, either version 3 of the License, or
+#                            (at your option) any later version.
+#
+#                            This program is distributed in the hope that it will be useful,
+#                            but WITHOUT ANY WARRANTY; without even the implied warranty of
+#                            MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#                            GNU General Public License for more details.
+#
+#                            You should have received a copy of the GNU General Public License
+#                            along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------------------------------------
+#    email                   kenji.delarosa@alten.com
+#    @file                   session_log.py
+# -------------------------------------------------------------------------------------------------------------
+#    Automatic Generation    No
+#    Code Rules Reference    N/A
+# -------------------------------------------------------------------------------------------------------------
+#   @details
+#
+#   Record and replay of the FrontPanel transactions of a session.
+#     . RecordingDevice: proxy of the device (see Driver.start_recording). Each FrontPanel call
+#       is appended to a binary log as a fixed-size record (see SESSION_LOG_DTYPE)
+#     . replay_session: re-issue a log against a device (real board or simulated backend),
+#       as fast as possible or at the original timing, and compare the read values
+#   Note:
+#     . the pipe data are not recorded (only the transfer lengths): the replay skips the pipe transfers
+#       (a transfer of dummy data would reach the FPGA) and counts them
+#
+# ------------------------------------------------------------------------------------------------------------
+
+# standard library
+import struct
+import time
+
+# numpy
+import numpy as np
+
+# operation codes
+OP_SET_WIRE_IN        = 0
+OP_UPDATE_WIRE_INS    = 1
+OP_UPDATE_WIRE_OUTS   = 2
+OP_GET_WIRE_OUT       = 3
+OP_ACTIVATE_TRIGGER   = 4
+OP_WRITE_PIPE         = 5
+OP_READ_PIPE          = 6
+OP_WRITE_BLOCK_PIPE   = 7
+OP_READ_BLOCK_PIPE    = 8
+
+# log record: time since the start of the recording (expressed in s), operation code, address,
+# value (wire value, trigger bit or pipe length), mask (wire_in mask or block size)
+SESSION_LOG_DTYPE = np.dtype([
+    ('timestamp', '<f8'),
+    ('op', 'u1'),
+    ('addr', 'u1'),
+    ('value', '<u4'),
+    ('mask', '<u4'),
+])
+_c_RECORD_STRUCT = struct.Struct('<dBBII')
+
+class RecordingDevice:
+    """
+       Device proxy which logs the FrontPanel transactions
+    """
+
+    def __init__(self,dev_p,filepath_p):
+        """init the variable
+
+        Args:
+            dev_p (device): device to proxy (ok.okCFrontPanel, SimDevice, ...)
+            filepath_p (str): path to the output log file
+        """
+        self._dev = dev_p
+        self._file = open(filepath_p, 'wb')
+        self._t0 = time.perf_counter()
+        self._pack = _c_RECORD_STRUCT.pack
+        self.nb_records = 0
+
+    def __getattr__(self,name):
+        # the other functions and attributes are not recorded
+        return getattr(self._dev, name)
+
+    def _record(self,op_p,addr_p,value_p,mask_p):
+        self._file.write(self._pack(time.perf_counter() - self._t0, op_p, addr_p, value_p & 0xFFFF_FFFF, mask_p & 0xFFFF_FFFF))
+        self.nb_records += 1
+
+    def close(self):
+        """Close the log file
+
+        Returns:
+            device: proxied device
+        """
+        self._file.close()
+        return self._dev
+
+    def SetWireInValue(self,ep_p,value_p,mask_p=0xFFFF_FFFF):
+        self._record(OP_SET_WIRE_IN, ep_p, value_p, mask_p)
+        return self._dev.SetWireInValue(ep_p, value_p, mask_p)
+
+    def UpdateWireIns(self):
+        self._record(OP_UPDATE_WIRE_INS, 0, 0, 0)
+        return self._dev.UpdateWireIns()
+
+    def UpdateWireOuts(self):
+        self._record(OP_UPDATE_WIRE_OUTS, 0, 0, 0)
+        return self._dev.UpdateWireOuts()
+
+    def GetWireOutValue(self,ep_p):
+        value = self._dev.GetWireOutValue(ep_p)
+        self._record(OP_GET_WIRE_OUT, ep_p, value, 0)
+        return value
+
+    def ActivateTriggerIn(self,ep_p,bit_p):
+        self._record(OP_ACTIVATE_TRIGGER, ep_p, bit_p, 0)
+        return self._dev.ActivateTriggerIn(ep_p, bit_p)
+
+    def WriteToPipeIn(self,ep_p,data_p):
+        self._record(OP_WRITE_PIPE, ep_p, len(data_p), 0)
+        return self._dev.WriteToPipeIn(ep_p, data_p)
+
+    def ReadFromPipeOut(self,ep_p,data_p):
+        self._record(OP_READ_PIPE, ep_p, len(data_p), 0)
+        return self._dev.ReadFromPipeOut(ep_p, data_p)
+
+    def WriteToBlockPipeIn(self,ep_p,block_size_p,data_p):
+        self._record(OP_WRITE_BLOCK_PIPE, ep_p, len(data_p), block_size_p)
+        return self._dev.WriteToBlockPipeIn(ep_p, block_size_p, data_p)
+
+    def ReadFromBlockPipeOut(self,ep_p,block_size_p,data_p):
+        self._record(OP_READ_BLOCK_PIPE, ep_p, len(data_p), block_size_p)
+        return self._dev.ReadFromBlockPipeOut(ep_p, block_size_p, data_p)
+
+def load_session_log(filepath_p):
+    """Load a session log
+
+    Args:
+        filepath_p (str): path to a log written by RecordingDevice
+
+    Returns:
+        np.ndarray: array of SESSION_LOG_DTYPE records
+    """
+    data = np.fromfile(filepath_p, dtype=np.uint8)
+    # a log truncated by a crash is trimmed to its last complete record
+    nb_records = data.shape[0] // SESSION_LOG_DTYPE.itemsize
+    return data[:nb_records * SESSION_LOG_DTYPE.itemsize].view(SESSION_LOG_DTYPE)
+
+def replay_session(filepath_p,dev_p,realtime_p=False,speed_p=1.0):
+    """Re-issue the transactions of a session log against a device
+
+    Args:
+        filepath_p (str): path to the session log
+        dev_p (device): opened device (ex: Driver.dev with the FPGA configured)
+        realtime_p (bool): False: as fast as possible, True: at the original timing
+        speed_p (float): replay speed factor of the original timing (ex: 2.0: twice faster)
+
+    Returns:
+        dict: 'nb_records', 'duration' (expressed in s), 'nb_reads', 'nb_mismatches',
+              'mismatches': wire_out address -> number of read values different from the recorded ones,
+              'nb_skipped_pipes': number of pipe transfers not replayed (the pipe data are not recorded)
+    """
+    log = load_session_log(filepath_p)
+    # python lists: faster than the numpy scalars in the loop
+    timestamp_list = log['timestamp'].tolist()
+    op_list = log['op'].tolist()
+    addr_list = log['addr'].tolist()
+    value_list = log['value'].tolist()
+    mask_list = log['mask'].tolist()
+
+    mismatch_dict = {}
+    nb_reads = 0
+    nb_skipped_pipes = 0
+    t0 = time.perf_counter()
+    for i in range(len(op_list)):
+        op = op_list[i]
+        addr = addr_list[i]
+        value = value_list[i]
+        if realtime_p:
+            delay = timestamp_list[i] / speed_p - (time.perf_counter() - t0)
+            if delay > 0:
+                time.sleep(delay)
+
+        if op == OP_GET_WIRE_OUT:
+            nb_reads += 1
+            if dev_p.GetWireOutValue(addr) != value:
+                mismatch_dict[addr] = mismatch_dict.get(addr, 0) + 1
+        elif op == OP_SET_WIRE_IN:
+            dev_p.SetWireInValue(addr, value, mask_list[i])
+        elif op == OP_UPDATE_WIRE_INS:
+            dev_p.UpdateWireIns()
+        elif op == OP_UPDATE_WIRE_OUTS:
+            dev_p.UpdateWireOuts()
+        elif op == OP_ACTIVATE_TRIGGER:
+            dev_p.ActivateTriggerIn(addr, value)
+        elif op in (OP_WRITE_PIPE, OP_READ_PIPE, OP_WRITE_BLOCK_PIPE, OP_READ_BLOCK_PIPE):
+            # the pipe data are not recorded: never push dummy data into the FPGA
+            nb_skipped_pipes += 1
+
+    report = {}
+    report['nb_records'] = len(op_list)
+    report['duration'] = time.perf_counter() - t0
+    report['nb_reads'] = nb_reads
+    report['nb_mismatches'] = sum(mismatch_dict.values())
+    report['mismatches'] = mismatch_dict
+    report['nb_skipped_pipes'] = nb_skipped_pipes
+    return report
@@ -0,0 +1,390 @@
+# ------------------------------------------------------------------------------------------------------------
+#                            Copyright (C) 2024-2030 Ken-ji de la ROSA, IRAP Toulouse.
+# ------------------------------------------------------------------------------------------------------------
+#                            This file is part of the ATHENA X-IFU DRE Telemetry and Telecommand Firmware.
+#
+#                            dcdc-hk-fw is free software: you can redistribute it and/or modify
+#                            it under the terms of the GNU General Public License as published by
+#                            the Free Software Foundation, either version 3 of the License, or
+#                            (at your option) any later version.
+#
+#                            This program is distributed in the hope that it will be useful,
+#                            but WITHOUT ANY WARRANTY; without even the implied warranty of
+#                            MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#                            GNU General Public License for more details.
+#
+#                            You should have received a copy of the GNU General Public License
+#                            along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------------------------------------
+#    email                   kenji.delarosa@alten.com
+#    @file                   sim.py
+# -------------------------------------------------------------------------------------------------------------
+#    Automatic Generation    No
+#    Code Rules Reference    N/A
+# -------------------------------------------------------------------------------------------------------------
+#   @details
+#
+#   Pure-Python simulation of a FrontPanel device running the DCDC firmware.
+#   It implements the subset of the okCFrontPanel API used by the Driver class and models:
+#     . the wire_in -> wire_out loopback (+0x20) of CTRL, POWER_CONF, DEBUG_CTRL and ERROR_SEL
+#     . the POWER and ADC FSMs started by the TRIG_CTRL trigger (0x40)
+#     . the ERROR_SEL -> ERRORS/STATUS multiplexer
+#     . a pipe_in (0x80 + n) -> pipe_out (0xA0 + n) loopback
+#
+# ------------------------------------------------------------------------------------------------------------
+
+# standard library
+import time
+import random
+
+class SimDeviceInfo:
+    """
+       Device information (same fields as ok.okTDeviceInfo)
+    """
+
+    def __init__(self):
+        """init the variable
+        """
+        self.productName = ""
+        self.deviceMajorVersion = 0
+        self.deviceMinorVersion = 0
+        self.serialNumber = ""
+        self.deviceID = ""
+
+class SimDevice:
+    """
+       Simulated FrontPanel device running the DCDC firmware
+    """
+
+    # FrontPanel error codes
+    NoError = 0
+    Failed = -1
+
+    # wire_in addresses
+    _c_ADDR_CTRL = 0x00
+    _c_ADDR_POWER_CONF = 0x01
+    _c_ADDR_DEBUG_CTRL = 0x18
+    _c_ADDR_ERROR_SEL = 0x19
+
+    # wire_out addresses
+    _c_ADDR_POWER_ADC_STATUS = 0x25
+    _c_ADDR_ADC0 = 0x30
+    _c_ADDR_ERRORS = 0x3A
+    _c_ADDR_STATUS = 0x3B
+    _c_ADDR_HARDWARE_ID = 0x3D
+    _c_ADDR_FIRMWARE_NAME = 0x3E
+    _c_ADDR_FIRMWARE_ID = 0x3F
+
+    # offset between a wire_in and its wire_out mirror
+    _c_ADDR_LOOPBACK_OFFSET = 0x20
+
+    # trig_in
+    _c_ADDR_TRIG_CTRL = 0x40
+    _c_POS_POWER_VALID = 0
+    _c_POS_ADC_VALID = 4
+
+    # ADC
+    _c_ADC_VA = 5
+    _c_ADC_RES = 12
+    # voltage of each ADC channel (expressed in V).
+    # ADC0..ADC3 follow the power state of dmx0, dmx1, ras and wfee. ADC4..ADC7 are always powered.
+    _c_ADC_VOLTAGE = [2.5, 2.5, 2.5, 2.5, 1.2, 1.2, 3.3, 3.3]
+    # noise of the ADC channels (expressed in ADC LSB, standard deviation)
+    _c_ADC_NOISE = 2.0
+
+    def __init__(self,serial_p="SIM-DCDC-0",latency_p=0.0,power_duration_p=1e-3,adc_duration_p=1e-3,nb_selectors_p=2,seed_p=0):
+        """init the variable
+
+        Args:
+            serial_p (str): serial number of the simulated device
+            latency_p (float): duration of each USB transaction (expressed in s)
+            power_duration_p (float): duration of the POWER FSM (expressed in s)
+            adc_duration_p (float): duration of the ADC FSM (expressed in s)
+            nb_selectors_p (uint): number of internal errors/status selectable by ERROR_SEL
+            seed_p (int): seed of the ADC noise generator
+        """
+        self.serial = serial_p
+        self.latency = latency_p
+        self.power_duration = power_duration_p
+        self.adc_duration = adc_duration_p
+
+        # device identifiers
+        self.hardware_id = 0x0000_0001
+        # "dcdc" (ASCII)
+        self.firmware_name = 0x6463_6463
+        self.firmware_id = 0x0000_0002
+
+        # number of USB transactions (UpdateWireIns, UpdateWireOuts, ActivateTriggerIn, pipes)
+        self.nb_transactions = 0
+
+        # FPGA configuration
+        self.firmware_filepath = None
+        self._configured = False
+
+        self._random = random.Random(seed_p)
+        self._nb_selectors = nb_selectors_p
+        self._reset_registers()
+
+    def _reset_registers(self):
+        """Reset the registers and the FSMs
+        """
+        # wire_in values: staged by SetWireInValue, applied by UpdateWireIns
+        self._wire_in_staged = [0] * 32
+        self._wire_in = [0] * 32
+        # wire_out values latched by UpdateWireOuts
+        self._wire_out = [0] * 32
+
+        # power FSM
+        self._power_state = 0
+        self._power_conf_pending = 0
+        self._power_done_time = None
+
+        # ADC FSM
+        self._adc_done_time = None
+        self._adc_data = [0] * len(self._c_ADC_VOLTAGE)
+
+        # pipe_in (0x80 + n) -> pipe_out (0xA0 + n) loopback FIFOs
+        self._pipe_fifo = {}
+
+        # internal errors/status (one value by selector)
+        self.errors = [0] * self._nb_selectors
+        self.status = [0] * self._nb_selectors
+
+    def _transaction(self):
+        """Simulate the duration of a USB transaction
+        """
+        self.nb_transactions += 1
+        latency = self.latency
+        if latency > 0:
+            if latency >= 1e-3:
+                time.sleep(latency)
+            else:
+                # busy wait: time.sleep isn't accurate below the millisecond
+                deadline = time.perf_counter() + latency
+                while time.perf_counter() < deadline:
+                    pass
+
+    def _update_fsm(self):
+        """Complete the POWER and ADC FSMs if their duration is elapsed
+        """
+        now = time.perf_counter()
+        if (self._power_done_time is not None) and (now >= self._power_done_time):
+            self._power_state = self._power_conf_pending
+            self._power_done_time = None
+        if (self._adc_done_time is not None) and (now >= self._adc_done_time):
+            self._adc_data = self._compute_adc_data()
+            self._adc_done_time = None
+
+    def _compute_adc_data(self):
+        """Compute the ADC values according to the power state
+
+        Returns:
+            list of uint: ADC numerical values
+        """
+        full_scale = 2**self._c_ADC_RES - 1
+        lsb = self._c_ADC_VA / 2**self._c_ADC_RES
+        data_list = []
+        for i, voltage in enumerate(self._c_ADC_VOLTAGE):
+            if (i < 4) and (((self._power_state >> i) & 0x1) == 0):
+                voltage = 0.0
+            code = int(round(voltage / lsb + self._random.gauss(0.0, self._c_ADC_NOISE)))
+            data_list.append(min(max(code, 0), full_scale))
+        return data_list
+
+    def set_error(self,sel_p,value_p):
+        """Inject an internal error
+
+        Args:
+            sel_p (uint): error selector
+            value_p (uint32_t): error value
+        """
+        self.errors[sel_p] = value_p
+
+    ###########################################
+    # okCFrontPanel API
+    def GetDeviceInfo(self,info_p):
+        info_p.productName = "SIM-DCDC"
+        info_p.deviceMajorVersion = 1
+        info_p.deviceMinorVersion = 0
+        info_p.serialNumber = self.serial
+        info_p.deviceID = "sim"
+        return self.NoError
+
+    def GetSerialNumber(self):
+        return self.serial
+
+    def LoadDefaultPLLConfiguration(self):
+        return self.NoError
+
+    def ConfigureFPGA(self,firmware_filepath_p):
+        self._transaction()
+        self.firmware_filepath = firmware_filepath_p
+        self._configured = True
+        self._reset_registers()
+        return self.NoError
+
+    def IsFrontPanelEnabled(self):
+        return self._configured
+
+    def SetWireInValue(self,ep_p,value_p,mask_p=0xFFFF_FFFF):
+        index = ep_p & 0x1F
+        staged = self._wire_in_staged[index]
+        self._wire_in_staged[index] = (staged & ~mask_p & 0xFFFF_FFFF) | (value_p & mask_p)
+        return self.NoError
+
+    def UpdateWireIns(self):
+        self._transaction()
+        self._wire_in = list(self._wire_in_staged)
+
+        # CTRL: software reset (the wire_in values are kept)
+        if self._wire_in[self._c_ADDR_CTRL] & 0x1:
+            self._power_state = 0
+            self._power_done_time = None
+            self._adc_done_time = None
+            self._adc_data = [0] * len(self._c_ADC_VOLTAGE)
+            self.errors = [0] * self._nb_selectors
+        # DEBUG_CTRL: reset of the internal errors
+        if (self._wire_in[self._c_ADDR_DEBUG_CTRL] >> 1) & 0x1:
+            self.errors = [0] * self._nb_selectors
+
+    def UpdateWireOuts(self):
+        self._transaction()
+        self._update_fsm()
+
+        wire_out = self._wire_out
+        offset = self._c_ADDR_LOOPBACK_OFFSET
+        for addr in [self._c_ADDR_CTRL, self._c_ADDR_POWER_CONF, self._c_ADDR_DEBUG_CTRL, self._c_ADDR_ERROR_SEL]:
+            wire_out[addr] = self._wire_in[addr]
+
+        power_ready = int(self._power_done_time is None)
+        adc_ready = int(self._adc_done_time is None)
+        wire_out[self._c_ADDR_POWER_ADC_STATUS - offset] = (adc_ready << 4) + power_ready
+
+        for i, data in enumerate(self._adc_data):
+            wire_out[self._c_ADDR_ADC0 - offset + i] = data
+
+        sel = self._wire_in[self._c_ADDR_ERROR_SEL]
+        if sel < self._nb_selectors:
+            wire_out[self._c_ADDR_ERRORS - offset] = self.errors[sel]
+            wire_out[self._c_ADDR_STATUS - offset] = self.status[sel]
+        else:
+            wire_out[self._c_ADDR_ERRORS - offset] = 0
+            wire_out[self._c_ADDR_STATUS - offset] = 0
+
+        wire_out[self._c_ADDR_HARDWARE_ID - offset] = self.hardware_id
+        wire_out[self._c_ADDR_FIRMWARE_NAME - offset] = self.firmware_name
+        wire_out[self._c_ADDR_FIRMWARE_ID - offset] = self.firmware_id
+
+    def GetWireOutValue(self,ep_p):
+        return self._wire_out[ep_p - self._c_ADDR_LOOPBACK_OFFSET]
+
+    def ActivateTriggerIn(self,ep_p,bit_p):
+        self._transaction()
+        self._update_fsm()
+        if ep_p != self._c_ADDR_TRIG_CTRL:
+            return self.NoError
+
+        now = time.perf_counter()
+        if bit_p == self._c_POS_POWER_VALID:
+            if self._power_done_time is not None:
+                # error: the POWER FSM is busy
+                self.errors[0] |= 0x1
+            else:
+                self._power_conf_pending = self._wire_in[self._c_ADDR_POWER_CONF] & 0xF
+                self._power_done_time = now + self.power_duration
+        elif bit_p == self._c_POS_ADC_VALID:
+            if self._adc_done_time is not None:
+                # error: the ADC FSM is busy
+                self.errors[0] |= 0x2
+            else:
+                self._adc_done_time = now + self.adc_duration
+        return self.NoError
+
+    def WriteToPipeIn(self,ep_p,data_p):
+        self._transaction()
+        fifo = self._pipe_fifo.setdefault(ep_p + 0x20, bytearray())
+        fifo += data_p
+        return len(data_p)
+
+    def WriteToBlockPipeIn(self,ep_p,block_size_p,data_p):
+        if len(data_p) % block_size_p != 0:
+            return self.Failed
+        return self.WriteToPipeIn(ep_p, data_p)
+
+    def ReadFromPipeOut(self,ep_p,data_p):
+        self._transaction()
+        nb_bytes = len(data_p)
+        fifo = self._pipe_fifo.setdefault(ep_p, bytearray())
+        nb_available = min(nb_bytes, len(fifo))
+        data_p[:nb_available] = fifo[:nb_available]
+        # an empty FIFO returns zeros
+        data_p[nb_available:] = bytes(nb_bytes - nb_available)
+        del fifo[:nb_available]
+        return nb_bytes
+
+    def ReadFromBlockPipeOut(self,ep_p,block_size_p,data_p):
+        if len(data_p) % block_size_p != 0:
+            return self.Failed
+        return self.ReadFromPipeOut(ep_p, data_p)
+
+    def Close(self):
+        pass
+
+class SimBackend:
+    """
+       Open simulated DCDC devices
+    """
+
+    name = 'sim'
+    # the client loads the firmware (see Driver.open)
+    can_configure = True
+    # the pipes are available (see Driver.write_pipe)
+    can_pipe = True
+
+    def __init__(self,latency_p=0.0,power_duration_p=1e-3,adc_duration_p=1e-3,nb_devices_p=1,nb_selectors_p=2):
+        """init the variable
+
+        Args:
+            latency_p (float): duration of each USB transaction (expressed in s)
+            power_duration_p (float): duration of the POWER FSM (expressed in s)
+            adc_duration_p (float): duration of the ADC FSM (expressed in s)
+            nb_devices_p (uint): number of simulated devices (serial numbers: SIM-DCDC-0, SIM-DCDC-1, ...)
+            nb_selectors_p (uint): number of internal errors/status selectable by ERROR_SEL
+        """
+        self.latency = latency_p
+        self.power_duration = power_duration_p
+        self.adc_duration = adc_duration_p
+        self.nb_devices = nb_devices_p
+        self.nb_selectors = nb_selectors_p
+
+    def list_serials(self):
+        """List the serial numbers of the simulated devices
+
+        Returns:
+            list of str: serial numbers
+        """
+        return ["SIM-DCDC-" + str(i) for i in range(self.nb_devices)]
+
+    def open_device(self,serial_p=None):
+        """Open a simulated device
+
+        Args:
+            serial_p (str): serial number of the device (None: first device)
+
+        Returns:
+            SimDevice: opened device (None if the serial number is unknown)
+        """
+        serial_list = self.list_serials()
+        if serial_p is None:
+            serial_p = serial_list[0]
+        elif serial_p not in serial_list:
+            return None
+        return SimDevice(serial_p=serial_p, latency_p=self.latency, power_duration_p=self.power_duration, adc_duration_p=self.adc_duration, nb_selectors_p=self.nb_selectors)
+
+    def new_device_info(self):
+        """Create an empty device information structure
+
+        Returns:
+            SimDeviceInfo: device information structure
+        """
+        return SimDeviceInfo()
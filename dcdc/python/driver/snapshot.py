@@ -0,0 +1,116 @@
+# ------------------------------------------------------------------------------------------------------------
+#                            Copyright (C) 2024-2030 Ken-ji de la ROSA, IRAP Toulouse.
+# ------------------------------------------------------------------------------------------------------------
+#                            This file is part of the ATHENA X-IFU DRE Telemetry and Telecommand Firmware.
+#
+#                            dcdc-hk-fw is free software: you can redistribute it and/or modify
+#                            it under the terms of the GNU General Public License as published by
+#                            the Free Software Foundation, either version 3 of the License, or
+#                            (at your option) any later version.
+#
+#                            This program is distributed in the hope that it will be useful,
+#                            but WITHOUT ANY WARRANTY; without even the implied warranty of
+#                            MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#                            GNU General Public License for more details.
+#
+#                            You should have received a copy of the GNU General Public License
+#                            along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------------------------------------
+#    email                   kenji.delarosa@alten.com
+#    @file                   snapshot.py
+# -------------------------------------------------------------------------------------------------------------
+#    Automatic Generation    No
+#    Code Rules Reference    N/A
+# -------------------------------------------------------------------------------------------------------------
+#   @details
+#
+#   Immutable set of wire_out values read with a single UpdateWireOuts
+#
+# ------------------------------------------------------------------------------------------------------------
+
+# standard library
+from types import MappingProxyType
+
+class WireOutSnapshot:
+    """
+       Immutable set of wire_out values read with a single UpdateWireOuts.
+       The values are accessible by register name (snapshot['ADC0']) or by address (get_by_addr).
+    """
+
+    __slots__ = ('_values', '_values_by_addr', '_timestamp', '_epoch')
+
+    def __init__(self,name_list_p,addr_list_p,value_list_p,timestamp_p,epoch_p):
+        """init the variable
+
+        Args:
+            name_list_p (list of str): register names
+            addr_list_p (list of uint8_t): register addresses (same order as name_list_p)
+            value_list_p (list of uint32_t): read values (same order as name_list_p)
+            timestamp_p (float): time.perf_counter() value at the reading time (expressed in s)
+            epoch_p (uint): Driver transaction epoch at the reading time
+        """
+        object.__setattr__(self, '_values', MappingProxyType(dict(zip(name_list_p, value_list_p))))
+        object.__setattr__(self, '_values_by_addr', MappingProxyType(dict(zip(addr_list_p, value_list_p))))
+        object.__setattr__(self, '_timestamp', timestamp_p)
+        object.__setattr__(self, '_epoch', epoch_p)
+
+    def __setattr__(self,name_p,value_p):
+        raise AttributeError("WireOutSnapshot is immutable")
+
+    def __delattr__(self,name_p):
+        raise AttributeError("WireOutSnapshot is immutable")
+
+    def __getitem__(self,reg_name_p):
+        return self._values[reg_name_p]
+
+    def __contains__(self,reg_name_p):
+        return reg_name_p in self._values
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __repr__(self):
+        str_values = ", ".join(name + "=0x" + '{0:08x}'.format(value) for name, value in self._values.items())
+        return "WireOutSnapshot(" + str_values + ")"
+
+    @property
+    def values(self):
+        """read-only mapping: register name -> value"""
+        return self._values
+
+    @property
+    def timestamp(self):
+        """time.perf_counter() value at the reading time (expressed in s)"""
+        return self._timestamp
+
+    @property
+    def epoch(self):
+        """Driver transaction epoch at the reading time"""
+        return self._epoch
+
+    def get(self,reg_name_p,default_p=None):
+        """Get a register value by name
+
+        Args:
+            reg_name_p (str): register name
+            default_p (uint32_t): value returned if the register isn't in the snapshot
+
+        Returns:
+            uint32_t: register value
+        """
+        return self._values.get(reg_name_p, default_p)
+
+    def get_by_addr(self,addr_p,default_p=None):
+        """Get a register value by address
+
+        Args:
+            addr_p (uint8_t): address of the wire_out
+            default_p (uint32_t): value returned if the address isn't in the snapshot
+
+        Returns:
+            uint32_t: register value
+        """
+        return self._values_by_addr.get(addr_p, default_p)
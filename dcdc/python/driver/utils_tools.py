@@ -30,6 +30,182 @@
 
 # standard library
 import math
+import sys
+import threading
+import queue
+
+class ConsoleSink:
+    """
+       Write the display messages to the console (sys.stdout) without buffering
+    """
+
+    # False: the messages are discarded (the Display functions return immediately)
+    enabled = True
+
+    def write(self,text_p):
+        """write a text
+
+        Args:
+            text_p (str): text to write
+        """
+        sys.stdout.write(text_p)
+
+    def flush(self):
+        """flush the pending texts
+        """
+        sys.stdout.flush()
+
+    def close(self):
+        """flush and release the sink
+        """
+        self.flush()
+
+class StreamSink:
+    """
+       Buffer the display messages and write them in bulk to a stream
+    """
+
+    enabled = True
+
+    def __init__(self,stream_p=None,buffer_size_p=65536):
+        """init the variable
+
+        Args:
+            stream_p (stream): output stream (default: sys.stdout at the flush time)
+            buffer_size_p (uint): number of buffered characters triggering a flush
+        """
+        self._stream = stream_p
+        self._buffer_size = buffer_size_p
+        self._text_list = []
+        self._size = 0
+
+    def write(self,text_p):
+        """write a text
+
+        Args:
+            text_p (str): text to write
+        """
+        self._text_list.append(text_p)
+        self._size += len(text_p)
+        if self._size >= self._buffer_size:
+            self.flush()
+
+    def flush(self):
+        """flush the pending texts
+        """
+        stream = self._stream
+        if stream is None:
+            stream = sys.stdout
+        if self._text_list:
+            stream.write("".join(self._text_list))
+            self._text_list = []
+            self._size = 0
+        stream.flush()
+
+    def close(self):
+        """flush and release the sink
+        """
+        self.flush()
+
+class ThreadSink:
+    """
+       Write the display messages to a stream from a background thread
+       (the calling thread never waits on the console)
+    """
+
+    enabled = True
+
+    def __init__(self,stream_p=None):
+        """init the variable
+
+        Args:
+            stream_p (stream): output stream (default: sys.stdout)
+        """
+        if stream_p is None:
+            stream_p = sys.stdout
+        self._stream = stream_p
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="display-writer", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        """background thread: write the queued texts (in bulk when several are pending)
+        """
+        while True:
+            text_list = [self._queue.get()]
+            while True:
+                try:
+                    text_list.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = None in text_list
+            self._stream.write("".join(text for text in text_list if text is not None))
+            self._stream.flush()
+            for i in range(len(text_list)):
+                self._queue.task_done()
+            if stop:
+                break
+
+    def write(self,text_p):
+        """write a text
+
+        Args:
+            text_p (str): text to write
+        """
+        self._queue.put(text_p)
+
+    def flush(self):
+        """wait until all the pending texts are written
+        """
+        # after close, no thread empties the queue anymore
+        if self._thread.is_alive():
+            self._queue.join()
+
+    def close(self):
+        """flush and stop the background thread
+        """
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+
+class FileSink(StreamSink):
+    """
+       Buffer the display messages and write them in bulk to a file
+    """
+
+    def __init__(self,filepath_p,mode_p='w',buffer_size_p=65536):
+        """init the variable
+
+        Args:
+            filepath_p (str): output filepath
+            mode_p (str): file opening mode ('w': overwrite, 'a': append)
+            buffer_size_p (uint): number of buffered characters triggering a flush
+        """
+        self._file = open(filepath_p, mode_p)
+        super().__init__(stream_p=self._file, buffer_size_p=buffer_size_p)
+
+    def close(self):
+        """flush and close the file
+        """
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+class NullSink:
+    """
+       Discard the display messages
+    """
+
+    enabled = False
+
+    def write(self,text_p):
+        pass
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
 
 class Display:
     """
@@ -51,7 +227,26 @@ class Display:
         # level of indentation
         self.level = 0
 
+        # output of the display functions (see the set_sink function)
+        self._sink = ConsoleSink()
+
+        # cache of the indentation/separator strings
+        self._indent_cache = {}
+        self._section_cache = {}
+
+    def set_sink(self,sink_p):
+        """Select the output of the display functions
+
+        Args:
+            sink_p (sink instance): ConsoleSink (default), StreamSink, ThreadSink, FileSink or NullSink
+        """
+        self._sink.flush()
+        self._sink = sink_p
 
+    def flush(self):
+        """Write the pending messages of the sink
+        """
+        self._sink.flush()
 
     def _compute_indent(self,level_p):
         """compute the string for the indentation
@@ -66,7 +261,12 @@ class Display:
             level = self.level
         else:
             level = level_p
-        return self.char_indent * self.nb_char_indent * level
+        key = (self.char_indent, self.nb_char_indent, level)
+        str_indent = self._indent_cache.get(key)
+        if str_indent is None:
+            str_indent = self.char_indent * self.nb_char_indent * level
+            self._indent_cache[key] = str_indent
+        return str_indent
 
     def _compute_section(self):
         """Compute the string for the section (separator)
@@ -74,7 +274,12 @@ class Display:
         Returns:
             str: string for the section
         """
-        return self.char_section * self.nb_char_section
+        key = (self.char_section, self.nb_char_section)
+        str_section = self._section_cache.get(key)
+        if str_section is None:
+            str_section = self.char_section * self.nb_char_section
+            self._section_cache[key] = str_section
+        return str_section
 
     def display_title(self,msg_p,level_p=None):
         """print a title to the console
@@ -84,18 +289,19 @@ class Display:
             level_p (uint): level of indentation
         """
 
+        if not self._sink.enabled:
+            return
         msg_list = convert_str_to_str_list(msg_p=msg_p)
         str_indent = self._compute_indent(level_p=level_p)
         str_section = self._compute_section()
 
         str_sep = str_indent + str_section
 
-        print("")
-        print(str_sep)
+        line_list = ["", str_sep]
         for msg in msg_list:
-            str0 = str_indent + " " + msg
-            print(str0)
-        print(str_sep)
+            line_list.append(str_indent + " " + msg)
+        line_list.append(str_sep)
+        self._sink.write("\n".join(line_list) + "\n")
 
     def display_subtitle(self,msg_p,level_p=None):
         """print a subtitle to the console
@@ -105,17 +311,19 @@ class Display:
             level_p (uint): level of indentation
         """
 
+        if not self._sink.enabled:
+            return
         msg_list = convert_str_to_str_list(msg_p=msg_p)
         str_indent = self._compute_indent(level_p=level_p)
         str_section = self._compute_section()
 
         str_sep = str_indent + str_section
 
-        print("")
+        line_list = [""]
         for msg in msg_list:
-            str0 = str_indent + " " + msg
-            print(str0)
-        print(str_sep)
+            line_list.append(str_indent + " " + msg)
+        line_list.append(str_sep)
+        self._sink.write("\n".join(line_list) + "\n")
 
     def display(self,msg_p,level_p=None):
         """print a subtitle to the console
@@ -125,12 +333,15 @@ class Display:
             level_p (uint): level of indentation
         """
 
-        msg_list = convert_str_to_str_list(msg_p=msg_p)
+        if not self._sink.enabled:
+            return
         str_indent = self._compute_indent(level_p=level_p)
 
-        for msg in msg_list:
-            str0 = str_indent + " " + msg
-            print(str0)
+        if isinstance(msg_p, list):
+            str_prefix = str_indent + " "
+            self._sink.write("".join([str_prefix + msg + "\n" for msg in msg_p]))
+        else:
+            self._sink.write(str_indent + " " + msg_p + "\n")
 
     def display_register(self,addr_p, addr_width_p, data_p, data_width_p,level_p=None):
         """print the register (addr, data)
@@ -143,10 +354,12 @@ class Display:
             level_p (uint): level of indentation
         """
 
-        msg = "addr: 0x" + convert_uint_to_str_hex(addr_p,addr_width_p)
-        self.display(msg,level_p)
-        msg = "data: 0x" + convert_uint_to_str_hex(data_p,data_width_p)
-        self.display(msg,level_p)
+        if not self._sink.enabled:
+            return
+        msg_list = []
+        msg_list.append("addr: 0x" + convert_uint_to_str_hex(addr_p,addr_width_p))
+        msg_list.append("data: 0x" + convert_uint_to_str_hex(data_p,data_width_p))
+        self.display(msg_list,level_p)
 
     def display_bit_from_data(self,bit_name_p, bit_pos_p, bit_width_p, data_p,level_p=None):
         """print the bit field value
@@ -158,6 +371,8 @@ class Display:
             data_p (int): data where to extract the bit field
             level_p (uint): level of indentation
         """
+        if not self._sink.enabled:
+            return
 
         #  build mask for the data bit field
         mask = 2**(bit_width_p) - 1
@@ -175,6 +390,8 @@ class Display:
             bit_width_p (uint): bit field width (expressed in bits: start@1)
             level_p (uint): level of indentation
         """
+        if not self._sink.enabled:
+            return
         # convert int to uint
         if bit_value_p < 0:
             bit_value = convert_int_to_uint(bit_value_p, bit_width_p)
@@ -233,6 +450,9 @@ def convert_str_to_str_list(msg_p):
     else:
         return [msg_p]
 
+# cache of the formatting strings by value width (see convert_uint_to_str_hex)
+_str_hex_format_dict = {}
+
 def convert_uint_to_str_hex(value_p, width_p):
     """Convert an integer into a hexadecimal string
 
@@ -243,10 +463,13 @@ def convert_uint_to_str_hex(value_p, width_p):
     Returns:
         str: hexadecimal string
     """
-    # compute the number of hex characters
-    nb_hex_char = math.ceil(width_p/4)
-    # compute the formatting string
-    str_format = '{0:0' + str(nb_hex_char) + 'x}'
+    str_format = _str_hex_format_dict.get(width_p)
+    if str_format is None:
+        # compute the number of hex characters
+        nb_hex_char = math.ceil(width_p/4)
+        # compute the formatting string
+        str_format = '{0:0' + str(nb_hex_char) + 'x}'
+        _str_hex_format_dict[width_p] = str_format
     # convert value to hexadecimal string
     str_hex = str_format.format(value_p)
 
@@ -264,16 +487,11 @@ def convert_uint_to_ascii(value_p, width_p):
     """
 
     # compute the number of bytes
-    nb_bytes = math.ceil(width_p/8)
-
-    str0 = ''
-    for i in range(nb_bytes):
-        # scan each bytes
-        value = (value_p >> (8*i) ) & 0xFF
-        # convert each byte into ASCII character
-        ascii_str = chr(value)
-        # build ascii string
-        str0 = ascii_str + str0
+    nb_bytes = (width_p + 7) // 8
+
+    # one character by byte (the most significant byte first)
+    value = value_p & ((1 << (8*nb_bytes)) - 1)
+    str0 = value.to_bytes(nb_bytes, 'big').decode('latin-1')
 
     return str0
 
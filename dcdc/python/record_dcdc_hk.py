@@ -0,0 +1,150 @@
+# ------------------------------------------------------------------------------------------------------------
+#                            Copyright (C) 2024-2030 Ken-ji de la ROSA, IRAP Toulouse.
+# ------------------------------------------------------------------------------------------------------------
+#                            This file is part of the ATHENA X-IFU DRE Telemetry and Telecommand Firmware.
+#
+#                            dcdc-hk-fw is free software: you can redistribute it and/or modify
+#                            it under the terms of the GNU General Public License as published by
+#                            the Free Software Foundation, either version 3 of the License, or
+#                            (at your option) any later version.
+#
+#                            This program is distributed in the hope that it will be useful,
+#                            but WITHOUT ANY WARRANTY; without even the implied warranty of
+#                            MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#                            GNU General Public License for more details.
+#
+#                            You should have received a copy of the GNU General Public License
+#                            along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------------------------------------
+#    email                   kenji.delarosa@alten.com
+#    @file                   record_dcdc_hk.py 
+# -------------------------------------------------------------------------------------------------------------
+#    Automatic Generation    No
+#    Code Rules Reference    N/A
+# -------------------------------------------------------------------------------------------------------------
+#   @details
+#
+#   Record the DCDC housekeeping (ADC, POWER_ADC_STATUS, STATUS, ERRORS) to binary files
+#
+# ------------------------------------------------------------------------------------------------------------
+
+# Standard library
+import sys
+from pathlib import Path
+import time
+import argparse
+import os
+
+# numpy
+import numpy as np
+
+# get the script base path
+script_base_path = str(Path(__file__).parents[0])
+script_name      = str(Path(__file__).stem)
+
+# custom library
+from driver import DCDC,HkRecorder,load_hk_file,add_backend_arguments,open_board
+
+
+def summarize_hk_files(device_p,filepath_list_p):
+    """Display the statistics of the recorded ADC voltages
+
+    Args:
+        device_p (DCDC): DCDC board (conversion and display)
+        filepath_list_p (list of str): recorded files
+    """
+    device = device_p
+    for filepath in filepath_list_p:
+        data = load_hk_file(filepath)
+        msg_list = []
+        msg_list.append("file: " + filepath + " (" + str(data.shape[0]) + " frames)")
+        if data.shape[0] != 0:
+            # the frames acquired after an ADC timeout have stale ADC codes
+            valid = data['adc_latency'] >= 0
+            if np.any(valid):
+                voltages = device.compute_adc_voltages(data['adc'][valid])
+                for i, name in enumerate(device._adc_name_list):
+                    msg_list.append("    " + name + ": mean (V): " + '{0:.4f}'.format(voltages[:, i].mean()) + ", min (V): " + '{0:.4f}'.format(voltages[:, i].min()) + ", max (V): " + '{0:.4f}'.format(voltages[:, i].max()))
+            nb_errors = np.count_nonzero(data['errors'])
+            msg_list.append("    frames with ERRORS != 0: " + str(nb_errors))
+            nb_timeouts = data.shape[0] - np.count_nonzero(valid)
+            msg_list.append("    frames with an ADC timeout (stale ADC codes): " + str(nb_timeouts))
+        device.display(msg_list)
+
+
+if __name__ == '__main__':
+
+    ###########################################
+    # parse command line
+    ###########################################
+    # user-defined: default firmware filepath (relative to this script path)
+    default_firmware_filpath = "..\\..\\dcdc-fw_002.bit"
+    # user-defined: default output directory (relative to this script path)
+    default_output_dir = "hk"
+
+    parser = argparse.ArgumentParser(description='Define command line arguments')
+    # add an optional argument with limited choices
+    parser.add_argument('--firmware_filepath', '-f', default=default_firmware_filpath,
+                        help='The firmware filepath can be absolute or relative to this script path.')
+    add_backend_arguments(parser, session_p=False)
+    parser.add_argument('--output_dir', '-o', default=default_output_dir,
+                        help='The output directory can be absolute or relative to this script path.')
+    parser.add_argument('--rate', type=float, default=1.0,
+                        help='Number of frames by second.')
+    parser.add_argument('--duration', type=float, default=None,
+                        help='Recording duration (expressed in s). Default: until Ctrl+C.')
+    parser.add_argument('--nb_frames', type=int, default=None,
+                        help='Number of frames to record. Default: until Ctrl+C.')
+    parser.add_argument('--max_file_size', type=float, default=64,
+                        help='Maximal size of one file (expressed in MiB).')
+    parser.add_argument('--max_file_duration', type=float, default=3600,
+                        help='Maximal duration of one file (expressed in s).')
+
+    args_known = parser. parse_known_args()
+    # get arguments defined in this file.
+    args = args_known[0]
+    # get arguments not defined in this file in order to pass them to the called script.
+    args_unknown = args_known[1]
+
+    ###########################################
+    # User-defined parameters
+    ###########################################
+    # path to the firmware
+    firmware_filepath = args.firmware_filepath
+
+    if os.path.isabs(firmware_filepath):
+        # absolute path
+        firmware_filepath = firmware_filepath
+    else:
+        # compute the absolute path relative to this script path
+        firmware_filepath = str(Path(script_base_path,firmware_filepath).resolve())
+
+    output_dir = args.output_dir
+    if not os.path.isabs(output_dir):
+        output_dir = str(Path(script_base_path,output_dir).resolve())
+
+    # level of verbosity
+    verbosity = 0
+
+
+    ###########################################
+    # Start script
+    ###########################################
+
+    # Program the FPGA
+    board = DCDC()
+    if not open_board(board, firmware_filepath, args):
+        sys.exit(1)
+
+    # no print by register access
+    board.set_verbosity(-1)
+
+    msg = "Housekeeping recording: " + script_name
+    board.display_title(msg)
+
+    recorder = HkRecorder(board, output_dir, rate_p=args.rate, max_file_size_p=int(args.max_file_size*1024*1024), max_file_duration_p=args.max_file_duration)
+    recorder.run(duration_p=args.duration, nb_frames_p=args.nb_frames)
+
+    board.set_verbosity(verbosity)
+    board.display_title("SUMMARY")
+    summarize_hk_files(board, recorder.filepath_list)
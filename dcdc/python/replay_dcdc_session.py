@@ -0,0 +1,107 @@
+# ------------------------------------------------------------------------------------------------------------
+#                            Copyright (C) 2024-2030 Ken-ji de la ROSA, IRAP Toulouse.
+# ------------------------------------------------------------------------------------------------------------
+#                            This file is part of the ATHENA X-IFU DRE Telemetry and Telecommand Firmware.
+#
+#                            dcdc-hk-fw is free software: you can redistribute it and/or modify
+#                            it under the terms of the GNU General Public License as published by
+#                            the Free Software Foundation, either version 3 of the License, or
+#                            (at your option) any later version.
+#
+#                            This program is distributed in the hope that it will be useful,
+#                            but WITHOUT ANY WARRANTY; without even the implied warranty of
+#                            MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#                            GNU General Public License for more details.
+#
+#                            You should have received a copy of the GNU General Public License
+#                            along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------------------------------------
+#    email                   kenji.delarosa@alten.com
+#    @file                   replay_dcdc_session.py
+# -------------------------------------------------------------------------------------------------------------
+#    Automatic Generation    No
+#    Code Rules Reference    N/A
+# -------------------------------------------------------------------------------------------------------------
+#   @details
+#
+#   Replay a recorded session (see the --record option of the test scripts) on a board or a simulated board
+#
+# ------------------------------------------------------------------------------------------------------------
+
+# Standard library
+import sys
+from pathlib import Path
+import time
+import argparse
+import os
+
+# get the script base path
+script_base_path = str(Path(__file__).parents[0])
+script_name      = str(Path(__file__).stem)
+
+# custom library
+from driver import DCDC,replay_session,add_backend_arguments,open_board
+
+
+if __name__ == '__main__':
+
+    ###########################################
+    # parse command line
+    ###########################################
+    # user-defined: default firmware filepath (relative to this script path)
+    default_firmware_filpath = "..\\..\\dcdc-fw_002.bit"
+
+    parser = argparse.ArgumentParser(description='Define command line arguments')
+    parser.add_argument('session_filepath',
+                        help='Session log recorded with the --record option of the test scripts.')
+    # add an optional argument with limited choices
+    parser.add_argument('--firmware_filepath', '-f', default=default_firmware_filpath,
+                        help='The firmware filepath can be absolute or relative to this script path.')
+    add_backend_arguments(parser, default_backend_p='sim', session_p=False)
+    parser.add_argument('--realtime', action='store_true',
+                        help='Replay at the original timing (default: as fast as possible).')
+    parser.add_argument('--speed', type=float, default=1.0,
+                        help='With --realtime: speed factor of the original timing (ex: 2: twice faster).')
+
+    args_known = parser. parse_known_args()
+    # get arguments defined in this file.
+    args = args_known[0]
+    # get arguments not defined in this file in order to pass them to the called script.
+    args_unknown = args_known[1]
+
+    ###########################################
+    # User-defined parameters
+    ###########################################
+    # path to the firmware
+    firmware_filepath = args.firmware_filepath
+
+    if os.path.isabs(firmware_filepath):
+        # absolute path
+        firmware_filepath = firmware_filepath
+    else:
+        # compute the absolute path relative to this script path
+        firmware_filepath = str(Path(script_base_path,firmware_filepath).resolve())
+
+    ###########################################
+    # Start script
+    ###########################################
+
+    # Program the FPGA
+    board = DCDC()
+    if not open_board(board, firmware_filepath, args):
+        sys.exit(1)
+
+    msg = "Session replay: " + args.session_filepath
+    board.display_title(msg)
+
+    report = replay_session(args.session_filepath, board.dev, realtime_p=args.realtime, speed_p=args.speed)
+
+    msg_list = []
+    msg_list.append("replayed transactions: " + str(report['nb_records']) + " in (s): " + '{0:.3f}'.format(report['duration']))
+    msg_list.append("read values: " + str(report['nb_reads']) + ", different from the recording: " + str(report['nb_mismatches']))
+    for addr, nb_mismatches in sorted(report['mismatches'].items()):
+        msg_list.append("    addr 0x" + '{0:02x}'.format(addr) + ": " + str(nb_mismatches))
+    if report['nb_skipped_pipes'] > 0:
+        msg_list.append("[WARNING]: skipped pipe transfers (the pipe data are not recorded): " + str(report['nb_skipped_pipes']))
+    board.display(msg_list)
+    board.display("Note: the ADC values and the FSM status may differ between 2 runs")
@@ -39,7 +39,7 @@ import os
 script_base_path = str(Path(__file__).parents[0])
 
 # custom library
-from driver import DCDC
+from driver import DCDC,add_backend_arguments,open_board,close_board
 
 
 if __name__ == '__main__':
@@ -54,6 +54,7 @@ if __name__ == '__main__':
     # add an optional argument with limited choices
     parser.add_argument('--firmware_filepath', '-f', default=default_firmware_filpath,
                         help='The firmware filepath can be absolute or relative to this script path.')
+    add_backend_arguments(parser)
 
     args_known = parser. parse_known_args()
     # get arguments defined in this file.
@@ -86,7 +87,8 @@ if __name__ == '__main__':
 
     # Program the FPGA
     board = DCDC()
-    board.open(firmware_filepath_p=firmware_filepath)
+    if not open_board(board, firmware_filepath, args):
+        sys.exit(1)
 
     board.set_verbosity(verbosity)
 
@@ -127,3 +129,7 @@ if __name__ == '__main__':
 
     msg = " "
     board.display(msg)
+
+    # USB transaction statistics and session recording
+    ###########################################
+    close_board(board, args)
@@ -40,10 +40,10 @@ script_base_path = str(Path(__file__).parents[0])
 script_name      = str(Path(__file__).stem)
 
 # custom library
-from driver import DCDC,Display,check_equal
+from driver import DCDC,Display,check_equal,add_backend_arguments,open_board,close_board
 
 
-def test_adc(device_p):
+def test_adc(device_p,oversampling_p=1):
     device = device_p
 
     test = 1
@@ -51,6 +51,8 @@ def test_adc(device_p):
     while test:
         device.display_title("test_adc "+'{0:02d}'.format(cnt))
         cnt += 1
+        # write the pending messages before the user input
+        device.flush()
         str_value = input("Get ADCs value, press: -1 (to stop), 0 (default: to continue): ")
         print("str_value ", str_value)
         if str_value.isnumeric():
@@ -66,15 +68,26 @@ def test_adc(device_p):
 
 
 
+        if oversampling_p > 1:
+            # averaged acquisitions: mean voltage +/- uncertainty by channel
+            msg = "DCDC: Start " + str(oversampling_p) + " ADCs acquisitions (oversampling)"
+            device.display(msg)
+            device.get_adcs_oversampled(oversampling_p)
+            device.display("")
+            continue
+
         msg = "DCDC: Start the ADCs acquisition"
         device.display(msg)
-        device.set_adc()
+        # wait until the firmware reports the end of the acquisition
+        latency = device.set_adc_wait()
+        if latency < 0:
+            msg = "[KO]: DCDC: the ADCs acquisition isn't done"
+        else:
+            msg = "[OK]: DCDC: ADCs acquisition done in (ms): " + '{0:.3f}'.format(latency*1e3)
+        device.display(msg)
 
         device.display("")
 
-        # tempo to be sure to be able to retrieve adc values
-        time.sleep(1)
-
         # get the adc value
         msg = "DCDC: Get the register: ADC0"
         device.display(msg)
@@ -134,6 +147,9 @@ if __name__ == '__main__':
     # add an optional argument with limited choices
     parser.add_argument('--firmware_filepath', '-f', default=default_firmware_filpath,
                         help='The firmware filepath can be absolute or relative to this script path.')
+    add_backend_arguments(parser)
+    parser.add_argument('--oversampling', type=int, default=1,
+                        help='Number of ADC acquisitions averaged by reading (default: 1, no oversampling).')
 
     args_known = parser. parse_known_args()
     # get arguments defined in this file.
@@ -166,7 +182,8 @@ if __name__ == '__main__':
 
     # Program the FPGA
     board = DCDC()
-    board.open(firmware_filepath_p=firmware_filepath)
+    if not open_board(board, firmware_filepath, args):
+        sys.exit(1)
 
     board.set_verbosity(verbosity)
 
@@ -203,7 +220,7 @@ if __name__ == '__main__':
 
     # test wire access
     ###########################################
-    error_adc_cnt = test_adc(board)
+    error_adc_cnt = test_adc(board, args.oversampling)
 
 
     # check internal error
@@ -260,3 +277,6 @@ if __name__ == '__main__':
         msg_tmp = "[KO]: Internal errors has " + str(error_internal_cnt) + " errors.";
         board.display(msg_tmp)
 
+    # USB transaction statistics and session recording
+    ###########################################
+    close_board(board, args)
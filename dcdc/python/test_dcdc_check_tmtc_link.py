@@ -35,13 +35,22 @@ import time
 import argparse
 import os
 
+# numpy
+import numpy as np
+
 # get the script base path
 script_base_path = str(Path(__file__).parents[0])
 script_name      = str(Path(__file__).stem)
 
 # custom library
-from driver import DCDC,Display,check_equal
+from driver import DCDC,Display,check_equal,add_backend_arguments,open_board,close_board
 
+# writable bits of the tested wire_in registers (the control bits are not touched)
+c_WIRE_MASK_DICT = {}
+c_WIRE_MASK_DICT['CTRL']       = 0xFFFF_FFFE # don't touch the rst bit
+c_WIRE_MASK_DICT['POWER_CONF'] = 0xFFFF_FFF0 # don't touch the power bits
+c_WIRE_MASK_DICT['DEBUG_CTRL'] = 0xFFFF_FFFC # don't touch the rst_status and debug_pulse bit
+c_WIRE_MASK_DICT['ERROR_SEL']  = 0xFFFF_FFFF
 
 def test_wire(device_p):
     device = device_p
@@ -54,7 +63,7 @@ def test_wire(device_p):
     ############################################
     # check the CTRL register
     ############################################
-    mask  = 0xFFFF_FFFE # don't touch the rst bit
+    mask  = c_WIRE_MASK_DICT['CTRL'] # don't touch the rst bit
     data0 = 0x09AB_CEF0 & mask
 
     msg = "DCDC: Set the register: CTRL"
@@ -75,7 +84,7 @@ def test_wire(device_p):
     ############################################
     # check the POWER_CONF register
     ############################################
-    mask  = 0xFFFF_FFF0; # don't touch the rst bit
+    mask  = c_WIRE_MASK_DICT['POWER_CONF']; # don't touch the rst bit
     data0 = 0xBCDE_FEAB & mask
 
     msg = "DCDC: Set the register: POWER_CONF"
@@ -119,7 +128,7 @@ def test_wire(device_p):
     # check the DEBUG_CTRL register
     ############################################
     # don't touch the rst_status and debug_pulse bit
-    mask  = 0xFFFF_FFFC
+    mask  = c_WIRE_MASK_DICT['DEBUG_CTRL']
     data0 = 0xAAAA_BBBB & mask
 
     msg = "DCDC: Set the register: DEBUG_CTRL"
@@ -161,6 +170,90 @@ def test_wire(device_p):
 
 
 
+def test_soak(device_p,nb_rounds_p,batch_size_p=10000,seed_p=None):
+    """Write random values in the tested wire_in registers and check their wire_out mirrors
+    Note:
+      . by round: the 4 registers are written with a single UpdateWireIns then
+        read back with a single UpdateWireOuts (2 USB transactions)
+      . the read values are checked by batch of rounds (vectorized)
+
+    Args:
+        device_p (DCDC): opened DCDC board
+        nb_rounds_p (uint): number of write/read rounds
+        batch_size_p (uint): number of rounds by batch
+        seed_p (int): seed of the random generator (None: random)
+
+    Returns:
+        int: number of wrong read values
+    """
+    device = device_p
+    level0 = device.level
+
+    device.display_title("test_soak: " + str(nb_rounds_p) + " rounds")
+
+    reg_name_list = list(c_WIRE_MASK_DICT.keys())
+    addr_in_list = [device._addr_wire_in[name] for name in reg_name_list]
+    addr_out_list = [device._addr_wire_out[name] for name in reg_name_list]
+    masks = np.array([c_WIRE_MASK_DICT[name] for name in reg_name_list], dtype=np.uint32)
+    nb_regs = len(reg_name_list)
+
+    rng = np.random.default_rng(seed_p)
+    # round-trip duration of each round (expressed in s)
+    latencies = np.empty(nb_rounds_p, dtype=np.float64)
+    read_values = np.empty((batch_size_p, nb_regs), dtype=np.uint32)
+    cnt_error_by_reg = np.zeros(nb_regs, dtype=np.int64)
+
+    set_wire_in = device.set_wire_in
+    get_wire_outs = device.get_wire_outs
+    perf_counter = time.perf_counter
+
+    t_start = perf_counter()
+    index = 0
+    while index < nb_rounds_p:
+        nb = min(batch_size_p, nb_rounds_p - index)
+        write_values = rng.integers(0, 2**32, size=(nb, nb_regs), dtype=np.uint32) & masks
+        write_list = write_values.tolist()
+        for i in range(nb):
+            t0 = perf_counter()
+            with device.batch():
+                for addr, value in zip(addr_in_list, write_list[i]):
+                    set_wire_in(addr, value)
+            read_values[i] = get_wire_outs(addr_out_list)
+            latencies[index + i] = perf_counter() - t0
+        # check the batch
+        cnt_error_by_reg += np.count_nonzero(read_values[:nb] != write_values, axis=0)
+        index += nb
+    duration = perf_counter() - t_start
+
+    # restore the reset values
+    with device.batch():
+        for addr in addr_in_list:
+            set_wire_in(addr, 0)
+
+    cnt_error = int(cnt_error_by_reg.sum())
+    percentiles = np.percentile(latencies, [50, 90, 99, 99.9]) * 1e6
+
+    msg_list = []
+    msg_list.append("duration (s): " + '{0:.3f}'.format(duration))
+    msg_list.append("rounds/s: " + '{0:.0f}'.format(nb_rounds_p / duration))
+    msg_list.append("USB transactions/s: " + '{0:.0f}'.format(2 * nb_rounds_p / duration))
+    msg_list.append("register accesses/s: " + '{0:.0f}'.format(2 * nb_regs * nb_rounds_p / duration))
+    msg_list.append("round-trip latency (us): p50: " + '{0:.1f}'.format(percentiles[0]) + ", p90: " + '{0:.1f}'.format(percentiles[1])
+                    + ", p99: " + '{0:.1f}'.format(percentiles[2]) + ", p99.9: " + '{0:.1f}'.format(percentiles[3])
+                    + ", max: " + '{0:.1f}'.format(latencies.max() * 1e6))
+    for name, cnt in zip(reg_name_list, cnt_error_by_reg.tolist()):
+        msg_list.append(name + ": wrong read values: " + str(cnt))
+    device.display(msg_list, level0)
+
+    if cnt_error == 0:
+        msg = "[OK]: test_soak: " + str(nb_rounds_p * nb_regs) + " checked values, 0 error"
+    else:
+        msg = "[KO]: test_soak: " + str(nb_rounds_p * nb_regs) + " checked values, " + str(cnt_error) + " errors"
+    device.display(msg, level0)
+    device.display("")
+    return cnt_error
+
+
 if __name__ == '__main__':
 
     ###########################################
@@ -173,6 +266,13 @@ if __name__ == '__main__':
     # add an optional argument with limited choices
     parser.add_argument('--firmware_filepath', '-f', default=default_firmware_filpath,
                         help='The firmware filepath can be absolute or relative to this script path.')
+    add_backend_arguments(parser)
+    parser.add_argument('--soak', type=int, default=0,
+                        help='Number of random write/read rounds of the soak test (default: 0, no soak test).')
+    parser.add_argument('--soak_batch', type=int, default=10000,
+                        help='Number of soak rounds checked together.')
+    parser.add_argument('--seed', type=int, default=None,
+                        help='Seed of the soak test random values (default: random).')
 
     args_known = parser. parse_known_args()
     # get arguments defined in this file.
@@ -205,7 +305,8 @@ if __name__ == '__main__':
 
     # Program the FPGA
     board = DCDC()
-    board.open(firmware_filepath_p=firmware_filepath)
+    if not open_board(board, firmware_filepath, args):
+        sys.exit(1)
 
     board.set_verbosity(verbosity)
 
@@ -244,6 +345,12 @@ if __name__ == '__main__':
     ###########################################
     error_wire_cnt = test_wire(board)
 
+    # soak test
+    ###########################################
+    error_soak_cnt = None
+    if args.soak > 0:
+        error_soak_cnt = test_soak(board, args.soak, args.soak_batch, args.seed)
+
 
     # check internal error
     ###########################################
@@ -291,6 +398,15 @@ if __name__ == '__main__':
         msg_tmp = "[KO]: test_wire has " + str(error_wire_cnt) + " errors.";
         board.display(msg_tmp)
 
+    # summary of the test_soak.
+    if error_soak_cnt is not None:
+        if (error_soak_cnt == 0):
+            msg_tmp = "[OK]: test_soak has " + str(error_soak_cnt) + " error.";
+            board.display(msg_tmp)
+        else:
+            msg_tmp = "[KO]: test_soak has " + str(error_soak_cnt) + " errors.";
+            board.display(msg_tmp)
+
     # summary of the internal errors.
     if (error_internal_cnt == 0):
         msg_tmp = "[OK]: Internal errors has " + str(error_internal_cnt) + " error.";
@@ -299,3 +415,6 @@ if __name__ == '__main__':
         msg_tmp = "[KO]: Internal errors has " + str(error_internal_cnt) + " errors.";
         board.display(msg_tmp)
 
+    # USB transaction statistics and session recording
+    ###########################################
+    close_board(board, args)
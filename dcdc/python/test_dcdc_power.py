@@ -40,7 +40,7 @@ script_base_path = str(Path(__file__).parents[0])
 script_name      = str(Path(__file__).stem)
 
 # custom library
-from driver import DCDC,Display,check_equal
+from driver import DCDC,Display,check_equal,run_power_sweep,load_power_rails,PowerSequencer,add_backend_arguments,open_board,close_board
 
 
 def test_power(device_p):
@@ -51,6 +51,8 @@ def test_power(device_p):
     while test:
         device.display_title("test_power "+'{0:02d}'.format(cnt))
         cnt += 1
+        # write the pending messages before the user input
+        device.flush()
         str_value = input("Set the power: value (bit3:wfee,bit2:ras,bit1:dmx1,bit0:dwx0), -1: to stop: ")
         if str_value.isnumeric():
             # get the value
@@ -78,6 +80,96 @@ def test_power(device_p):
 
 
 
+def test_power_sweep(device_p,value_list_p=None):
+    """Apply each power value without user interaction and check the ADC rails
+
+    Args:
+        device_p (DCDC): opened DCDC board
+        value_list_p (list of uint): power values (bit3:wfee,bit2:ras,bit1:dmx1,bit0:dmx0). Default: 0 to 15
+
+    Returns:
+        int: number of failed steps
+    """
+    device = device_p
+
+    device.display_title("test_power_sweep")
+
+    # no print by register access during the sweep
+    verbosity = device.get_verbosity()
+    device.set_verbosity(-1)
+    step_list = run_power_sweep(device, value_list_p=value_list_p)
+    # power off at the end of the sweep
+    device.set_power_wait(0,0,0,0)
+    device.set_verbosity(verbosity)
+
+    cnt = 0
+    for step in step_list:
+        msg_list = []
+        if step['ok']:
+            status = "[OK]"
+        else:
+            status = "[KO]"
+            cnt += 1
+        if step['settle_time'] < 0:
+            str_settle = "timeout"
+        else:
+            str_settle = '{0:.3f}'.format(step['settle_time']*1e3)
+        msg_list.append(status + ": power value: 0x" + '{0:x}'.format(step['value']) + ", settle time (ms): " + str_settle)
+        for rail in step['rails']:
+            if rail['ok']:
+                str_ok = ""
+            else:
+                str_ok = " => out of the window"
+            msg_list.append("    " + rail['name'] + " (" + ("on" if rail['on_off'] else "off") + "): " + '{0:.3f}'.format(rail['voltage']) + " V" + str_ok)
+        device.display(msg_list)
+
+    if cnt == 0:
+        msg = "[OK]: power sweep: " + str(len(step_list)) + " steps, 0 error"
+    else:
+        msg = "[KO]: power sweep: " + str(len(step_list)) + " steps, " + str(cnt) + " errors"
+    device.display(msg)
+    if not load_power_rails().validated:
+        msg = "[WARNING]: power sweep: UNVALIDATED rail mapping/windows: the rail checks aren't a hardware verification"
+        device.display(msg)
+    device.display("")
+    return cnt
+
+
+def test_power_plan(device_p,plan_name_list_p,allow_unvalidated_p=False):
+    """Execute power plans (see dcdc_power_rails.json) with the power sequencer
+
+    Args:
+        device_p (DCDC): opened DCDC board
+        plan_name_list_p (list of str): plan names (ex: ['power_up', 'power_down'])
+        allow_unvalidated_p (bool): True: verify the steps even with an unvalidated rail file
+
+    Returns:
+        int: number of failed plans
+    """
+    device = device_p
+
+    sequencer = PowerSequencer(device, allow_unvalidated_p=allow_unvalidated_p)
+    cnt = 0
+    for plan_name in plan_name_list_p:
+        device.display_title("test_power_plan: " + plan_name)
+        plan = sequencer.get_plan(plan_name)
+        if len(plan) == 0:
+            msg = "[KO]: test_power_plan: the plan " + plan_name + " has no step"
+            device.display(msg)
+            cnt += 1
+            continue
+        try:
+            step_list = sequencer.run(plan)
+        except ValueError:
+            # refused plan (the sequencer displays the reason)
+            cnt += 1
+            continue
+        if (len(step_list) != len(plan)) or (not step_list[-1]['ok']):
+            cnt += 1
+        device.display("")
+    return cnt
+
+
 if __name__ == '__main__':
 
     ###########################################
@@ -90,6 +182,15 @@ if __name__ == '__main__':
     # add an optional argument with limited choices
     parser.add_argument('--firmware_filepath', '-f', default=default_firmware_filpath,
                         help='The firmware filepath can be absolute or relative to this script path.')
+    add_backend_arguments(parser)
+    parser.add_argument('--sweep', action='store_true',
+                        help='Automated sweep of the 16 power combinations (no user input).')
+    parser.add_argument('--sequence', default=None,
+                        help='Automated sweep of a comma-separated list of power values (ex: 1,3,7,15,0).')
+    parser.add_argument('--plan', default=None,
+                        help='Execute a comma-separated list of power plans with the sequencer (ex: power_up,power_down).')
+    parser.add_argument('--allow-unvalidated', action='store_true',
+                        help='With --plan: verify the steps even if the rail windows are not validated on the hardware.')
 
     args_known = parser. parse_known_args()
     # get arguments defined in this file.
@@ -122,7 +223,8 @@ if __name__ == '__main__':
 
     # Program the FPGA
     board = DCDC()
-    board.open(firmware_filepath_p=firmware_filepath)
+    if not open_board(board, firmware_filepath, args):
+        sys.exit(1)
 
     board.set_verbosity(verbosity)
 
@@ -146,6 +248,8 @@ if __name__ == '__main__':
     msg_list = [
     "Test the power configuration",
     "    . loop on user demand",
+    "    . or automated sweep (--sweep, --sequence): check the ADC rails after each power value",
+    "    . or power plans (--plan): timed and verified power-up/power-down sequences",
     ]
     board.display(msg_list)
 
@@ -159,7 +263,15 @@ if __name__ == '__main__':
 
     # test wire access
     ###########################################
-    error_power_cnt = test_power(board)
+    if args.plan is not None:
+        error_power_cnt = test_power_plan(board, args.plan.split(','), allow_unvalidated_p=args.allow_unvalidated)
+    elif args.sequence is not None:
+        value_list = [int(value, 0) for value in args.sequence.split(',')]
+        error_power_cnt = test_power_sweep(board, value_list)
+    elif args.sweep:
+        error_power_cnt = test_power_sweep(board)
+    else:
+        error_power_cnt = test_power(board)
 
 
     # check internal error
@@ -201,12 +313,13 @@ if __name__ == '__main__':
     board.display(msg)
 
     # summary of the test_power.
-    # if (error_power_cnt == 0):
-    #     msg_tmp = "[OK]: test_power has " + str(error_power_cnt) + " error.";
-    #     board.display(msg_tmp)
-    # else:
-    #     msg_tmp = "[KO]: test_power has " + str(error_power_cnt) + " errors.";
-    #     board.display(msg_tmp)
+    if error_power_cnt is not None:
+        if (error_power_cnt == 0):
+            msg_tmp = "[OK]: test_power has " + str(error_power_cnt) + " error.";
+            board.display(msg_tmp)
+        else:
+            msg_tmp = "[KO]: test_power has " + str(error_power_cnt) + " errors.";
+            board.display(msg_tmp)
 
     # summary of the internal errors.
     if (error_internal_cnt == 0):
@@ -216,3 +329,6 @@ if __name__ == '__main__':
         msg_tmp = "[KO]: Internal errors has " + str(error_internal_cnt) + " errors.";
         board.display(msg_tmp)
 
+    # USB transaction statistics and session recording
+    ###########################################
+    close_board(board, args)
@@ -0,0 +1,66 @@
+# ------------------------------------------------------------------------------------------------------------
+#                            Copyright (C) 2024-2030 Ken-ji de la ROSA, IRAP Toulouse.
+# ------------------------------------------------------------------------------------------------------------
+#                            This file is part of the ATHENA X-IFU DRE Telemetry and Telecommand Firmware.
+#
+#                            dcdc-hk-fw is free software: you can redistribute it and/or modify
+#                            it under the terms of the GNU General Public License as published by
+#                            the Free Software Foundation, either version 3 of the License, or
+#                            (at your option) any later version.
+#
+#                            This program is distributed in the hope that it will be useful,
+#                            but WITHOUT ANY WARRANTY; without even the implied warranty of
+#                            MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#                            GNU General Public License for more details.
+#
+#                            You should have received a copy of the GNU General Public License
+#                            along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------------------------------------
+#    email                   kenji.delarosa@alten.com
+#    @file                   conftest.py
+# -------------------------------------------------------------------------------------------------------------
+#    Automatic Generation    No
+#    Code Rules Reference    N/A
+# -------------------------------------------------------------------------------------------------------------
+#   @details
+#
+#   Fixtures of the unit tests. The tests only use the simulated board (sim backend):
+#   neither the FrontPanel library nor a board is needed.
+#
+# ------------------------------------------------------------------------------------------------------------
+
+# third party library
+import pytest
+
+# custom library
+from driver import fpga_cache
+from driver import Driver,DCDC,SimBackend
+
+@pytest.fixture(autouse=True)
+def fpga_cache_filepath(tmp_path,monkeypatch):
+    """Redirect the FPGA configuration cache to a temporary file (the user cache is never modified)"""
+    filepath = str(tmp_path / 'fpga_config_cache.json')
+    monkeypatch.setattr(fpga_cache, 'default_cache_filepath', filepath)
+    return filepath
+
+@pytest.fixture
+def firmware_filepath(tmp_path):
+    """Dummy FPGA bitstream (the simulated board doesn't read it)"""
+    filepath = tmp_path / 'dcdc-fw.bit'
+    filepath.write_bytes(b'\x00' * 64)
+    return str(filepath)
+
+@pytest.fixture
+def driver(firmware_filepath):
+    """Driver opened on a simulated board"""
+    board = Driver()
+    assert board.open(firmware_filepath, backend_p=SimBackend())
+    return board
+
+@pytest.fixture
+def dcdc(firmware_filepath):
+    """DCDC opened on a simulated board (no print by register access)"""
+    board = DCDC()
+    assert board.open(firmware_filepath, backend_p=SimBackend())
+    board.set_verbosity(-1)
+    return board
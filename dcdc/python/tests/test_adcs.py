@@ -0,0 +1,69 @@
+# ------------------------------------------------------------------------------------------------------------
+#                            Copyright (C) 2024-2030 Ken-ji de la ROSA, IRAP Toulouse.
+# ------------------------------------------------------------------------------------------------------------
+#                            This file is part of the ATHENA X-IFU DRE Telemetry and Telecommand Firmware.
+#
+#                            dcdc-hk-fw is free software: you can redistribute it and/or modify
+#                            it under the terms of the GNU General Public License as published by
+#                            the Free Software Foundation, either version 3 of the License, or
+#                            (at your option) any later version.
+#
+#                            This program is distributed in the hope that it will be useful,
+#                            but WITHOUT ANY WARRANTY; without even the implied warranty of
+#                            MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#                            GNU General Public License for more details.
+#
+#                            You should have received a copy of the GNU General Public License
+#                            along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------------------------------------
+#    email                   kenji.delarosa@alten.com
+#    @file                   test_adcs.py
+# -------------------------------------------------------------------------------------------------------------
+#    Automatic Generation    No
+#    Code Rules Reference    N/A
+# -------------------------------------------------------------------------------------------------------------
+#   @details
+#
+#   Unit tests of the ADC reading: single USB transaction and code to voltage conversion.
+#
+# ------------------------------------------------------------------------------------------------------------
+
+# third party library
+import numpy as np
+
+# ADC LSB of the DCDC board (expressed in V): 5 V on 12 bits
+c_ADC_LSB = 5.0 / 2**12
+
+
+def test_get_adcs(dcdc):
+    dcdc.set_power_wait(1, 1, 1, 1)
+    assert dcdc.set_adc_wait() >= 0
+    dev = dcdc.dev
+    nb_transactions = dev.nb_transactions
+    data, voltages = dcdc.get_adcs()
+    # the 8 registers are read with a single UpdateWireOuts
+    assert dev.nb_transactions == nb_transactions + 1
+    assert (data.shape, data.dtype) == ((8,), np.uint32)
+    assert voltages.dtype == np.float64
+    np.testing.assert_array_equal(voltages, data * c_ADC_LSB)
+    # simulated channels: 2.5 V (ADC0..ADC3), 1.2 V (ADC4, ADC5), 3.3 V (ADC6, ADC7)
+    np.testing.assert_allclose(voltages, [2.5, 2.5, 2.5, 2.5, 1.2, 1.2, 3.3, 3.3], atol=0.02)
+
+
+def test_get_adcs_follows_the_power(dcdc):
+    dcdc.set_power_wait(0, 1, 0, 0)
+    dcdc.set_adc_wait()
+    data, voltages = dcdc.get_adcs()
+    np.testing.assert_allclose(voltages[:4], [0.0, 2.5, 0.0, 0.0], atol=0.02)
+
+
+def test_get_adcs_conversion_only(dcdc):
+    data = np.array([[0, 1, 2048, 4095, 0, 0, 0, 0]] * 3, dtype=np.uint16)
+    dev = dcdc.dev
+    nb_transactions = dev.nb_transactions
+    data_out, voltages = dcdc.get_adcs(data)
+    # no USB transaction
+    assert dev.nb_transactions == nb_transactions
+    assert data_out.shape == voltages.shape == (3, 8)
+    np.testing.assert_allclose(voltages[0, :4], [0.0, c_ADC_LSB, 2.5, 4095 * c_ADC_LSB])
+    np.testing.assert_array_equal(dcdc.compute_adc_voltages(2048), 2.5)
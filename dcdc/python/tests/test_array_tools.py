@@ -0,0 +1,135 @@
+# ------------------------------------------------------------------------------------------------------------
+#                            Copyright (C) 2024-2030 Ken-ji de la ROSA, IRAP Toulouse.
+# ------------------------------------------------------------------------------------------------------------
+#                            This file is part of the ATHENA X-IFU DRE Telemetry and Telecommand Firmware.
+#
+#                            dcdc-hk-fw is free software: you can redistribute it and/or modify
+#                            it under the terms of the GNU General Public License as published by
+#                            the Free Software Foundation, either version 3 of the License, or
+#                            (at your option) any later version.
+#
+#                            This program is distributed in the hope that it will be useful,
+#                            but WITHOUT ANY WARRANTY; without even the implied warranty of
+#                            MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#                            GNU General Public License for more details.
+#
+#                            You should have received a copy of the GNU General Public License
+#                            along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------------------------------------
+#    email                   kenji.delarosa@alten.com
+#    @file                   test_array_tools.py
+# -------------------------------------------------------------------------------------------------------------
+#    Automatic Generation    No
+#    Code Rules Reference    N/A
+# -------------------------------------------------------------------------------------------------------------
+#   @details
+#
+#   Unit tests of the array conversions (against the scalar functions of utils_tools),
+#   of the streaming statistics (RunningStats) and of the oversampled ADC acquisition.
+#
+# ------------------------------------------------------------------------------------------------------------
+
+# third party library
+import numpy as np
+import pytest
+
+# custom library
+from driver import RunningStats
+from driver import extract_field_array,convert_uint_to_int_array,convert_int_to_uint_array
+from driver import convert_uint_to_str_hex_array,convert_uint_to_ascii_array
+from driver import convert_uint_to_int,convert_int_to_uint,convert_uint_to_str_hex,convert_uint_to_ascii
+
+# widths of the comparisons with the scalar functions
+c_WIDTH_LIST = [1, 4, 7, 8, 12, 16, 24, 31, 32, 33, 63, 64]
+
+
+def _get_uint_values(width):
+    rng = np.random.default_rng(width)
+    value_list = [0, 1, (1 << width) - 1, 1 << (width - 1)]
+    value_list += [int(value) >> (64 - width) for value in rng.integers(0, 2**64, size=32, dtype=np.uint64)]
+    return value_list
+
+
+@pytest.mark.parametrize('width', c_WIDTH_LIST)
+def test_uint_conversions_match_the_scalar_functions(width):
+    value_list = _get_uint_values(width)
+    data = np.array(value_list, dtype=np.uint64)
+    assert convert_uint_to_str_hex_array(data, width).tolist() == [convert_uint_to_str_hex(value, width) for value in value_list]
+    assert convert_uint_to_ascii_array(data, width).tolist() == [convert_uint_to_ascii(value, width) for value in value_list]
+    int_list = convert_uint_to_int_array(data, width).tolist()
+    assert int_list == [convert_uint_to_int(value, width) for value in value_list]
+    assert convert_int_to_uint_array(np.array(int_list, dtype=np.int64), width).tolist() == [convert_int_to_uint(value, width) for value in int_list]
+
+
+def test_extract_field_array():
+    value_list = _get_uint_values(32)
+    for pos, width in [(0, 1), (3, 4), (8, 12), (0, 32)]:
+        result = extract_field_array(np.array(value_list, dtype=np.uint32), pos, width)
+        assert result.tolist() == [(value >> pos) & ((1 << width) - 1) for value in value_list]
+
+
+def test_conversions_keep_the_shape():
+    data = np.array([[0x41420000, 0x30313233]], dtype=np.uint32)
+    # the trailing NUL characters are kept (as the scalar function)
+    assert convert_uint_to_ascii_array(data, 32).tolist() == [['AB\x00\x00', '0123']]
+    assert convert_uint_to_ascii_array(0x41, 8).item() == 'A'
+    assert convert_uint_to_str_hex_array(data, 32).shape == (1, 2)
+
+
+@pytest.mark.parametrize('func, data, width', [
+    (convert_uint_to_str_hex_array, [0x1234], 12),
+    (convert_uint_to_str_hex_array, [-1], 16),
+    (convert_uint_to_ascii_array, [0x1_0000], 16),
+    (convert_uint_to_int_array, [0x100], 8),
+    (convert_int_to_uint_array, [-129], 8),
+    (convert_int_to_uint_array, [0x100], 8),
+    (convert_uint_to_str_hex_array, [0], 0),
+    (convert_uint_to_str_hex_array, [0], 65),
+    (convert_uint_to_int_array, [1.5], 8),
+])
+def test_out_of_range_values_raise(func,data,width):
+    with pytest.raises(ValueError):
+        func(data, width)
+
+
+def test_running_stats_match_numpy():
+    rng = np.random.default_rng(0)
+    samples = rng.normal(100.0, 3.0, size=(500, 8))
+    stats = RunningStats(8)
+    for sample in samples:
+        stats.update(sample)
+    assert stats.count == 500
+    np.testing.assert_allclose(stats.mean, samples.mean(axis=0))
+    np.testing.assert_allclose(stats.std, samples.std(axis=0, ddof=1))
+    np.testing.assert_allclose(stats.stderr, samples.std(axis=0, ddof=1) / np.sqrt(500))
+    np.testing.assert_array_equal(stats.min, samples.min(axis=0))
+    np.testing.assert_array_equal(stats.max, samples.max(axis=0))
+
+
+def test_running_stats_large_offset():
+    # Welford's algorithm: no cancellation with a large mean and a small spread
+    samples = 1e9 + np.array([[0.0], [1.0], [2.0], [3.0]])
+    stats = RunningStats(1)
+    for sample in samples:
+        stats.update(sample)
+    np.testing.assert_allclose(stats.std, [np.std([0.0, 1.0, 2.0, 3.0], ddof=1)])
+
+
+def test_running_stats_less_than_two_samples():
+    stats = RunningStats((2, 3))
+    np.testing.assert_array_equal(stats.std, np.zeros((2, 3)))
+    stats.update(np.ones((2, 3)))
+    np.testing.assert_array_equal(stats.mean, np.ones((2, 3)))
+    np.testing.assert_array_equal(stats.std, np.zeros((2, 3)))
+    np.testing.assert_array_equal(stats.stderr, np.zeros((2, 3)))
+
+
+def test_get_adcs_oversampled(dcdc):
+    dcdc.set_power_wait(1, 1, 1, 1)
+    result = dcdc.get_adcs_oversampled(20)
+    assert result['count'] == 20
+    # simulated channels: 2.5 V (ADC0..ADC3), 1.2 V (ADC4, ADC5), 3.3 V (ADC6, ADC7)
+    np.testing.assert_allclose(result['mean'], [2.5, 2.5, 2.5, 2.5, 1.2, 1.2, 3.3, 3.3], atol=0.01)
+    assert np.all(result['min'] <= result['mean'])
+    assert np.all(result['mean'] <= result['max'])
+    assert np.all(result['stderr'] < result['std'])
@@ -0,0 +1,118 @@
+# ------------------------------------------------------------------------------------------------------------
+#                            Copyright (C) 2024-2030 Ken-ji de la ROSA, IRAP Toulouse.
+# ------------------------------------------------------------------------------------------------------------
+#                            This file is part of the ATHENA X-IFU DRE Telemetry and Telecommand Firmware.
+#
+#                            dcdc-hk-fw is free software: you can redistribute it and/or modify
+#                            it under the terms of the GNU General Public License as published by
+#                            the Free Software Foundation, either version 3 of the License, or
+#                            (at your option) any later version.
+#
+#                            This program is distributed in the hope that it will be useful,
+#                            but WITHOUT ANY WARRANTY; without even the implied warranty of
+#                            MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#                            GNU General Public License for more details.
+#
+#                            You should have received a copy of the GNU General Public License
+#                            along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------------------------------------
+#    email                   kenji.delarosa@alten.com
+#    @file                   test_async_dcdc.py
+# -------------------------------------------------------------------------------------------------------------
+#    Automatic Generation    No
+#    Code Rules Reference    N/A
+# -------------------------------------------------------------------------------------------------------------
+#   @details
+#
+#   Unit tests of the asyncio front-end on a simulated board: single I/O thread, polling and close.
+#
+# ------------------------------------------------------------------------------------------------------------
+
+# standard library
+import asyncio
+import threading
+import time
+
+# third party library
+import pytest
+
+# custom library
+from driver import AsyncDCDC,DCDC,SimBackend
+
+
+def test_concurrent_calls_are_serialized(dcdc,monkeypatch):
+    get_wire_out = dcdc.get_wire_out
+    state = {'active': 0, 'max_active': 0, 'thread_name_set': set()}
+    def spy(addr_p):
+        state['active'] += 1
+        state['max_active'] = max(state['max_active'], state['active'])
+        state['thread_name_set'].add(threading.current_thread().name)
+        time.sleep(2e-3)
+        state['active'] -= 1
+        return get_wire_out(addr_p)
+    monkeypatch.setattr(dcdc, 'get_wire_out', spy)
+
+    async def main():
+        async with AsyncDCDC(dcdc) as board:
+            addr = dcdc._addr_wire_out['HARDWARE_ID']
+            return await asyncio.gather(*[board.call('get_wire_out', addr) for i in range(8)])
+
+    assert asyncio.run(main()) == [dcdc.dev.hardware_id] * 8
+    # one transaction at a time, always on the same I/O thread
+    assert state['max_active'] == 1
+    assert len(state['thread_name_set']) == 1
+    assert state['thread_name_set'].pop().startswith('dcdc-io')
+
+
+def test_wait_until_ready(dcdc):
+    async def main():
+        async with AsyncDCDC(dcdc) as board:
+            await board.set_power(1, 0, 0, 0)
+            latency = await board.wait_until_ready('power_ready', 1.0)
+            settle_time = await board.set_power_wait(0, 0, 0, 0)
+            adc_time = await board.set_adc_wait()
+            data, voltages = await board.get_adcs()
+            return latency, settle_time, adc_time, voltages
+
+    latency, settle_time, adc_time, voltages = asyncio.run(main())
+    assert latency >= 0
+    assert (settle_time >= 0) and (adc_time >= 0)
+    assert voltages.shape == (8,)
+    assert dcdc.get_power_conf() == 0x0
+
+
+def test_wait_until_ready_timeout(firmware_filepath):
+    dcdc = DCDC()
+    dcdc.set_verbosity(-1)
+    assert dcdc.open(firmware_filepath, backend_p=SimBackend(power_duration_p=10.0))
+    message_list = []
+    dcdc.display = lambda msg, *args: message_list.append((msg, threading.current_thread().name))
+
+    async def main():
+        async with AsyncDCDC(dcdc) as board:
+            await board.set_power(1, 0, 0, 0)
+            t0 = time.perf_counter()
+            latency = await board.wait_until_ready('power_ready', 20e-3)
+            return latency, time.perf_counter() - t0
+
+    latency, duration = asyncio.run(main())
+    assert latency == -1
+    assert 20e-3 <= duration < 1.0
+    # the timeout message is displayed from the I/O thread
+    assert len(message_list) == 1
+    assert message_list[0][0].startswith('[KO]')
+    assert message_list[0][1].startswith('dcdc-io')
+
+
+def test_close(dcdc):
+    board = AsyncDCDC(dcdc)
+
+    async def main():
+        async with board:
+            await board.read_snapshot()
+        # the I/O thread is stopped
+        await board.call('get_hardware_id')
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(main())
+    assert board._executor._shutdown
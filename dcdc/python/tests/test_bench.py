@@ -0,0 +1,73 @@
+# ------------------------------------------------------------------------------------------------------------
+#                            Copyright (C) 2024-2030 Ken-ji de la ROSA, IRAP Toulouse.
+# ------------------------------------------------------------------------------------------------------------
+#                            This file is part of the ATHENA X-IFU DRE Telemetry and Telecommand Firmware.
+#
+#                            dcdc-hk-fw is free software: you can redistribute it and/or modify
+#                            it under the terms of the GNU General Public License as published by
+#                            the Free Software Foundation, either version 3 of the License, or
+#                            (at your option) any later version.
+#
+#                            This program is distributed in the hope that it will be useful,
+#                            but WITHOUT ANY WARRANTY; without even the implied warranty of
+#                            MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#                            GNU General Public License for more details.
+#
+#                            You should have received a copy of the GNU General Public License
+#                            along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------------------------------------
+#    email                   kenji.delarosa@alten.com
+#    @file                   test_bench.py
+# -------------------------------------------------------------------------------------------------------------
+#    Automatic Generation    No
+#    Code Rules Reference    N/A
+# -------------------------------------------------------------------------------------------------------------
+#   @details
+#
+#   Unit tests of the bench_dcdc.py script: device call counting and benchmark results.
+#
+# ------------------------------------------------------------------------------------------------------------
+
+# third party library
+import pytest
+
+# custom library
+import bench_dcdc
+from bench_dcdc import TimedDevice,run_bench
+
+
+@pytest.fixture
+def timed_dcdc(dcdc):
+    """DCDC opened on a simulated board with a timed device"""
+    dcdc.dev = TimedDevice(dcdc.dev)
+    return dcdc
+
+
+def test_timed_device(timed_dcdc):
+    dev = timed_dcdc.dev
+    timed_dcdc.get_hardware_id()
+    assert dev.nb_transactions == 1
+    assert dev.dev_time > 0
+    # the other attributes are the ones of the wrapped device
+    assert dev.hardware_id == 0x1
+    dev.reset()
+    assert (dev.nb_transactions, dev.dev_time) == (0, 0.0)
+
+
+@pytest.mark.parametrize('bench_name', list(bench_dcdc._bench_dict.keys()))
+def test_run_bench(timed_dcdc,bench_name):
+    result = run_bench(timed_dcdc, bench_name, 0, 0.01, False)
+    assert result['bench'] == bench_name
+    assert result['verbosity'] == 0
+    assert result['nb_iterations'] >= 1
+    assert 0 < result['dev_time_s'] <= result['total_time_s']
+    assert result['transactions_per_iteration'] == result['nb_transactions'] / result['nb_iterations']
+
+
+def test_run_bench_counts_the_transactions(timed_dcdc,capsys):
+    result = run_bench(timed_dcdc, 'set_wire_in', 1, 0.01, False)
+    # 2000 * 0.01 iterations: one UpdateWireIns by write
+    assert result['nb_iterations'] == 20
+    assert result['nb_transactions'] == 20
+    # the console output is discarded
+    assert capsys.readouterr().out == ''
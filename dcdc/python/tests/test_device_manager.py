@@ -0,0 +1,79 @@
+# ------------------------------------------------------------------------------------------------------------
+#                            Copyright (C) 2024-2030 Ken-ji de la ROSA, IRAP Toulouse.
+# ------------------------------------------------------------------------------------------------------------
+#                            This file is part of the ATHENA X-IFU DRE Telemetry and Telecommand Firmware.
+#
+#                            dcdc-hk-fw is free software: you can redistribute it and/or modify
+#                            it under the terms of the GNU General Public License as published by
+#                            the Free Software Foundation, either version 3 of the License, or
+#                            (at your option) any later version.
+#
+#                            This program is distributed in the hope that it will be useful,
+#                            but WITHOUT ANY WARRANTY; without even the implied warranty of
+#                            MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#                            GNU General Public License for more details.
+#
+#                            You should have received a copy of the GNU General Public License
+#                            along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------------------------------------
+#    email                   kenji.delarosa@alten.com
+#    @file                   test_device_manager.py
+# -------------------------------------------------------------------------------------------------------------
+#    Automatic Generation    No
+#    Code Rules Reference    N/A
+# -------------------------------------------------------------------------------------------------------------
+#   @details
+#
+#   Unit tests of the DeviceManager on several simulated boards.
+#
+# ------------------------------------------------------------------------------------------------------------
+
+# custom library
+from driver import DCDC,Driver,DeviceManager,SimBackend,SimDevice
+
+
+class _FaultyBackend(SimBackend):
+    """Simulated boards: the FPGA configuration of one board fails"""
+
+    def __init__(self,faulty_serial_p,**kwargs):
+        super().__init__(**kwargs)
+        self.faulty_serial = faulty_serial_p
+        self.nb_list_serials = 0
+
+    def list_serials(self):
+        self.nb_list_serials += 1
+        return super().list_serials()
+
+    def open_device(self,serial_p=None):
+        dev = SimDevice(serial_p=serial_p)
+        if serial_p == self.faulty_serial:
+            dev.ConfigureFPGA = lambda firmware_filepath_p: -1
+        return dev
+
+
+def test_open_all(firmware_filepath):
+    manager = DeviceManager(SimBackend(nb_devices_p=2))
+    manager.set_role('SIM-DCDC-0', 'DCDC', firmware_filepath)
+    manager.set_role('SIM-DCDC-1', 'FPAsim', firmware_filepath)
+    board_dict = manager.open_all(force_configure_p=True, verbosity_p=-1)
+    assert sorted(board_dict.keys()) == ['DCDC', 'FPAsim']
+    assert isinstance(board_dict['DCDC'], DCDC)
+    assert type(board_dict['FPAsim']) is Driver
+    assert board_dict['FPAsim'].dev.serial == 'SIM-DCDC-1'
+
+
+def test_failed_boards_are_left_out(firmware_filepath,capsys):
+    backend = _FaultyBackend('SIM-DCDC-1', nb_devices_p=3)
+    manager = DeviceManager(backend)
+    manager.set_role('SIM-DCDC-0', 'DCDC', firmware_filepath)
+    manager.set_role('SIM-DCDC-1', 'FPAsim', firmware_filepath)
+    manager.set_role('SIM-DCDC-9', 'RAS', firmware_filepath)
+    nb_list_serials = backend.nb_list_serials
+    board_dict = manager.open_all(force_configure_p=True, verbosity_p=-1)
+
+    assert list(board_dict.keys()) == ['DCDC']
+    out = capsys.readouterr().out
+    assert "[KO]: FPAsim (SIM-DCDC-1)" in out
+    assert "[KO]: RAS (SIM-DCDC-9): board not connected" in out
+    # the boards are enumerated once (not by each worker thread)
+    assert backend.nb_list_serials - nb_list_serials == 1
@@ -0,0 +1,127 @@
+# ------------------------------------------------------------------------------------------------------------
+#                            Copyright (C) 2024-2030 Ken-ji de la ROSA, IRAP Toulouse.
+# ------------------------------------------------------------------------------------------------------------
+#                            This file is part of the ATHENA X-IFU DRE Telemetry and Telecommand Firmware.
+#
+#                            dcdc-hk-fw is free software: you can redistribute it and/or modify
+#                            it under the terms of the GNU General Public License as published by
+#                            the Free Software Foundation, either version 3 of the License, or
+#                            (at your option) any later version.
+#
+#                            This program is distributed in the hope that it will be useful,
+#                            but WITHOUT ANY WARRANTY; without even the implied warranty of
+#                            MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#                            GNU General Public License for more details.
+#
+#                            You should have received a copy of the GNU General Public License
+#                            along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------------------------------------
+#    email                   kenji.delarosa@alten.com
+#    @file                   test_display.py
+# -------------------------------------------------------------------------------------------------------------
+#    Automatic Generation    No
+#    Code Rules Reference    N/A
+# -------------------------------------------------------------------------------------------------------------
+#   @details
+#
+#   Unit tests of the display sinks: buffering, ordering, flush and close.
+#
+# ------------------------------------------------------------------------------------------------------------
+
+# standard library
+import io
+import threading
+
+# custom library
+from driver import Display,StreamSink,ThreadSink,FileSink,NullSink
+
+
+class _ThreadStream(io.StringIO):
+    """Stream recording the name of the writing threads"""
+
+    def __init__(self):
+        super().__init__()
+        self.thread_name_set = set()
+
+    def write(self,text):
+        self.thread_name_set.add(threading.current_thread().name)
+        return super().write(text)
+
+
+def test_stream_sink_buffering():
+    stream = io.StringIO()
+    sink = StreamSink(stream, buffer_size_p=10)
+    sink.write("abc")
+    assert stream.getvalue() == ""
+    sink.write("defghij")
+    # buffer size reached: written in bulk
+    assert stream.getvalue() == "abcdefghij"
+    sink.write("k")
+    sink.close()
+    assert stream.getvalue() == "abcdefghijk"
+
+
+def test_thread_sink_ordering_and_flush():
+    stream = _ThreadStream()
+    sink = ThreadSink(stream)
+    line_list = ["line " + str(i) + "\n" for i in range(2000)]
+    for line in line_list:
+        sink.write(line)
+    sink.flush()
+    # all the pending texts are written, in the write order, by the background thread
+    assert stream.getvalue() == "".join(line_list)
+    assert stream.thread_name_set == {"display-writer"}
+    sink.close()
+
+
+def test_thread_sink_close():
+    stream = io.StringIO()
+    sink = ThreadSink(stream)
+    display = Display()
+    display.set_sink(sink)
+    display.display(["a", "b"])
+    display.display("c", 1)
+    sink.close()
+    # the pending texts are written before the thread stops
+    assert stream.getvalue() == " a\n b\n     c\n"
+    assert not sink._thread.is_alive()
+    # idempotent, and a flush after close doesn't wait forever
+    sink.close()
+    sink.write("lost")
+    sink.flush()
+
+
+def test_file_sink(tmp_path):
+    filepath = tmp_path / 'display.log'
+    sink = FileSink(str(filepath))
+    display = Display()
+    display.set_sink(sink)
+    display.display_title("title")
+    assert filepath.read_text() == ""
+    display.flush()
+    text = filepath.read_text()
+    assert text.splitlines()[2] == " title"
+    display.display("message")
+    sink.close()
+    assert filepath.read_text() == text + " message\n"
+    assert sink._file.closed
+    sink.close()
+
+    # append mode
+    sink = FileSink(str(filepath), mode_p='a', buffer_size_p=1)
+    sink.write("next\n")
+    assert filepath.read_text().endswith(" message\nnext\n")
+    sink.close()
+
+
+def test_set_sink_flushes_the_previous_sink():
+    stream = io.StringIO()
+    display = Display()
+    display.set_sink(StreamSink(stream))
+    display.display("pending")
+    display.set_sink(NullSink())
+    assert stream.getvalue() == " pending\n"
+    # disabled sink: nothing is formatted
+    display.display_register(0x1, 32, 0x2, 32)
+    display.flush()
+    assert stream.getvalue() == " pending\n"
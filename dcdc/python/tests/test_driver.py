@@ -0,0 +1,216 @@
+# ------------------------------------------------------------------------------------------------------------
+#                            Copyright (C) 2024-2030 Ken-ji de la ROSA, IRAP Toulouse.
+# ------------------------------------------------------------------------------------------------------------
+#                            This file is part of the ATHENA X-IFU DRE Telemetry and Telecommand Firmware.
+#
+#                            dcdc-hk-fw is free software: you can redistribute it and/or modify
+#                            it under the terms of the GNU General Public License as published by
+#                            the Free Software Foundation, either version 3 of the License, or
+#                            (at your option) any later version.
+#
+#                            This program is distributed in the hope that it will be useful,
+#                            but WITHOUT ANY WARRANTY; without even the implied warranty of
+#                            MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#                            GNU General Public License for more details.
+#
+#                            You should have received a copy of the GNU General Public License
+#                            along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------------------------------------
+#    email                   kenji.delarosa@alten.com
+#    @file                   test_driver.py
+# -------------------------------------------------------------------------------------------------------------
+#    Automatic Generation    No
+#    Code Rules Reference    N/A
+# -------------------------------------------------------------------------------------------------------------
+#   @details
+#
+#   Unit tests of the Driver class: wire_in batches, shadow cache and pipes.
+#
+# ------------------------------------------------------------------------------------------------------------
+
+# third party library
+import numpy as np
+import pytest
+
+# wire_in addresses of the simulated board
+c_ADDR_CTRL = 0x00
+c_ADDR_POWER_CONF = 0x01
+c_ADDR_DEBUG_CTRL = 0x18
+# the simulated board loops each pipe_in back to the pipe_out at +0x20
+c_ADDR_PIPE_IN = 0x80
+c_ADDR_PIPE_OUT = 0xA0
+
+
+def test_batch_single_update_wire_ins(driver):
+    dev = driver.dev
+    nb_transactions = dev.nb_transactions
+    with driver.batch():
+        driver.set_wire_in(c_ADDR_CTRL, 0x1)
+        driver.set_wire_in(c_ADDR_POWER_CONF, 0x3)
+        driver.set_wire_in(c_ADDR_DEBUG_CTRL, 0x1)
+        # staged values: nothing sent before the end of the batch
+        assert dev.nb_transactions == nb_transactions
+    assert dev.nb_transactions == nb_transactions + 1
+    assert driver.get_wire_outs([0x20, 0x21, 0x38]) == [0x1, 0x3, 0x1]
+
+
+def test_nested_batches_are_merged(driver):
+    dev = driver.dev
+    nb_transactions = dev.nb_transactions
+    with driver.batch():
+        driver.set_wire_in(c_ADDR_CTRL, 0x1)
+        with driver.batch():
+            driver.set_wire_in(c_ADDR_POWER_CONF, 0x3)
+        # only the outermost batch sends the values
+        assert dev.nb_transactions == nb_transactions
+    assert dev.nb_transactions == nb_transactions + 1
+
+
+def test_read_inside_batch_flushes_the_staged_values(driver):
+    with driver.batch():
+        driver.set_wire_in(c_ADDR_POWER_CONF, 0x5)
+        assert driver.get_wire_out(0x21) == 0x5
+
+
+def test_write_outside_batch_is_sent_immediately(driver):
+    dev = driver.dev
+    nb_transactions = dev.nb_transactions
+    driver.set_wire_in(c_ADDR_POWER_CONF, 0x2)
+    driver.set_wire_in(c_ADDR_POWER_CONF, 0x4)
+    assert dev.nb_transactions == nb_transactions + 2
+    assert driver.get_wire_out(0x21) == 0x4
+
+
+def test_write_increments_the_transaction_epoch(driver):
+    epoch = driver._tx_epoch
+    with driver.batch():
+        driver.set_wire_in(c_ADDR_CTRL, 0x0)
+        driver.set_wire_in(c_ADDR_POWER_CONF, 0x0)
+    assert driver._tx_epoch == epoch + 2
+
+
+def test_shadow_skips_unchanged_writes(driver):
+    driver.enable_shadow()
+    dev = driver.dev
+    driver.set_wire_in(c_ADDR_POWER_CONF, 0x3)
+    nb_transactions = dev.nb_transactions
+    driver.set_wire_in(c_ADDR_POWER_CONF, 0x3)
+    assert dev.nb_transactions == nb_transactions
+    assert driver.get_shadow(c_ADDR_POWER_CONF) == 0x3
+    driver.set_wire_in(c_ADDR_POWER_CONF, 0x1)
+    assert dev.nb_transactions == nb_transactions + 1
+    assert driver.get_shadow(c_ADDR_POWER_CONF) == 0x1
+
+
+def test_shadow_masked_writes(driver):
+    driver.enable_shadow()
+    driver.set_wire_in(c_ADDR_POWER_CONF, 0xF)
+    driver.set_wire_in(c_ADDR_POWER_CONF, 0x0, 0x2)
+    assert driver.get_shadow(c_ADDR_POWER_CONF) == 0xD
+    assert driver.get_wire_out(0x21) == 0xD
+
+
+def test_shadow_unknown_value_with_mask(driver):
+    driver.enable_shadow()
+    # the other bits are unknown: the value isn't cached
+    driver.set_wire_in(c_ADDR_DEBUG_CTRL, 0x1, 0x1)
+    assert driver.get_shadow(c_ADDR_DEBUG_CTRL) is None
+
+
+def test_shadow_disabled(driver):
+    driver.set_wire_in(c_ADDR_POWER_CONF, 0x3)
+    assert driver.get_shadow(c_ADDR_POWER_CONF) is None
+    dev = driver.dev
+    nb_transactions = dev.nb_transactions
+    driver.set_wire_in(c_ADDR_POWER_CONF, 0x3)
+    assert dev.nb_transactions == nb_transactions + 1
+
+
+def test_dcdc_resync_and_field_write(dcdc):
+    dcdc.set_power_conf(1, 1, 0, 0)
+    # the cache starts empty: the first reading refreshes it from the wire_out mirrors
+    assert dcdc.get_wire_in_by_name('POWER_CONF') == 0x3
+    dev = dcdc.dev
+    nb_transactions = dev.nb_transactions
+    assert dcdc.set_wire_in_field('POWER_CONF', 3, 1, 1) == 0xB
+    # read-modify-write without readback: a single UpdateWireIns
+    assert dev.nb_transactions == nb_transactions + 1
+    assert dcdc.get_wire_in_field('POWER_CONF', 3, 1) == 1
+    assert dcdc.get_wire_out(dcdc._addr_wire_out['POWER_CONF']) == 0xB
+
+
+def test_pipe_loopback_by_chunks(driver):
+    data = np.arange(256, dtype=np.uint16)
+    dev = driver.dev
+    nb_transactions = dev.nb_transactions
+    assert driver.write_pipe(c_ADDR_PIPE_IN, data, chunk_size_p=128) == data.nbytes
+    assert dev.nb_transactions == nb_transactions + 4
+    result = np.empty_like(data)
+    assert driver.read_pipe(c_ADDR_PIPE_OUT, result, block_size_p=64, chunk_size_p=200) == data.nbytes
+    np.testing.assert_array_equal(result, data)
+
+
+def test_iter_read_pipe_reuses_one_buffer(driver):
+    data = bytes(range(96))
+    driver.write_pipe(c_ADDR_PIPE_IN, data)
+    chunk_list = []
+    for chunk in driver.iter_read_pipe(c_ADDR_PIPE_OUT, len(data), 32):
+        chunk_list.append(bytes(chunk))
+    assert b''.join(chunk_list) == data
+    assert [len(chunk) for chunk in chunk_list] == [32, 32, 32]
+
+
+def test_iter_read_block_pipe_rounds_the_chunks(driver):
+    data = bytes(range(96))
+    driver.write_pipe(c_ADDR_PIPE_IN, data)
+    # 48 bytes: rounded down to 1 block of 32 bytes
+    chunk_list = [bytes(chunk) for chunk in driver.iter_read_pipe(c_ADDR_PIPE_OUT, 96, 48, block_size_p=32)]
+    assert b''.join(chunk_list) == data
+    assert [len(chunk) for chunk in chunk_list] == [32, 32, 32]
+
+
+def test_iter_read_pipe_raises_on_error(driver,monkeypatch):
+    driver.write_pipe(c_ADDR_PIPE_IN, bytes(96))
+    dev = driver.dev
+    ret_list = [32, dev.Failed]
+    monkeypatch.setattr(dev, 'ReadFromPipeOut', lambda ep, data: ret_list.pop(0))
+    iterator = driver.iter_read_pipe(c_ADDR_PIPE_OUT, 96, 32)
+    next(iterator)
+    # a truncated stream is not a complete one
+    with pytest.raises(RuntimeError, match='truncated after 32 of 96 bytes'):
+        next(iterator)
+
+
+def test_pipe_short_transfer(driver,monkeypatch):
+    dev = driver.dev
+    # the second chunk is only partially transferred
+    ret_list = [32, 16, 32]
+    monkeypatch.setattr(dev, 'WriteToPipeIn', lambda ep, data: ret_list.pop(0))
+    assert driver.write_pipe(c_ADDR_PIPE_IN, bytes(96), chunk_size_p=32) == 48
+    assert ret_list == [32]
+
+
+@pytest.mark.parametrize('nb_bytes, block_size, chunk_size', [
+    (64, None, 0),
+    (64, None, -16),
+    (64, None, 24),
+    (40, None, None),
+    (64, 24, None),
+    (64, 48, None),
+])
+def test_pipe_invalid_lengths(driver,nb_bytes,block_size,chunk_size):
+    dev = driver.dev
+    with driver.batch():
+        driver.set_wire_in(c_ADDR_CTRL, 0x1)
+        nb_transactions = dev.nb_transactions
+        with pytest.raises(ValueError):
+            driver.write_pipe(c_ADDR_PIPE_IN, bytearray(nb_bytes), block_size_p=block_size, chunk_size_p=chunk_size)
+        with pytest.raises(ValueError):
+            driver.read_pipe(c_ADDR_PIPE_OUT, bytearray(nb_bytes), block_size_p=block_size, chunk_size_p=chunk_size)
+        # rejected before any USB transaction (the staged wire_in values are still pending)
+        assert dev.nb_transactions == nb_transactions
+
+
+def test_iter_read_pipe_invalid_chunk_size(driver):
+    with pytest.raises(ValueError):
+        next(driver.iter_read_pipe(c_ADDR_PIPE_OUT, 64, 0))
@@ -0,0 +1,102 @@
+# ------------------------------------------------------------------------------------------------------------
+#                            Copyright (C) 2024-2030 Ken-ji de la ROSA, IRAP Toulouse.
+# ------------------------------------------------------------------------------------------------------------
+#                            This file is part of the ATHENA X-IFU DRE Telemetry and Telecommand Firmware.
+#
+#                            dcdc-hk-fw is free software: you can redistribute it and/or modify
+#                            it under the terms of the GNU General Public License as published by
+#                            the Free Software Foundation, either version 3 of the License, or
+#                            (at your option) any later version.
+#
+#                            This program is distributed in the hope that it will be useful,
+#                            but WITHOUT ANY WARRANTY; without even the implied warranty of
+#                            MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#                            GNU General Public License for more details.
+#
+#                            You should have received a copy of the GNU General Public License
+#                            along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------------------------------------
+#    email                   kenji.delarosa@alten.com
+#    @file                   test_errors.py
+# -------------------------------------------------------------------------------------------------------------
+#    Automatic Generation    No
+#    Code Rules Reference    N/A
+# -------------------------------------------------------------------------------------------------------------
+#   @details
+#
+#   Unit tests of the scan of the internal errors/status (ERROR_SEL selectors).
+#
+# ------------------------------------------------------------------------------------------------------------
+
+# standard library
+import time
+
+
+def test_scan_all_selectors(dcdc):
+    dcdc.dev.set_error(1, 0x80)
+    dcdc.dev.status[0] = 0x3
+    report = dcdc.scan_errors()
+    assert [result['selector'] for result in report] == [0, 1]
+    assert [result['errors'] for result in report] == [0x0, 0x80]
+    assert [result['status'] for result in report] == [0x3, 0x0]
+    assert all(result['loopback_time'] >= 0 for result in report)
+    assert dcdc.check_internal_errors() == 1
+
+
+def test_settled_multiplexer_costs_two_readings(dcdc,monkeypatch):
+    call_list = []
+    get_wire_outs = dcdc.get_wire_outs
+    def spy(addr_list_p):
+        call_list.append(addr_list_p)
+        return get_wire_outs(addr_list_p)
+    monkeypatch.setattr(dcdc, 'get_wire_outs', spy)
+    t0 = time.perf_counter()
+    report = dcdc.scan_errors()
+    # no fixed delay
+    assert time.perf_counter() - t0 < 10e-3
+    assert len(call_list) == 2 * len(report)
+    assert all(result['settle_time'] >= 0 for result in report)
+
+
+def test_wait_for_stable_readings(dcdc,monkeypatch):
+    # the multiplexer still outputs the previous selector for 3 readings
+    value_list = [[0x1, 0x0], [0x2, 0x0], [0x2, 0x5], [0x4, 0x5], [0x4, 0x5]]
+    monkeypatch.setattr(dcdc, 'get_wire_outs', lambda addr_list_p: value_list.pop(0))
+    report = dcdc.scan_errors(1)
+    assert (report[0]['errors'], report[0]['status']) == (0x4, 0x5)
+    assert report[0]['settle_time'] >= 0
+    assert value_list == []
+
+
+def test_unstable_readings(dcdc,monkeypatch):
+    dcdc._c_ERROR_SEL_TIMEOUT = 20e-3
+    counter = [0]
+    def get_wire_outs(addr_list_p):
+        counter[0] += 1
+        return [counter[0], 0]
+    monkeypatch.setattr(dcdc, 'get_wire_outs', get_wire_outs)
+    report = dcdc.scan_errors()
+    assert all(result['settle_time'] == -1 for result in report)
+    # polled with a back-off (no busy loop)
+    assert counter[0] < 50
+    dcdc.set_verbosity(-1)
+    assert dcdc.check_internal_errors() == 2
+
+
+def test_loopback_timeout(dcdc):
+    dcdc._c_ERROR_SEL_TIMEOUT = 20e-3
+    # the ERROR_SEL loopback is stuck at 0
+    addr_loopback = dcdc._addr_wire_out['ERROR_SEL']
+    poll_list = []
+    def get_wire_out(addr_p):
+        poll_list.append(addr_p)
+        return 0
+    dcdc.get_wire_out = get_wire_out
+
+    report = dcdc.scan_errors()
+    assert report[0]['loopback_time'] >= 0
+    assert report[1]['loopback_time'] == -1
+    # the loopback is polled with a back-off (no busy loop)
+    assert set(poll_list) == {addr_loopback}
+    assert len(poll_list) < 50
+    assert dcdc.check_internal_errors() == 1
@@ -0,0 +1,131 @@
+# ------------------------------------------------------------------------------------------------------------
+#                            Copyright (C) 2024-2030 Ken-ji de la ROSA, IRAP Toulouse.
+# ------------------------------------------------------------------------------------------------------------
+#                            This file is part of the ATHENA X-IFU DRE Telemetry and Telecommand Firmware.
+#
+#                            dcdc-hk-fw is free software: you can redistribute it and/or modify
+#                            it under the terms of the GNU General Public License as published by
+#                            the Free Software Foundation, either version 3 of the License, or
+#                            (at your option) any later version.
+#
+#                            This program is distributed in the hope that it will be useful,
+#                            but WITHOUT ANY WARRANTY; without even the implied warranty of
+#                            MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#                            GNU General Public License for more details.
+#
+#                            You should have received a copy of the GNU General Public License
+#                            along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------------------------------------
+#    email                   kenji.delarosa@alten.com
+#    @file                   test_fpga_cache.py
+# -------------------------------------------------------------------------------------------------------------
+#    Automatic Generation    No
+#    Code Rules Reference    N/A
+# -------------------------------------------------------------------------------------------------------------
+#   @details
+#
+#   Unit tests of the FPGA configuration cache and of the fast attach of Driver.open.
+#
+# ------------------------------------------------------------------------------------------------------------
+
+# standard library
+import threading
+
+# custom library
+from driver import DCDC,SimBackend
+from driver.fpga_cache import FpgaConfigCache,compute_file_hash
+
+
+def test_set_get_remove(tmp_path):
+    cache = FpgaConfigCache(str(tmp_path / 'cache.json'))
+    assert cache.get('SN0') is None
+    cache.set('SN0', 'a.bit', 'hash0', [1, 2, 3])
+    cache.set('SN1', 'b.bit', 'hash1', None)
+    assert cache.get('SN0') == {'firmware_filepath': 'a.bit', 'bit_hash': 'hash0', 'firmware_ids': [1, 2, 3]}
+    cache.remove('SN0')
+    assert cache.get('SN0') is None
+    assert cache.get('SN1')['bit_hash'] == 'hash1'
+    # unknown serial number: nothing to do
+    cache.remove('SN2')
+
+
+def test_corrupted_file(tmp_path):
+    filepath = tmp_path / 'cache.json'
+    filepath.write_text('{"SN0": ')
+    cache = FpgaConfigCache(str(filepath))
+    assert cache.get('SN0') is None
+    cache.set('SN0', 'a.bit', 'hash0', None)
+    assert cache.get('SN0')['bit_hash'] == 'hash0'
+
+
+def test_concurrent_writes(tmp_path):
+    cache = FpgaConfigCache(str(tmp_path / 'cache.json'))
+    nb_threads = 8
+
+    def write(index_p):
+        for i in range(20):
+            cache.set('SN' + str(index_p), 'a.bit', 'hash' + str(i), None)
+        cache.set('SN' + str(index_p), 'a.bit', 'final', None)
+
+    thread_list = [threading.Thread(target=write, args=(i,)) for i in range(nb_threads)]
+    for thread in thread_list:
+        thread.start()
+    for thread in thread_list:
+        thread.join()
+
+    # no lost update and no temporary file left
+    for i in range(nb_threads):
+        assert cache.get('SN' + str(i))['bit_hash'] == 'final'
+    assert list(tmp_path.glob('*.tmp')) == []
+
+
+def test_compute_file_hash(tmp_path):
+    filepath = tmp_path / 'fw.bit'
+    filepath.write_bytes(b'1234')
+    hash0 = compute_file_hash(str(filepath))
+    filepath.write_bytes(b'1235')
+    assert compute_file_hash(str(filepath)) != hash0
+    assert compute_file_hash(str(tmp_path / 'missing.bit')) is None
+
+
+def test_fast_attach(firmware_filepath,fpga_cache_filepath):
+    backend = SimBackend()
+    board = DCDC()
+    assert board.open(firmware_filepath, backend_p=backend)
+    dev = board.dev
+    record = FpgaConfigCache(fpga_cache_filepath).get(dev.serial)
+    assert record['bit_hash'] == compute_file_hash(firmware_filepath)
+
+    # the same board is opened again: it still runs the firmware
+    backend.open_device = lambda serial_p=None: dev
+    configure_list = []
+    configure_fpga = dev.ConfigureFPGA
+    def count_configure_fpga(firmware_filepath_p):
+        configure_list.append(firmware_filepath_p)
+        return configure_fpga(firmware_filepath_p)
+    dev.ConfigureFPGA = count_configure_fpga
+    board.set_power_conf(1, 0, 1, 0)
+    board = DCDC()
+    assert board.open(firmware_filepath, backend_p=backend)
+    assert configure_list == []
+    # no reset: the configuration was skipped and the wire_in buffer is resynchronized
+    assert board.get_wire_out(board._addr_wire_out['POWER_CONF']) == 0x5
+
+    # forced configuration
+    board = DCDC()
+    assert board.open(firmware_filepath, backend_p=backend, force_configure_p=True)
+    assert configure_list == [firmware_filepath]
+    assert board.get_wire_out(board._addr_wire_out['POWER_CONF']) == 0x0
+
+
+def test_failed_configuration_forgets_the_board(firmware_filepath,fpga_cache_filepath):
+    backend = SimBackend()
+    board = DCDC()
+    assert board.open(firmware_filepath, backend_p=backend)
+    dev = board.dev
+
+    dev.ConfigureFPGA = lambda firmware_filepath_p: -1
+    backend.open_device = lambda serial_p=None: dev
+    board = DCDC()
+    assert not board.open(firmware_filepath, backend_p=backend, force_configure_p=True)
+    assert FpgaConfigCache(fpga_cache_filepath).get(dev.serial) is None
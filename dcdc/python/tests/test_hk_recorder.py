@@ -0,0 +1,94 @@
+# ------------------------------------------------------------------------------------------------------------
+#                            Copyright (C) 2024-2030 Ken-ji de la ROSA, IRAP Toulouse.
+# ------------------------------------------------------------------------------------------------------------
+#                            This file is part of the ATHENA X-IFU DRE Telemetry and Telecommand Firmware.
+#
+#                            dcdc-hk-fw is free software: you can redistribute it and/or modify
+#                            it under the terms of the GNU General Public License as published by
+#                            the Free Software Foundation, either version 3 of the License, or
+#                            (at your option) any later version.
+#
+#                            This program is distributed in the hope that it will be useful,
+#                            but WITHOUT ANY WARRANTY; without even the implied warranty of
+#                            MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#                            GNU General Public License for more details.
+#
+#                            You should have received a copy of the GNU General Public License
+#                            along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------------------------------------
+#    email                   kenji.delarosa@alten.com
+#    @file                   test_hk_recorder.py
+# -------------------------------------------------------------------------------------------------------------
+#    Automatic Generation    No
+#    Code Rules Reference    N/A
+# -------------------------------------------------------------------------------------------------------------
+#   @details
+#
+#   Unit tests of the housekeeping recorder: record format, file rotation and ADC timeouts.
+#
+# ------------------------------------------------------------------------------------------------------------
+
+# third party library
+import numpy as np
+
+# custom library
+from driver import HK_DTYPE,HkRecorder,load_hk_file
+
+
+def test_record_frame(dcdc,tmp_path):
+    with HkRecorder(dcdc, str(tmp_path)) as recorder:
+        frame = recorder.record_frame()
+    assert frame['adc_latency'] >= 0
+    assert frame['status'] == 0
+    data = load_hk_file(recorder.filepath_list[0])
+    assert data.dtype == HK_DTYPE
+    assert data.shape == (1,)
+    np.testing.assert_array_equal(data[0]['adc'], frame['adc'])
+
+
+def test_record_frame_returns_a_copy(dcdc,tmp_path):
+    with HkRecorder(dcdc, str(tmp_path)) as recorder:
+        frame0 = recorder.record_frame()
+        frame1 = recorder.record_frame()
+    assert frame0['timestamp'] < frame1['timestamp']
+
+
+def test_rotation_by_size(dcdc,tmp_path):
+    recorder = HkRecorder(dcdc, str(tmp_path), rate_p=1000.0, max_file_size_p=3*HK_DTYPE.itemsize + 1)
+    assert recorder.run(nb_frames_p=7) == 7
+    assert len(recorder.filepath_list) == 3
+    assert [load_hk_file(filepath).shape[0] for filepath in recorder.filepath_list] == [3, 3, 1]
+    # monotonic timestamps across the files
+    timestamps = np.concatenate([load_hk_file(filepath)['timestamp'] for filepath in recorder.filepath_list])
+    assert np.all(np.diff(timestamps) > 0)
+
+
+def test_rotation_by_duration(dcdc,tmp_path):
+    recorder = HkRecorder(dcdc, str(tmp_path), max_file_duration_p=0.0)
+    for i in range(3):
+        recorder.record_frame()
+    recorder.close()
+    assert len(recorder.filepath_list) == 3
+    assert len(set(recorder.filepath_list)) == 3
+
+
+def test_truncated_file(dcdc,tmp_path):
+    with HkRecorder(dcdc, str(tmp_path)) as recorder:
+        recorder.record_frame()
+        recorder.record_frame()
+    filepath = recorder.filepath_list[0]
+    with open(filepath, 'ab') as file:
+        file.write(b'\x00' * (HK_DTYPE.itemsize // 2))
+    assert load_hk_file(filepath).shape == (2,)
+
+
+def test_adc_timeout_is_flagged(dcdc,tmp_path):
+    with HkRecorder(dcdc, str(tmp_path)) as recorder:
+        recorder.record_frame()
+        # the ADC acquisition doesn't complete
+        dcdc.set_adc_wait = lambda timeout_p=1.0: -1
+        frame = recorder.record_frame()
+    assert frame['adc_latency'] < 0
+    assert recorder.nb_timeouts == 1
+    data = load_hk_file(recorder.filepath_list[0])
+    assert list(data['adc_latency'] < 0) == [False, True]
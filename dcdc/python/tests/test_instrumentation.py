@@ -0,0 +1,110 @@
+# ------------------------------------------------------------------------------------------------------------
+#                            Copyright (C) 2024-2030 Ken-ji de la ROSA, IRAP Toulouse.
+# ------------------------------------------------------------------------------------------------------------
+#                            This file is part of the ATHENA X-IFU DRE Telemetry and Telecommand Firmware.
+#
+#                            dcdc-hk-fw is free software: you can redistribute it and/or modify
+#                            it under the terms of the GNU General Public License as published by
+#                            the Free Software Foundation, either version 3 of the License, or
+#                            (at your option) any later version.
+#
+#                            This program is distributed in the hope that it will be useful,
+#                            but WITHOUT ANY WARRANTY; without even the implied warranty of
+#                            MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#                            GNU General Public License for more details.
+#
+#                            You should have received a copy of the GNU General Public License
+#                            along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------------------------------------
+#    email                   kenji.delarosa@alten.com
+#    @file                   test_instrumentation.py
+# -------------------------------------------------------------------------------------------------------------
+#    Automatic Generation    No
+#    Code Rules Reference    N/A
+# -------------------------------------------------------------------------------------------------------------
+#   @details
+#
+#   Unit tests of the USB transaction statistics: counts by register, batches and latency histogram.
+#
+# ------------------------------------------------------------------------------------------------------------
+
+# custom library
+from driver.instrumentation import TransactionStats
+
+
+def _get_entry_dict(board):
+    return {(item['kind'], item['name']): item for item in board.stats()['transactions']}
+
+
+def test_histogram():
+    stats = TransactionStats()
+    for duration in [0.5e-6, 1.5e-6, 3e-6, 3.5e-6, 10.0]:
+        stats.record('wire_out', 0x21, duration)
+    result = stats.get_stats()
+    item = result['transactions'][0]
+    assert (item['count'], item['min_s'], item['max_s']) == (5, 0.5e-6, 10.0)
+    histogram = item['histogram']
+    assert histogram[:3] == [1, 1, 2]
+    # everything above the last bound is in the last bin
+    assert histogram[-1] == 1
+    assert len(result['histogram_bins_us']) == len(histogram)
+    assert result['histogram_bins_us'][-1] is None
+    assert result['total']['count'] == 5
+    stats.reset()
+    assert stats.get_stats()['total']['count'] == 0
+
+
+def test_counts_without_batch(dcdc):
+    dev = dcdc.dev
+    assert dcdc.stats() is None
+    dcdc.enable_stats()
+    nb_transactions = dev.nb_transactions
+    dcdc.set_ctrl(0)
+    dcdc.set_ctrl(0)
+    dcdc.set_power_conf(1, 0, 0, 0)
+    dcdc.get_hardware_id()
+    dcdc.get_adcs()
+    dcdc.set_adc_trig()
+    entry_dict = _get_entry_dict(dcdc)
+    assert entry_dict[('wire_in', 'CTRL')]['count'] == 2
+    assert entry_dict[('wire_in', 'POWER_CONF')]['count'] == 1
+    assert entry_dict[('wire_out', 'HARDWARE_ID')]['count'] == 1
+    assert entry_dict[('wire_outs', 'ADC0')]['count'] == 1
+    assert entry_dict[('trig_in', 'TRIG_CTRL')]['count'] == 1
+    # one recorded transaction by USB transaction
+    assert dcdc.stats()['total']['count'] == dev.nb_transactions - nb_transactions
+
+
+def test_counts_with_batch(dcdc):
+    dev = dcdc.dev
+    dcdc.enable_stats()
+    nb_transactions = dev.nb_transactions
+    with dcdc.batch():
+        dcdc.set_power_conf(1, 0, 0, 0)
+        dcdc.set_ctrl(0)
+        dcdc.set_debug_ctrl(0, 0)
+    entry_dict = _get_entry_dict(dcdc)
+    # the staged values aren't USB transactions: only the UpdateWireIns is recorded (with the first register)
+    assert list(entry_dict.keys()) == [('wire_ins', 'POWER_CONF')]
+    assert entry_dict[('wire_ins', 'POWER_CONF')]['count'] == 1
+    assert sum(entry_dict[('wire_ins', 'POWER_CONF')]['histogram']) == 1
+    assert dcdc.stats()['total']['count'] == dev.nb_transactions - nb_transactions == 1
+
+    # the staged values are sent before a trigger: 2 transactions
+    with dcdc.batch():
+        dcdc.set_ctrl(0)
+        dcdc.set_adc_trig()
+    entry_dict = _get_entry_dict(dcdc)
+    assert entry_dict[('wire_ins', 'CTRL')]['count'] == 1
+    assert entry_dict[('trig_in', 'TRIG_CTRL')]['count'] == 1
+    assert dcdc.stats()['total']['count'] == dev.nb_transactions - nb_transactions == 3
+
+
+def test_dump_stats(dcdc,tmp_path):
+    filepath = tmp_path / 'stats.json'
+    dcdc.dump_stats(str(filepath))
+    assert not filepath.exists()
+    dcdc.enable_stats()
+    dcdc.get_hardware_id()
+    dcdc.dump_stats(str(filepath))
+    assert '"HARDWARE_ID"' in filepath.read_text()
@@ -0,0 +1,85 @@
+# ------------------------------------------------------------------------------------------------------------
+#                            Copyright (C) 2024-2030 Ken-ji de la ROSA, IRAP Toulouse.
+# ------------------------------------------------------------------------------------------------------------
+#                            This file is part of the ATHENA X-IFU DRE Telemetry and Telecommand Firmware.
+#
+#                            dcdc-hk-fw is free software: you can redistribute it and/or modify
+#                            it under the terms of the GNU General Public License as published by
+#                            the Free Software Foundation, either version 3 of the License, or
+#                            (at your option) any later version.
+#
+#                            This program is distributed in the hope that it will be useful,
+#                            but WITHOUT ANY WARRANTY; without even the implied warranty of
+#                            MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#                            GNU General Public License for more details.
+#
+#                            You should have received a copy of the GNU General Public License
+#                            along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------------------------------------
+#    email                   kenji.delarosa@alten.com
+#    @file                   test_mem_file.py
+# -------------------------------------------------------------------------------------------------------------
+#    Automatic Generation    No
+#    Code Rules Reference    N/A
+# -------------------------------------------------------------------------------------------------------------
+#   @details
+#
+#   Unit tests of the *.mem parser and of its .npy cache.
+#
+# ------------------------------------------------------------------------------------------------------------
+
+# third party library
+import numpy as np
+import pytest
+
+# custom library
+from driver import parse_mem_file,load_mem_file
+from driver.mem_file import parse_mem_data
+
+
+def test_single_section():
+    data = b'0000\n00ff\nABCD\nffff\n'
+    np.testing.assert_array_equal(parse_mem_data(data), [0x0000, 0x00FF, 0xABCD, 0xFFFF])
+    assert parse_mem_data(data).dtype == np.uint16
+
+
+def test_crlf_and_short_words():
+    data = b'1\r\n23 456\r\n\r\n7890\r\n'
+    np.testing.assert_array_equal(parse_mem_data(data), [0x1, 0x23, 0x456, 0x7890])
+
+
+def test_address_sections():
+    data = b'0001\n0002\n@8\n0003\n@00000004 // comment\n0004\n'
+    expected = np.zeros(9, dtype=np.uint16)
+    expected[[0, 1, 8, 4]] = [1, 2, 3, 4]
+    np.testing.assert_array_equal(parse_mem_data(data), expected)
+
+
+def test_empty_file():
+    assert parse_mem_data(b'').shape == (0,)
+
+
+@pytest.mark.parametrize('data', [b'00g0\n', b'12345\n', b'00 1x\n'])
+def test_invalid_words(data):
+    with pytest.raises(ValueError):
+        parse_mem_data(data)
+
+
+def test_load_with_cache(tmp_path):
+    filepath = tmp_path / 'ram.mem'
+    values = np.arange(0, 4096, 7, dtype=np.uint16)
+    filepath.write_bytes(b''.join('{0:04x}\n'.format(value).encode('ascii') for value in values))
+    cache_dir = tmp_path / 'cache'
+
+    array = load_mem_file(str(filepath), cache_dir_p=str(cache_dir))
+    np.testing.assert_array_equal(array, values)
+    np.testing.assert_array_equal(parse_mem_file(str(filepath)), values)
+    assert len(list(cache_dir.glob('ram.*.npy'))) == 1
+    # unchanged file: the loaded array is returned without any reading
+    assert load_mem_file(str(filepath), cache_dir_p=str(cache_dir)) is array
+
+    # modified file: new cache entry
+    filepath.write_bytes(b'0001\n0002\n')
+    np.testing.assert_array_equal(load_mem_file(str(filepath), cache_dir_p=str(cache_dir)), [1, 2])
+    assert len(list(cache_dir.glob('ram.*.npy'))) == 2
+    np.testing.assert_array_equal(load_mem_file(str(filepath), cache_p=False), [1, 2])
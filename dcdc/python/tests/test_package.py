@@ -0,0 +1,64 @@
+# ------------------------------------------------------------------------------------------------------------
+#                            Copyright (C) 2024-2030 Ken-ji de la ROSA, IRAP Toulouse.
+# ------------------------------------------------------------------------------------------------------------
+#                            This file is part of the ATHENA X-IFU DRE Telemetry and Telecommand Firmware.
+#
+#                            dcdc-hk-fw is free software: you can redistribute it and/or modify
+#                            it under the terms of the GNU General Public License as published by
+#                            the Free Software Foundation, either version 3 of the License, or
+#                            (at your option) any later version.
+#
+#                            This program is distributed in the hope that it will be useful,
+#                            but WITHOUT ANY WARRANTY; without even the implied warranty of
+#                            MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#                            GNU General Public License for more details.
+#
+#                            You should have received a copy of the GNU General Public License
+#                            along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------------------------------------
+#    email                   kenji.delarosa@alten.com
+#    @file                   test_package.py
+# -------------------------------------------------------------------------------------------------------------
+#    Automatic Generation    No
+#    Code Rules Reference    N/A
+# -------------------------------------------------------------------------------------------------------------
+#   @details
+#
+#   Unit tests of the driver package: lazy loading of the modules and exported names.
+#
+# ------------------------------------------------------------------------------------------------------------
+
+# standard library
+import subprocess
+import sys
+from pathlib import Path
+
+# custom library
+import driver
+
+# directory of the driver package
+c_PACKAGE_BASE_PATH = str(Path(driver.__file__).parents[1])
+
+
+def _run(code):
+    """Run python code in a new interpreter (the modules of this process are already loaded)"""
+    result = subprocess.run([sys.executable, '-c', code], cwd=c_PACKAGE_BASE_PATH, capture_output=True, text=True, check=True)
+    return result.stdout.split()
+
+
+def test_import_is_lazy():
+    output = _run("import sys, driver; print('numpy' in sys.modules, 'driver.ok' in sys.modules, 'driver.dcdc' in sys.modules)")
+    assert output == ['False', 'False', 'False']
+    # the lazy names are loaded on first use
+    output = _run("import sys, driver; driver.Driver; print('driver.driver' in sys.modules, 'driver.dcdc' in sys.modules)")
+    assert output == ['True', 'False']
+
+
+def test_star_import():
+    output = _run("from driver import *; print(Driver.__name__, DCDC.__name__, Display.__name__, HkRecorder.__name__)")
+    assert output == ['Driver', 'DCDC', 'Display', 'HkRecorder']
+    assert set(driver._lazy_attr_dict.keys()) <= set(driver.__all__)
+    assert 'types' not in driver.__all__
+    assert sorted(dir(driver)) == dir(driver)
+    for name in driver.__all__:
+        assert getattr(driver, name) is not None
@@ -0,0 +1,82 @@
+# ------------------------------------------------------------------------------------------------------------
+#                            Copyright (C) 2024-2030 Ken-ji de la ROSA, IRAP Toulouse.
+# ------------------------------------------------------------------------------------------------------------
+#                            This file is part of the ATHENA X-IFU DRE Telemetry and Telecommand Firmware.
+#
+#                            dcdc-hk-fw is free software: you can redistribute it and/or modify
+#                            it under the terms of the GNU General Public License as published by
+#                            the Free Software Foundation, either version 3 of the License, or
+#                            (at your option) any later version.
+#
+#                            This program is distributed in the hope that it will be useful,
+#                            but WITHOUT ANY WARRANTY; without even the implied warranty of
+#                            MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#                            GNU General Public License for more details.
+#
+#                            You should have received a copy of the GNU General Public License
+#                            along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------------------------------------
+#    email                   kenji.delarosa@alten.com
+#    @file                   test_power_rails.py
+# -------------------------------------------------------------------------------------------------------------
+#    Automatic Generation    No
+#    Code Rules Reference    N/A
+# -------------------------------------------------------------------------------------------------------------
+#   @details
+#
+#   Unit tests of the power rails: rail windows and automated power sweep on a simulated board.
+#
+# ------------------------------------------------------------------------------------------------------------
+
+# standard library
+import json
+
+# custom library
+from driver import PowerRails,load_power_rails,run_power_sweep
+
+
+def _write_rails(tmp_path,window_on):
+    desc = {'name': 'test', 'rails': []}
+    for i, name in enumerate(['dmx0', 'dmx1', 'ras', 'wfee']):
+        desc['rails'].append({'name': name, 'power_field': name + '_power_on_off', 'adc': 'ADC' + str(i), 'off': [0.0, 0.5], 'on': window_on})
+    filepath = tmp_path / 'rails.json'
+    filepath.write_text(json.dumps(desc))
+    return PowerRails(str(filepath))
+
+
+def test_load_power_rails():
+    power_rails = load_power_rails()
+    assert power_rails is load_power_rails()
+    # placeholder windows: not a verification of the hardware
+    assert not power_rails.validated
+    rail = power_rails.rails['ras']
+    assert rail.check(0.1, 0) and (not rail.check(0.1, 1))
+
+
+def test_power_sweep(dcdc):
+    value_list = [0x0, 0x1, 0x6, 0xF, 0x0]
+    step_list = run_power_sweep(dcdc, value_list_p=value_list)
+    assert [step['value'] for step in step_list] == value_list
+    for step in step_list:
+        assert step['ok']
+        assert step['settle_time'] >= 0
+        assert step['adc_time'] >= 0
+        # each rail follows its POWER_CONF bit (keyword arguments of set_power_wait)
+        on_off_list = [rail['on_off'] for rail in step['rails']]
+        assert on_off_list == [(step['value'] >> i) & 0x1 for i in range(4)]
+    assert dcdc.get_wire_out(dcdc._addr_wire_out['POWER_CONF']) == 0x0
+
+
+def test_power_sweep_out_of_window(dcdc,tmp_path):
+    # the simulated rails are at 2.5 V when on
+    power_rails = _write_rails(tmp_path, [3.0, 5.0])
+    step_list = run_power_sweep(dcdc, power_rails_p=power_rails, value_list_p=[0x0, 0x4])
+    assert step_list[0]['ok']
+    assert not step_list[1]['ok']
+    assert [rail['ok'] for rail in step_list[1]['rails']] == [True, True, False, True]
+
+
+def test_public_accessors(dcdc):
+    assert dcdc.get_verbosity() == -1
+    assert dcdc.get_adc_name_list() == ['ADC' + str(i) for i in range(8)]
+    assert dcdc.get_register_map()['POWER_CONF'].encode(ras_power_on_off=1) == 0x4
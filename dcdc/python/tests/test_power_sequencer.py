@@ -0,0 +1,100 @@
+# ------------------------------------------------------------------------------------------------------------
+#                            Copyright (C) 2024-2030 Ken-ji de la ROSA, IRAP Toulouse.
+# ------------------------------------------------------------------------------------------------------------
+#                            This file is part of the ATHENA X-IFU DRE Telemetry and Telecommand Firmware.
+#
+#                            dcdc-hk-fw is free software: you can redistribute it and/or modify
+#                            it under the terms of the GNU General Public License as published by
+#                            the Free Software Foundation, either version 3 of the License, or
+#                            (at your option) any later version.
+#
+#                            This program is distributed in the hope that it will be useful,
+#                            but WITHOUT ANY WARRANTY; without even the implied warranty of
+#                            MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#                            GNU General Public License for more details.
+#
+#                            You should have received a copy of the GNU General Public License
+#                            along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------------------------------------
+#    email                   kenji.delarosa@alten.com
+#    @file                   test_power_sequencer.py
+# -------------------------------------------------------------------------------------------------------------
+#    Automatic Generation    No
+#    Code Rules Reference    N/A
+# -------------------------------------------------------------------------------------------------------------
+#   @details
+#
+#   Unit tests of the power sequencer on a simulated board: plan execution, verification and unvalidated rails.
+#
+# ------------------------------------------------------------------------------------------------------------
+
+# standard library
+import json
+
+# third party library
+import pytest
+
+# custom library
+from driver import PowerRails,PowerSequencer
+
+
+def _write_rails(tmp_path,validated,window_on=(0.5, 5.0)):
+    desc = {'name': 'test', 'validated': validated, 'rails': []}
+    for i, name in enumerate(['dmx0', 'dmx1', 'ras', 'wfee']):
+        desc['rails'].append({'name': name, 'power_field': name + '_power_on_off', 'adc': 'ADC' + str(i), 'off': [0.0, 0.5], 'on': list(window_on)})
+    desc['plans'] = {'up': [{'on': ['dmx0', 'ras']}, {'on': ['wfee'], 'delay': 1e-3}], 'down': [{'off': ['dmx0', 'ras', 'wfee'], 'verify': False}]}
+    filepath = tmp_path / 'rails.json'
+    filepath.write_text(json.dumps(desc))
+    return PowerRails(str(filepath))
+
+
+def test_run_plan(dcdc,tmp_path):
+    sequencer = PowerSequencer(dcdc, power_rails_p=_write_rails(tmp_path, True))
+    step_list = sequencer.run('up')
+    assert [step['value'] for step in step_list] == [0x5, 0xD]
+    assert all(step['ok'] and step['verified'] for step in step_list)
+    assert step_list[1]['start_time'] > step_list[0]['start_time']
+    assert dcdc.get_power_conf() == 0xD
+    step_list = sequencer.run('down')
+    assert (step_list[0]['value'] == 0x0) and (step_list[0]['rails'] is None)
+    assert dcdc.get_verbosity() == -1
+
+
+def test_each_step_uses_set_power_wait(dcdc,tmp_path,monkeypatch):
+    kwargs_list = []
+    set_power_wait = dcdc.set_power_wait
+    def spy(**kwargs):
+        kwargs_list.append(kwargs)
+        return set_power_wait(**kwargs)
+    monkeypatch.setattr(dcdc, 'set_power_wait', spy)
+    PowerSequencer(dcdc, power_rails_p=_write_rails(tmp_path, True)).run('up')
+    # by keyword (independent of the field order of the JSON file)
+    assert [kwargs['ras_power_on_off_p'] for kwargs in kwargs_list] == [1, 1]
+    assert [kwargs['wfee_power_on_off_p'] for kwargs in kwargs_list] == [0, 1]
+
+
+def test_failed_step_stops_the_plan(dcdc,tmp_path):
+    # the simulated rails are at 2.5 V when on
+    sequencer = PowerSequencer(dcdc, power_rails_p=_write_rails(tmp_path, True, window_on=(3.0, 5.0)))
+    step_list = sequencer.run('up')
+    assert len(step_list) == 1
+    assert not step_list[0]['ok']
+
+
+def test_unvalidated_rails_refuse_verify(dcdc,tmp_path):
+    power_rails = _write_rails(tmp_path, False)
+    dev = dcdc.dev
+    nb_transactions = dev.nb_transactions
+    with pytest.raises(ValueError, match='UNVALIDATED'):
+        PowerSequencer(dcdc, power_rails_p=power_rails).run('up')
+    assert dev.nb_transactions == nb_transactions
+    # no verified step: nothing to refuse
+    assert PowerSequencer(dcdc, power_rails_p=power_rails).run('down')[0]['ok']
+    # explicit override: the steps are checked but not reported as verified
+    step_list = PowerSequencer(dcdc, power_rails_p=power_rails, allow_unvalidated_p=True).run('up')
+    assert all(step['ok'] and (not step['verified']) for step in step_list)
+
+
+def test_unknown_plan(dcdc):
+    with pytest.raises(ValueError, match='unknown power plan'):
+        PowerSequencer(dcdc).run('foo')
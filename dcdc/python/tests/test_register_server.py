@@ -0,0 +1,193 @@
+# ------------------------------------------------------------------------------------------------------------
+#                            Copyright (C) 2024-2030 Ken-ji de la ROSA, IRAP Toulouse.
+# ------------------------------------------------------------------------------------------------------------
+#                            This file is part of the ATHENA X-IFU DRE Telemetry and Telecommand Firmware.
+#
+#                            dcdc-hk-fw is free software: you can redistribute it and/or modify
+#                            it under the terms of the GNU General Public License as published by
+#                            the Free Software Foundation, either version 3 of the License, or
+#                            (at your option) any later version.
+#
+#                            This program is distributed in the hope that it will be useful,
+#                            but WITHOUT ANY WARRANTY; without even the implied warranty of
+#                            MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#                            GNU General Public License for more details.
+#
+#                            You should have received a copy of the GNU General Public License
+#                            along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------------------------------------
+#    email                   kenji.delarosa@alten.com
+#    @file                   test_register_server.py
+# -------------------------------------------------------------------------------------------------------------
+#    Automatic Generation    No
+#    Code Rules Reference    N/A
+# -------------------------------------------------------------------------------------------------------------
+#   @details
+#
+#   Unit tests of the register server: coalescing of the read requests and remote clients.
+#
+# ------------------------------------------------------------------------------------------------------------
+
+# standard library
+import json
+import socket
+
+# third party library
+import pytest
+
+# custom library
+from driver import DCDC,RegisterServer,RemoteBackend
+from driver.register_server import _Request
+from driver.fpga_cache import FpgaConfigCache
+
+
+@pytest.fixture
+def server(dcdc):
+    """Register server of a simulated board (any free TCP port)"""
+    register_server = RegisterServer(dcdc, port_p=0)
+    yield register_server
+    register_server.stop()
+
+
+def _wait(request_list_p):
+    for request in request_list_p:
+        assert request.done.wait(5.0)
+        assert request.error is None
+
+
+def test_read_requests_are_coalesced(dcdc,server):
+    addr_hardware_id = dcdc._addr_wire_out['HARDWARE_ID']
+    addr_firmware_id = dcdc._addr_wire_out['FIRMWARE_ID']
+    # queued before the start of the worker: taken in a single pass
+    request_list = []
+    request_list.append(_Request([['get', [addr_hardware_id]]]))
+    request_list.append(_Request([['get', [addr_firmware_id]], ['get', [addr_hardware_id, addr_firmware_id]]]))
+    request_list.append(_Request([['get', [addr_firmware_id]]]))
+    for request in request_list:
+        server._queue.put(request)
+    nb_transactions = dcdc.dev.nb_transactions
+    server.start()
+    _wait(request_list)
+
+    dev = dcdc.dev
+    assert server.nb_requests == 3
+    assert server.nb_wire_out_updates == 1
+    assert dev.nb_transactions == nb_transactions + 1
+    assert request_list[0].results == [[dev.hardware_id]]
+    assert request_list[1].results == [[dev.firmware_id], [dev.hardware_id, dev.firmware_id]]
+    assert request_list[2].results == [[dev.firmware_id]]
+
+
+def test_writes_split_the_reads(dcdc,server):
+    addr_power_conf = dcdc._addr_wire_out['POWER_CONF']
+    request_list = []
+    request_list.append(_Request([['get', [addr_power_conf]]]))
+    request_list.append(_Request([['set', dcdc._addr_wire_in['POWER_CONF'], 0x3, 0xFFFF_FFFF]]))
+    request_list.append(_Request([['get', [addr_power_conf]]]))
+    request_list.append(_Request([['get', [addr_power_conf]]]))
+    for request in request_list:
+        server._queue.put(request)
+    server.start()
+    _wait(request_list)
+
+    # the requests are executed in order: the reads after the write see the new value
+    assert server.nb_wire_out_updates == 2
+    assert [request.results for request in request_list] == [[[0x0]], [None], [[0x3]], [[0x3]]]
+
+
+def test_invalid_request(server):
+    server.start()
+    with socket.create_connection(server.address) as sock:
+        file = sock.makefile('rwb')
+        file.write(b'{"ops": [["foo"]]}\n' + b'not json\n' + b'{"ops": [["get", 5]]}\n' + b'{"ops": [["set", 1, 2]]}\n')
+        file.flush()
+        assert 'unknown operation' in json.loads(file.readline())['error']
+        assert 'invalid request' in json.loads(file.readline())['error']
+        assert 'must be a list' in json.loads(file.readline())['error']
+        assert 'number of arguments' in json.loads(file.readline())['error']
+    assert server.nb_requests == 0
+
+
+def test_malformed_read_doesnt_fail_the_others(dcdc,server):
+    server.start()
+    addr_hardware_id = dcdc._addr_wire_out['HARDWARE_ID']
+    sock_list = [socket.create_connection(server.address) for i in range(3)]
+    file_list = [sock.makefile('rwb') for sock in sock_list]
+    line_list = [b'{"ops": [["get", [%d]]]}\n' % addr_hardware_id, b'{"ops": [["get", 5]]}\n', b'{"ops": [["get", [%d]]]}\n' % addr_hardware_id]
+    for file, line in zip(file_list, line_list):
+        file.write(line)
+        file.flush()
+    response_list = [json.loads(file.readline()) for file in file_list]
+    assert response_list[0] == {'results': [[dcdc.dev.hardware_id]]}
+    assert 'error' in response_list[1]
+    assert response_list[2] == {'results': [[dcdc.dev.hardware_id]]}
+    for sock in sock_list:
+        sock.close()
+
+
+def test_remote_client(dcdc,server,firmware_filepath,fpga_cache_filepath):
+    cache = FpgaConfigCache(fpga_cache_filepath)
+    record = cache.get(dcdc.dev.serial)
+    server.start()
+
+    backend = RemoteBackend(port_p=server.address[1])
+    assert backend.list_serials() == [dcdc.dev.serial]
+    client = DCDC()
+    client.set_verbosity(-1)
+    # another firmware file: the client never configures the board
+    other_filepath = firmware_filepath + '.other'
+    with open(other_filepath, 'wb') as file:
+        file.write(b'\x01' * 64)
+    assert client.open(other_filepath, backend_p=backend)
+    assert cache.get(dcdc.dev.serial) == record
+
+    assert client.get_hardware_id() == dcdc.dev.hardware_id
+    with client.batch():
+        client.set_power_conf(1, 0, 0, 1)
+        client.set_debug_ctrl(0, 0)
+    assert dcdc.get_wire_out(dcdc._addr_wire_out['POWER_CONF']) == 0x9
+    assert client.set_power_wait(0, 0, 0, 0) >= 0
+    assert client.get_wire_out(client._addr_wire_out['POWER_CONF']) == 0x0
+    client.dev.close()
+
+
+def test_clients_dont_clobber_each_other(dcdc,server,firmware_filepath):
+    server.start()
+    client_list = []
+    for i in range(2):
+        client = DCDC()
+        client.set_verbosity(-1)
+        assert client.open(firmware_filepath, backend_p=RemoteBackend(port_p=server.address[1]))
+        client_list.append(client)
+    client_a, client_b = client_list
+
+    client_b.set_power_conf(1, 1, 1, 1)
+    # the first write of client A only sends its own register
+    client_a.set_ctrl(0)
+    assert dcdc.get_wire_out(dcdc._addr_wire_out['POWER_CONF']) == 0xF
+    client_a.set_debug_ctrl(0, 1)
+    client_b.set_ctrl(0)
+    assert dcdc.get_wire_out(dcdc._addr_wire_out['DEBUG_CTRL']) == dcdc._regmap['DEBUG_CTRL'].encode(debug_pulse=1)
+    assert client_a.get_wire_out(client_a._addr_wire_out['POWER_CONF']) == 0xF
+
+    # the shadow cache of a client is seeded without any write
+    client_a.resync()
+    client_a.set_ctrl(0)
+    assert dcdc.get_wire_out(dcdc._addr_wire_out['POWER_CONF']) == 0xF
+    for client in client_list:
+        client.dev.close()
+
+
+def test_remote_client_has_no_pipe(server,firmware_filepath):
+    server.start()
+    client = DCDC()
+    client.set_verbosity(-1)
+    assert client.open(firmware_filepath, backend_p=RemoteBackend(port_p=server.address[1]))
+    # rejected before any transfer, with the message of the driver
+    with pytest.raises(ValueError, match="doesn't support the pipes"):
+        client.write_pipe(0x80, bytearray(32))
+    with pytest.raises(ValueError, match="doesn't support the pipes"):
+        client.read_pipe(0xA0, bytearray(32))
+    with pytest.raises(ValueError, match="doesn't support the pipes"):
+        next(client.iter_read_pipe(0xA0, 32, 16))
+    client.dev.close()
@@ -0,0 +1,92 @@
+# ------------------------------------------------------------------------------------------------------------
+#                            Copyright (C) 2024-2030 Ken-ji de la ROSA, IRAP Toulouse.
+# ------------------------------------------------------------------------------------------------------------
+#                            This file is part of the ATHENA X-IFU DRE Telemetry and Telecommand Firmware.
+#
+#                            dcdc-hk-fw is free software: you can redistribute it and/or modify
+#                            it under the terms of the GNU General Public License as published by
+#                            the Free Software Foundation, either version 3 of the License, or
+#                            (at your option) any later version.
+#
+#                            This program is distributed in the hope that it will be useful,
+#                            but WITHOUT ANY WARRANTY; without even the implied warranty of
+#                            MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#                            GNU General Public License for more details.
+#
+#                            You should have received a copy of the GNU General Public License
+#                            along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------------------------------------
+#    email                   kenji.delarosa@alten.com
+#    @file                   test_regmap.py
+# -------------------------------------------------------------------------------------------------------------
+#    Automatic Generation    No
+#    Code Rules Reference    N/A
+# -------------------------------------------------------------------------------------------------------------
+#   @details
+#
+#   Unit tests of the JSON register map loader (see dcdc_regmap.json).
+#
+# ------------------------------------------------------------------------------------------------------------
+
+# standard library
+import json
+
+# custom library
+from driver import RegisterMap,load_register_map
+
+
+def test_dcdc_register_map_addresses():
+    regmap = load_register_map('dcdc_regmap.json')
+    assert regmap.addr_wire_in['CTRL'] == 0x00
+    assert regmap.addr_wire_in['POWER_CONF'] == 0x01
+    assert regmap.addr_wire_in['DEBUG_CTRL'] == 0x18
+    assert regmap.addr_wire_in['ERROR_SEL'] == 0x19
+    # wire_out mirrors of the wire_in registers
+    for name, addr in regmap.addr_wire_in.items():
+        assert regmap.addr_wire_out[name] == addr + 0x20
+    assert regmap.addr_wire_out['POWER_ADC_STATUS'] == 0x25
+    assert [regmap.addr_wire_out['ADC' + str(i)] for i in range(8)] == list(range(0x30, 0x38))
+    assert regmap.addr_wire_out['ERRORS'] == 0x3A
+    assert regmap.addr_wire_out['STATUS'] == 0x3B
+    assert regmap.addr_wire_out['FIRMWARE_ID'] == 0x3F
+    assert regmap.addr_trigin['TRIG_CTRL'] == 0x40
+    assert regmap.pos_trigin == {'power_valid': 0, 'adc_valid': 4}
+
+
+def test_dcdc_register_map_fields():
+    regmap = load_register_map('dcdc_regmap.json')
+    fields = regmap['POWER_ADC_STATUS'].fields
+    assert (fields['power_ready'].pos, fields['adc_ready'].pos) == (0, 4)
+    # ERROR_SEL: 1-bit selector => 2 internal errors/status
+    register = regmap['ERROR_SEL']
+    assert register.nb_selectors == 2**register.fields['error_sel'].width
+
+
+def test_load_register_map_is_cached():
+    assert load_register_map('dcdc_regmap.json') is load_register_map('dcdc_regmap.json')
+
+
+def test_encode_decode(tmp_path):
+    desc = {}
+    desc['name'] = 'test'
+    desc['registers'] = [
+        {'name': 'CONF', 'wire_in': '0x02', 'wire_out': 34, 'access': 'rw', 'reset': '0x10',
+         'fields': [{'name': 'en', 'pos': 0, 'width': 1}, {'name': 'mode', 'pos': 4, 'width': 3}]},
+        {'name': 'STATE', 'wire_out': '0x3C'},
+    ]
+    filepath = tmp_path / 'test_regmap.json'
+    filepath.write_text(json.dumps(desc))
+
+    regmap = RegisterMap(str(filepath))
+    register = regmap['CONF']
+    assert (register.wire_in, register.wire_out, register.reset) == (0x02, 0x22, 0x10)
+    assert 'STATE' in regmap
+    assert 'STATE' not in regmap.addr_wire_in
+    assert regmap.register_by_wire_out[0x3C].name == 'STATE'
+
+    data = register.encode(en=1, mode=5)
+    assert data == 0x51
+    # the field values are truncated to their width
+    assert register.encode(mode=0xF) == 0x70
+    assert register.decode(data) == {'en': 1, 'mode': 5}
+    assert regmap.decode_values({'CONF': 0x30}) == {'CONF': {'en': 0, 'mode': 3}}
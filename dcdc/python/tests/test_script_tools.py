@@ -0,0 +1,90 @@
+# ------------------------------------------------------------------------------------------------------------
+#                            Copyright (C) 2024-2030 Ken-ji de la ROSA, IRAP Toulouse.
+# ------------------------------------------------------------------------------------------------------------
+#                            This file is part of the ATHENA X-IFU DRE Telemetry and Telecommand Firmware.
+#
+#                            dcdc-hk-fw is free software: you can redistribute it and/or modify
+#                            it under the terms of the GNU General Public License as published by
+#                            the Free Software Foundation, either version 3 of the License, or
+#                            (at your option) any later version.
+#
+#                            This program is distributed in the hope that it will be useful,
+#                            but WITHOUT ANY WARRANTY; without even the implied warranty of
+#                            MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#                            GNU General Public License for more details.
+#
+#                            You should have received a copy of the GNU General Public License
+#                            along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------------------------------------
+#    email                   kenji.delarosa@alten.com
+#    @file                   test_script_tools.py
+# -------------------------------------------------------------------------------------------------------------
+#    Automatic Generation    No
+#    Code Rules Reference    N/A
+# -------------------------------------------------------------------------------------------------------------
+#   @details
+#
+#   Unit tests of the command line options shared by the test scripts.
+#
+# ------------------------------------------------------------------------------------------------------------
+
+# standard library
+import argparse
+import json
+
+# custom library
+from driver import DCDC,RemoteBackend,load_session_log
+from driver import add_backend_arguments,make_backend,open_board,close_board
+
+
+def _parse(arg_list,**kwargs):
+    parser = argparse.ArgumentParser()
+    add_backend_arguments(parser, **kwargs)
+    return parser.parse_args(arg_list)
+
+
+def test_backend_arguments():
+    args = _parse([])
+    assert (args.backend, args.force_configure, args.stats, args.record) == ('ok', False, None, None)
+    args = _parse(['-b', 'sim', '--force-configure'], default_backend_p='sim', session_p=False)
+    assert (args.backend, args.force_configure) == ('sim', True)
+    assert not hasattr(args, 'stats')
+    assert make_backend(args) == 'sim'
+
+
+def test_make_remote_backend():
+    backend = make_backend(_parse(['-b', 'remote', '--port', '50200']))
+    assert isinstance(backend, RemoteBackend)
+    assert backend.port == 50200
+    backend = make_backend(_parse(['-b', 'remote', '--unix_path', '/tmp/dcdc.sock']))
+    assert backend.unix_path == '/tmp/dcdc.sock'
+
+
+def test_open_and_close_board(firmware_filepath,tmp_path):
+    stats_filepath = str(tmp_path / 'stats.json')
+    record_filepath = str(tmp_path / 'session.log')
+    args = _parse(['-b', 'sim', '--stats', stats_filepath, '--record', record_filepath])
+    board = DCDC()
+    board.set_verbosity(-1)
+    assert open_board(board, firmware_filepath, args)
+    board.get_hardware_id()
+    close_board(board, args)
+    with open(stats_filepath, 'r') as file:
+        assert len(json.load(file)) > 0
+    assert len(load_session_log(record_filepath)) > 0
+
+
+def test_failed_open(tmp_path,monkeypatch):
+    args = _parse(['-b', 'sim', '--record', str(tmp_path / 'session.log')])
+    board = DCDC()
+    monkeypatch.setattr(board, 'open', lambda **kwargs: False)
+    assert not open_board(board, str(tmp_path / 'dcdc-fw.bit'), args)
+    # no recording on a board which isn't opened
+    assert not (tmp_path / 'session.log').exists()
+
+
+def test_no_register_server(firmware_filepath,tmp_path):
+    # the server can't be reached: the board isn't opened (no exception)
+    args = _parse(['-b', 'remote', '--unix_path', str(tmp_path / 'no_server.sock')])
+    board = DCDC()
+    assert not open_board(board, firmware_filepath, args)
@@ -0,0 +1,100 @@
+# ------------------------------------------------------------------------------------------------------------
+#                            Copyright (C) 2024-2030 Ken-ji de la ROSA, IRAP Toulouse.
+# ------------------------------------------------------------------------------------------------------------
+#                            This file is part of the ATHENA X-IFU DRE Telemetry and Telecommand Firmware.
+#
+#                            dcdc-hk-fw is free software: you can redistribute it and/or modify
+#                            it under the terms of the GNU General Public License as published by
+#                            the Free Software Foundation, either version 3 of the License, or
+#                            (at your option) any later version.
+#
+#                            This program is distributed in the hope that it will be useful,
+#                            but WITHOUT ANY WARRANTY; without even the implied warranty of
+#                            MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#                            GNU General Public License for more details.
+#
+#                            You should have received a copy of the GNU General Public License
+#                            along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------------------------------------
+#    email                   kenji.delarosa@alten.com
+#    @file                   test_session_log.py
+# -------------------------------------------------------------------------------------------------------------
+#    Automatic Generation    No
+#    Code Rules Reference    N/A
+# -------------------------------------------------------------------------------------------------------------
+#   @details
+#
+#   Unit tests of the session log: record of the transactions and replay on a simulated board.
+#
+# ------------------------------------------------------------------------------------------------------------
+
+# custom library
+from driver import SimBackend,load_session_log,replay_session
+from driver.session_log import OP_SET_WIRE_IN,OP_UPDATE_WIRE_INS,OP_GET_WIRE_OUT,OP_WRITE_PIPE,OP_READ_BLOCK_PIPE
+
+
+def _record_session(dcdc,filepath):
+    assert dcdc.start_recording(filepath)
+    dcdc.set_power_conf(1, 0, 1, 0)
+    dcdc.set_debug_ctrl(0, 1)
+    dcdc.get_wire_out(dcdc._addr_wire_out['POWER_CONF'])
+    dcdc.get_wire_out(dcdc._addr_wire_out['HARDWARE_ID'])
+    dcdc.write_pipe(0x80, bytearray(range(32)))
+    dcdc.read_pipe(0xA0, bytearray(32), block_size_p=16)
+    return dcdc.stop_recording()
+
+
+def test_record(dcdc,tmp_path):
+    filepath = str(tmp_path / 'session.log')
+    nb_records = _record_session(dcdc, filepath)
+    log = load_session_log(filepath)
+    assert len(log) == nb_records
+    assert (log['timestamp'][1:] >= log['timestamp'][:-1]).all()
+    op_list = log['op'].tolist()
+    assert op_list.count(OP_SET_WIRE_IN) == 2
+    assert OP_UPDATE_WIRE_INS in op_list
+    assert op_list[-2:] == [OP_WRITE_PIPE, OP_READ_BLOCK_PIPE]
+    # pipe records: transfer length and block size
+    assert log['value'][-1] == 32
+    assert log['mask'][-1] == 16
+    reads = log[log['op'] == OP_GET_WIRE_OUT]
+    assert reads['value'].tolist() == [0x5, dcdc.dev.hardware_id]
+    # the recording is stopped: the device is no longer proxied
+    assert dcdc.stop_recording() == 0
+    dcdc.set_ctrl(0)
+    assert len(load_session_log(filepath)) == nb_records
+
+
+def test_truncated_log(dcdc,tmp_path):
+    filepath = tmp_path / 'session.log'
+    nb_records = _record_session(dcdc, str(filepath))
+    filepath.write_bytes(filepath.read_bytes()[:-3])
+    assert len(load_session_log(str(filepath))) == nb_records - 1
+
+
+def test_replay_round_trip(dcdc,tmp_path):
+    filepath = str(tmp_path / 'session.log')
+    nb_records = _record_session(dcdc, filepath)
+
+    dev = SimBackend().open_device()
+    report = replay_session(filepath, dev)
+    assert report['nb_records'] == nb_records
+    assert report['nb_reads'] == 2
+    assert report['nb_mismatches'] == 0
+    assert report['mismatches'] == {}
+    # the wire_in values are replayed (read back through the wire_out mirror)
+    dev.UpdateWireOuts()
+    assert dev.GetWireOutValue(dcdc._addr_wire_out['POWER_CONF']) == 0x5
+    # the pipe data are not recorded: nothing is pushed into the FPGA
+    assert report['nb_skipped_pipes'] == 2
+    assert dev._pipe_fifo.get(0xA0, bytearray()) == bytearray()
+
+
+def test_replay_mismatch(dcdc,tmp_path):
+    filepath = str(tmp_path / 'session.log')
+    _record_session(dcdc, filepath)
+    dev = SimBackend().open_device()
+    dev.hardware_id += 1
+    report = replay_session(filepath, dev, realtime_p=True, speed_p=100.0)
+    assert report['nb_mismatches'] == 1
+    assert report['mismatches'] == {dcdc._addr_wire_out['HARDWARE_ID']: 1}
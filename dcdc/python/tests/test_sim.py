@@ -0,0 +1,101 @@
+# ------------------------------------------------------------------------------------------------------------
+#                            Copyright (C) 2024-2030 Ken-ji de la ROSA, IRAP Toulouse.
+# ------------------------------------------------------------------------------------------------------------
+#                            This file is part of the ATHENA X-IFU DRE Telemetry and Telecommand Firmware.
+#
+#                            dcdc-hk-fw is free software: you can redistribute it and/or modify
+#                            it under the terms of the GNU General Public License as published by
+#                            the Free Software Foundation, either version 3 of the License, or
+#                            (at your option) any later version.
+#
+#                            This program is distributed in the hope that it will be useful,
+#                            but WITHOUT ANY WARRANTY; without even the implied warranty of
+#                            MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#                            GNU General Public License for more details.
+#
+#                            You should have received a copy of the GNU General Public License
+#                            along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------------------------------------
+#    email                   kenji.delarosa@alten.com
+#    @file                   test_sim.py
+# -------------------------------------------------------------------------------------------------------------
+#    Automatic Generation    No
+#    Code Rules Reference    N/A
+# -------------------------------------------------------------------------------------------------------------
+#   @details
+#
+#   Unit tests of the backends and of the simulated DCDC board: backend selection, FSMs,
+#   errors multiplexer, resets and transaction latency.
+#
+# ------------------------------------------------------------------------------------------------------------
+
+# standard library
+import time
+
+# third party library
+import pytest
+
+# custom library
+from driver import DCDC,SimBackend
+from driver.backend import get_backend
+
+
+def test_get_backend():
+    assert isinstance(get_backend('sim'), SimBackend)
+    backend = SimBackend(latency_p=1e-3)
+    assert get_backend(backend) is backend
+    with pytest.raises(ValueError, match='unknown backend: usb'):
+        get_backend('usb')
+
+
+def test_open_configures_the_simulated_board(dcdc,firmware_filepath):
+    dev = dcdc.dev
+    assert dev.firmware_filepath == firmware_filepath
+    assert dev.IsFrontPanelEnabled()
+    assert dcdc.get_hardware_id() == dev.hardware_id
+    assert dcdc.get_firmware_id() == dev.firmware_id
+
+
+def test_busy_power_fsm_sets_an_error(firmware_filepath):
+    board = DCDC()
+    assert board.open(firmware_filepath, backend_p=SimBackend(power_duration_p=20e-3))
+    board.set_verbosity(-1)
+    board.set_power(1, 0, 0, 0)
+    # new trigger before the end of the previous configuration
+    board.set_power_trig()
+    assert board.dev.errors[0] & 0x1
+    board.set_debug_ctrl(1, 0)
+    assert board.dev.errors[0] == 0
+
+
+def test_errors_multiplexer(dcdc):
+    dev = dcdc.dev
+    dev.set_error(0, 0x5)
+    dcdc.set_error_sel(0)
+    assert dcdc.get_errors() == 0x5
+    # unknown selector
+    dcdc.set_error_sel(len(dev.errors))
+    assert dcdc.get_errors() == 0
+
+
+def test_ctrl_reset(dcdc):
+    dcdc.set_power_wait(1, 1, 1, 1)
+    dcdc.set_adc_wait()
+    dcdc.dev.set_error(0, 0x2)
+    dcdc.set_ctrl(1)
+    dcdc.set_ctrl(0)
+    assert not any(dcdc.dev.errors)
+    data, voltages = dcdc.get_adcs()
+    assert not data.any()
+
+
+def test_transaction_latency(firmware_filepath):
+    board = DCDC()
+    assert board.open(firmware_filepath, backend_p=SimBackend(latency_p=2e-3))
+    board.set_verbosity(-1)
+    nb_transactions = board.dev.nb_transactions
+    t0 = time.perf_counter()
+    board.get_hardware_id()
+    board.get_power_conf()
+    assert time.perf_counter() - t0 >= 4e-3
+    assert board.dev.nb_transactions == nb_transactions + 2
@@ -0,0 +1,92 @@
+# ------------------------------------------------------------------------------------------------------------
+#                            Copyright (C) 2024-2030 Ken-ji de la ROSA, IRAP Toulouse.
+# ------------------------------------------------------------------------------------------------------------
+#                            This file is part of the ATHENA X-IFU DRE Telemetry and Telecommand Firmware.
+#
+#                            dcdc-hk-fw is free software: you can redistribute it and/or modify
+#                            it under the terms of the GNU General Public License as published by
+#                            the Free Software Foundation, either version 3 of the License, or
+#                            (at your option) any later version.
+#
+#                            This program is distributed in the hope that it will be useful,
+#                            but WITHOUT ANY WARRANTY; without even the implied warranty of
+#                            MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#                            GNU General Public License for more details.
+#
+#                            You should have received a copy of the GNU General Public License
+#                            along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------------------------------------
+#    email                   kenji.delarosa@alten.com
+#    @file                   test_snapshot.py
+# -------------------------------------------------------------------------------------------------------------
+#    Automatic Generation    No
+#    Code Rules Reference    N/A
+# -------------------------------------------------------------------------------------------------------------
+#   @details
+#
+#   Unit tests of the wire_out snapshots: single reading, immutability and transaction epochs.
+#
+# ------------------------------------------------------------------------------------------------------------
+
+# standard library
+import time
+
+# third party library
+import pytest
+
+
+def test_snapshot_single_update_wire_outs(dcdc):
+    dev = dcdc.dev
+    nb_transactions = dev.nb_transactions
+    snapshot = dcdc.read_snapshot()
+    assert dev.nb_transactions == nb_transactions + 1
+    assert len(snapshot) == len(dcdc._addr_wire_out)
+    assert snapshot['HARDWARE_ID'] == dev.hardware_id
+    assert snapshot.get_by_addr(dcdc._addr_wire_out['FIRMWARE_ID']) == dev.firmware_id
+    assert snapshot.get('UNKNOWN', 7) == 7
+
+
+def test_snapshot_is_immutable(dcdc):
+    snapshot = dcdc.read_snapshot()
+    with pytest.raises(AttributeError):
+        snapshot.foo = 0
+    with pytest.raises(TypeError):
+        snapshot.values['ADC0'] = 0
+
+
+def test_snapshot_epoch_follows_the_writes(dcdc):
+    snapshot = dcdc.read_snapshot()
+    assert snapshot.epoch == dcdc._tx_epoch
+    dcdc.set_ctrl(0)
+    assert snapshot.epoch != dcdc._tx_epoch
+    assert dcdc.read_snapshot().epoch == dcdc._tx_epoch
+
+
+def test_fresh_snapshot_serves_the_readings(dcdc):
+    dcdc.set_snapshot_max_age(10.0)
+    dcdc.read_snapshot()
+    dev = dcdc.dev
+    nb_transactions = dev.nb_transactions
+    assert dcdc.get_hardware_id() == dev.hardware_id
+    assert dev.nb_transactions == nb_transactions
+
+
+def test_write_invalidates_the_snapshot(dcdc):
+    dcdc.set_snapshot_max_age(10.0)
+    dcdc.read_snapshot()
+    dcdc.set_ctrl(0)
+    dev = dcdc.dev
+    nb_transactions = dev.nb_transactions
+    dcdc.get_hardware_id()
+    # the snapshot is older than the last write: the value is read through the USB
+    assert dev.nb_transactions == nb_transactions + 1
+
+
+def test_snapshot_max_age(dcdc):
+    dcdc.set_snapshot_max_age(1e-3)
+    dcdc.read_snapshot()
+    time.sleep(10e-3)
+    dev = dcdc.dev
+    nb_transactions = dev.nb_transactions
+    dcdc.get_hardware_id()
+    assert dev.nb_transactions == nb_transactions + 1
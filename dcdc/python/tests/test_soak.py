@@ -0,0 +1,97 @@
+# ------------------------------------------------------------------------------------------------------------
+#                            Copyright (C) 2024-2030 Ken-ji de la ROSA, IRAP Toulouse.
+# ------------------------------------------------------------------------------------------------------------
+#                            This file is part of the ATHENA X-IFU DRE Telemetry and Telecommand Firmware.
+#
+#                            dcdc-hk-fw is free software: you can redistribute it and/or modify
+#                            it under the terms of the GNU General Public License as published by
+#                            the Free Software Foundation, either version 3 of the License, or
+#                            (at your option) any later version.
+#
+#                            This program is distributed in the hope that it will be useful,
+#                            but WITHOUT ANY WARRANTY; without even the implied warranty of
+#                            MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#                            GNU General Public License for more details.
+#
+#                            You should have received a copy of the GNU General Public License
+#                            along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------------------------------------
+#    email                   kenji.delarosa@alten.com
+#    @file                   test_soak.py
+# -------------------------------------------------------------------------------------------------------------
+#    Automatic Generation    No
+#    Code Rules Reference    N/A
+# -------------------------------------------------------------------------------------------------------------
+#   @details
+#
+#   Unit tests of the randomized soak mode of test_dcdc_check_tmtc_link.py.
+#
+# ------------------------------------------------------------------------------------------------------------
+
+# custom library
+import test_dcdc_check_tmtc_link as tmtc_link
+
+
+def _record_writes(device_p):
+    """Record the wire_in writes of a device
+
+    Returns:
+        list of tuple: (address, value) by write
+    """
+    write_list = []
+    set_wire_in = device_p.set_wire_in
+    def record(addr_p,value_p,mask_p=0xFFFF_FFFF):
+        write_list.append((addr_p, value_p))
+        set_wire_in(addr_p, value_p, mask_p)
+    device_p.set_wire_in = record
+    return write_list
+
+
+def test_soak_no_error(dcdc):
+    assert tmtc_link.test_soak(dcdc, 100, batch_size_p=32, seed_p=1) == 0
+    # the reset values are restored
+    for name in tmtc_link.c_WIRE_MASK_DICT:
+        assert dcdc.get_wire_out(dcdc._addr_wire_out[name]) == 0
+
+
+def test_soak_seed(dcdc):
+    write_list_list = []
+    for seed in [7, 7, 8]:
+        write_list_list.append(_record_writes(dcdc))
+        tmtc_link.test_soak(dcdc, 50, batch_size_p=16, seed_p=seed)
+        # restore the method of the class
+        del dcdc.set_wire_in
+
+    # same seed: same sequence
+    assert write_list_list[0] == write_list_list[1]
+    assert write_list_list[0] != write_list_list[2]
+
+
+def test_soak_values(dcdc):
+    write_list = _record_writes(dcdc)
+    nb_rounds = 200
+    tmtc_link.test_soak(dcdc, nb_rounds, batch_size_p=64, seed_p=3)
+    nb_regs = len(tmtc_link.c_WIRE_MASK_DICT)
+    # by round: one write by register, then the restored reset values
+    assert len(write_list) == (nb_rounds + 1) * nb_regs
+    for name, mask in tmtc_link.c_WIRE_MASK_DICT.items():
+        addr = dcdc._addr_wire_in[name]
+        value_list = [value for addr_write, value in write_list[:-nb_regs] if addr_write == addr]
+        assert len(value_list) == nb_rounds
+        # the control bits are never written
+        assert all((value & ~mask) == 0 for value in value_list)
+        # random values: (almost) no repetition
+        assert len(set(value_list)) > nb_rounds - 5
+
+
+def test_soak_counts_the_wrong_values(dcdc):
+    # bit 1 of the CTRL mirror is stuck at 1
+    addr_ctrl = dcdc._addr_wire_out['CTRL']
+    get_wire_outs = dcdc.get_wire_outs
+    def get_wire_outs_faulty(addr_list_p):
+        return [value | 0x2 if addr == addr_ctrl else value for addr, value in zip(addr_list_p, get_wire_outs(addr_list_p))]
+    dcdc.get_wire_outs = get_wire_outs_faulty
+
+    nb_errors = tmtc_link.test_soak(dcdc, 100, batch_size_p=32, seed_p=5)
+    # about half of the random values have bit 1 set to 0
+    assert 20 < nb_errors < 80
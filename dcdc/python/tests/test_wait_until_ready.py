@@ -0,0 +1,106 @@
+# ------------------------------------------------------------------------------------------------------------
+#                            Copyright (C) 2024-2030 Ken-ji de la ROSA, IRAP Toulouse.
+# ------------------------------------------------------------------------------------------------------------
+#                            This file is part of the ATHENA X-IFU DRE Telemetry and Telecommand Firmware.
+#
+#                            dcdc-hk-fw is free software: you can redistribute it and/or modify
+#                            it under the terms of the GNU General Public License as published by
+#                            the Free Software Foundation, either version 3 of the License, or
+#                            (at your option) any later version.
+#
+#                            This program is distributed in the hope that it will be useful,
+#                            but WITHOUT ANY WARRANTY; without even the implied warranty of
+#                            MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#                            GNU General Public License for more details.
+#
+#                            You should have received a copy of the GNU General Public License
+#                            along with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ------------------------------------------------------------------------------------------------------------
+#    email                   kenji.delarosa@alten.com
+#    @file                   test_wait_until_ready.py
+# -------------------------------------------------------------------------------------------------------------
+#    Automatic Generation    No
+#    Code Rules Reference    N/A
+# -------------------------------------------------------------------------------------------------------------
+#   @details
+#
+#   Unit tests of the POWER_ADC_STATUS polling: ready bits, adaptive back-off and timeouts.
+#
+# ------------------------------------------------------------------------------------------------------------
+
+# standard library
+import time
+
+# third party library
+import pytest
+
+# custom library
+from driver import DCDC,SimBackend
+
+
+@pytest.fixture
+def slow_dcdc(firmware_filepath):
+    """DCDC opened on a simulated board with slow power/ADC FSMs (20 ms)"""
+    board = DCDC()
+    assert board.open(firmware_filepath, backend_p=SimBackend(power_duration_p=20e-3, adc_duration_p=20e-3))
+    board.set_verbosity(-1)
+    board.message_list = []
+    board.display = lambda msg, *args: board.message_list.append(msg)
+    return board
+
+
+def test_ready_mask(dcdc):
+    assert dcdc._get_ready_mask('power_ready') == 0x01
+    assert dcdc._get_ready_mask('adc_ready') == 0x10
+    assert dcdc._get_ready_mask(['power_ready', 'adc_ready']) == 0x11
+    assert dcdc._get_ready_mask(0x11) == 0x11
+
+
+def test_ready_bits(slow_dcdc):
+    # ADC acquisition in progress: power_ready only
+    slow_dcdc.set_adc()
+    assert slow_dcdc.wait_until_ready('power_ready', 2e-3) >= 0
+    assert slow_dcdc.wait_until_ready(0x01, 2e-3) >= 0
+    assert slow_dcdc.wait_until_ready(['power_ready', 'adc_ready'], 2e-3) == -1
+    assert slow_dcdc.wait_until_ready(0x10, 2e-3) == -1
+
+
+def test_wait_until_ready(slow_dcdc):
+    dev = slow_dcdc.dev
+    slow_dcdc.set_power(1, 0, 0, 0)
+    nb_transactions = dev.nb_transactions
+    latency = slow_dcdc.wait_until_ready(['power_ready', 'adc_ready'], 1.0)
+    assert 15e-3 <= latency < 0.5
+    # adaptive back-off: a few readings instead of a busy loop
+    assert dev.nb_transactions - nb_transactions < 15
+    # already ready: a single reading
+    nb_transactions = dev.nb_transactions
+    assert slow_dcdc.wait_until_ready('power_ready') >= 0
+    assert dev.nb_transactions == nb_transactions + 1
+    assert slow_dcdc.message_list == []
+
+
+def test_wait_until_ready_timeout(slow_dcdc):
+    slow_dcdc.set_adc()
+    t0 = time.perf_counter()
+    assert slow_dcdc.wait_until_ready('adc_ready', 5e-3) == -1
+    assert 5e-3 <= time.perf_counter() - t0 < 0.1
+    assert len(slow_dcdc.message_list) == 1
+    assert slow_dcdc.message_list[0].startswith('[KO]: [dcdc.wait_until_ready]: timeout')
+
+
+def test_set_power_wait(slow_dcdc):
+    latency = slow_dcdc.set_power_wait(1, 1, 0, 0)
+    assert 15e-3 <= latency < 0.5
+    assert slow_dcdc.get_power_conf() == 0x3
+    assert slow_dcdc.set_adc_wait() >= 15e-3
+
+
+def test_set_power_wait_busy_fsm(slow_dcdc):
+    slow_dcdc.set_power(1, 0, 0, 0)
+    # the FSM doesn't accept a new configuration before the end of the previous one
+    assert slow_dcdc.set_power_wait(0, 0, 1, 1, timeout_p=2e-3) == -1
+    assert slow_dcdc.get_power_conf() == 0x1
+    assert slow_dcdc.dev.errors[0] == 0
+    slow_dcdc.set_adc()
+    assert slow_dcdc.set_adc_wait(timeout_p=2e-3) == -1